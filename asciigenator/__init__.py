@@ -3,6 +3,48 @@ ASCII Art Generator Library
 A Python library for generating ASCII art from text.
 """
 
-from .core import generate, list_fonts, list_colors
+from .core import (
+    generate,
+    generate_many,
+    iter_generate,
+    iter_lines,
+    render_to,
+    export,
+    iter_export,
+    list_fonts,
+    list_colors,
+    load_font_dir,
+    register_font,
+    unregister_font,
+    register_color,
+    validate_font,
+    list_borders,
+    configure_cache,
+    cache_info,
+    cache_clear,
+    configure_segment_cache,
+    segment_cache_info,
+)
 
-__all__ = ["generate", "list_fonts", "list_colors"]
+__all__ = [
+    "generate",
+    "generate_many",
+    "iter_generate",
+    "iter_lines",
+    "render_to",
+    "export",
+    "iter_export",
+    "list_fonts",
+    "list_colors",
+    "load_font_dir",
+    "register_font",
+    "unregister_font",
+    "register_color",
+    "validate_font",
+    "list_borders",
+    "configure_cache",
+    "cache_info",
+    "cache_clear",
+    "configure_segment_cache",
+    "segment_cache_info",
+]
@@ -0,0 +1,312 @@
+"""
+Asyncio interface for rendering ASCII art without blocking the event loop.
+
+Small texts are rendered inline, since handing them to another thread costs more than rendering them. Texts longer
+than a size threshold are offloaded to a shared thread pool. Offloaded renders run on the same ``ASCIIGenerator``
+instance as inline ones, so they share its loaded fonts and render cache.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+
+from .core import _BAND_SPACING, ASCIIGenerator, _get_generator
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from typing import Iterable, List, Optional
+
+DEFAULT_THRESHOLD = 4096
+
+
+class AsyncASCIIGenerator:
+    """
+    Async front end to an ``ASCIIGenerator``.
+
+    Attributes:
+        generator (ASCIIGenerator): Generator doing the rendering.
+        threshold (int): Inputs with more characters than this are rendered in the executor.
+        max_concurrency (Optional[int]): Maximum number of offloaded renders running at once per event loop, or None
+            for no limit.
+    """
+
+    def __init__(
+        self,
+        generator: Optional[ASCIIGenerator] = None,
+        threshold: int = DEFAULT_THRESHOLD,
+        max_concurrency: Optional[int] = 4,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Args:
+            generator (ASCIIGenerator, optional): Generator to render with. Defaults to None (the global instance
+                used by ``asciigenator.generate``).
+            threshold (int, optional): Number of input characters above which rendering is offloaded. Defaults to
+                4096.
+            max_concurrency (int, optional): Maximum number of offloaded renders running at once. Defaults to 4.
+            executor (concurrent.futures.Executor, optional): Executor to offload to. It should run jobs in threads
+                of this process, so they share the generator. Defaults to None (a thread pool created on first use).
+
+        Raises:
+            ValueError: If threshold is negative or max_concurrency is not positive.
+        """
+        if threshold < 0:
+            raise ValueError(f"Threshold must be non-negative, got {threshold}.")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(f"Concurrency limit must be positive, got {max_concurrency}.")
+        self.generator = generator if generator is not None else _get_generator()
+        self.threshold = threshold
+        self.max_concurrency = max_concurrency
+        self._executor = executor
+        self._own_executor = executor is None
+        # asyncio primitives belong to one event loop, so each loop gets its own semaphore.
+        self._semaphores = {}
+
+    def _get_executor(self) -> Executor:
+        """Return the executor, creating the shared thread pool on first use."""
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._executor = ThreadPoolExecutor(thread_name_prefix="asciigenator")
+        return self._executor
+
+    def _get_semaphore(self, loop: asyncio.AbstractEventLoop) -> Optional[asyncio.Semaphore]:
+        """Return the concurrency limiter of ``loop``, or None if offloaded renders are not limited."""
+        if self.max_concurrency is None:
+            return None
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            for other in [other for other in self._semaphores if other.is_closed()]:
+                del self._semaphores[other]
+            semaphore = self._semaphores.setdefault(loop, asyncio.Semaphore(self.max_concurrency))
+        return semaphore
+
+    async def _offload(self, job):
+        """
+        Run ``job`` in the executor, waiting for a concurrency slot first.
+
+        Cancelling the caller cancels the job if it has not started yet. A job already running finishes in the
+        background and its result is discarded.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._get_semaphore(loop)
+        if semaphore is None:
+            return await loop.run_in_executor(self._get_executor(), job)
+        async with semaphore:
+            return await loop.run_in_executor(self._get_executor(), job)
+
+    async def generate(
+        self,
+        text: str,
+        font: str = "simple",
+        color: str = None,
+        border: str = None,
+        width: Optional[int] = None,
+        align: str = "left",
+        backend: Optional[str] = None,
+        layout: str = "full",
+        line_spacing: int = _BAND_SPACING,
+    ) -> str:
+        """
+        Generate ASCII art, offloading long texts to the executor.
+
+        Args:
+            text (str): Input string.
+            font (str, optional): Font name. Defaults to "simple".
+            color (str, optional): Output color (see list_colors()). Defaults to None.
+            border (str | BorderStyle, optional): Border character or style name (see list_borders()). Defaults
+                to None.
+            width (int, optional): Maximum output width in columns; longer text is wrapped. Defaults to None.
+            align (str, optional): Alignment of wrapped bands ("left", "center" or "right"). Defaults to "left".
+            backend (str, optional): Rendering backend (see ``ASCIIGenerator.generate()``). Defaults to None.
+            layout (str, optional): Glyph layout (see ``ASCIIGenerator.generate()``). Defaults to "full".
+            line_spacing (int, optional): Blank rows between glyph bands (see ``ASCIIGenerator.generate()``). Defaults to 1.
+
+        Returns:
+            str: Generated ASCII art string.
+
+        Raises:
+            ValueError: If the specified font, color, alignment, backend or layout is not available, width is not
+                positive or line_spacing is negative.
+        """
+        args = (text, font, color, border, width, align, backend, layout, line_spacing)
+        if len(text) <= self.threshold:
+            return self.generator.generate(*args)
+        self.generator._check_style(font, color, width, align, backend, layout, line_spacing)
+        return await self._offload(partial(self.generator.generate, *args))
+
+    async def generate_many(
+        self,
+        texts: Iterable[str],
+        font: str = "simple",
+        color: str = None,
+        border: str = None,
+        *,
+        chunksize: int = 256,
+        width: Optional[int] = None,
+        align: str = "left",
+        backend: Optional[str] = None,
+        layout: str = "full",
+        line_spacing: int = _BAND_SPACING,
+    ) -> List[str]:
+        """
+        Generate ASCII art for many texts, offloading large batches to the executor in chunks.
+
+        A batch whose combined length is within the threshold is rendered inline. Larger batches are split into
+        chunks that render concurrently, up to the concurrency limit. Cancelling the call cancels every chunk that
+        has not started yet.
+
+        Args:
+            texts (Iterable[str]): Input strings to convert.
+            font (str, optional): Font name. Defaults to "simple".
+            color (str, optional): Output color (see list_colors()). Defaults to None.
+            border (str | BorderStyle, optional): Border character or style name (see list_borders()). Defaults
+                to None.
+            chunksize (int, optional): Number of texts rendered per executor job. Defaults to 256.
+            width (int, optional): Maximum output width in columns; longer text is wrapped. Defaults to None.
+            align (str, optional): Alignment of wrapped bands ("left", "center" or "right"). Defaults to "left".
+            backend (str, optional): Rendering backend (see ``ASCIIGenerator.generate()``). Defaults to None.
+            layout (str, optional): Glyph layout (see ``ASCIIGenerator.generate()``). Defaults to "full".
+            line_spacing (int, optional): Blank rows between glyph bands (see ``ASCIIGenerator.generate()``). Defaults to 1.
+
+        Returns:
+            List[str]: Generated ASCII art strings, in input order.
+
+        Raises:
+            ValueError: If the specified font, color, alignment, backend or layout is not available, width is not
+                positive or line_spacing is negative.
+        """
+        texts = list(texts)
+        self.generator._check_style(font, color, width, align, backend, layout, line_spacing)
+        options = dict(
+            font=font,
+            color=color,
+            border=border,
+            width=width,
+            align=align,
+            backend=backend,
+            layout=layout,
+            line_spacing=line_spacing,
+        )
+        if sum(map(len, texts)) <= self.threshold:
+            return self.generator.generate_many(texts, **options)
+        render = partial(self.generator.generate_many, **options)
+        chunks = [texts[i : i + chunksize] for i in range(0, len(texts), max(chunksize, 1))]
+        results = await asyncio.gather(*(self._offload(partial(render, chunk)) for chunk in chunks))
+        return [art for chunk in results for art in chunk]
+
+    def close(self) -> None:
+        """Shut down the thread pool created by this instance. An executor passed in is left running."""
+        if self._own_executor and self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+def _get_default() -> AsyncASCIIGenerator:
+    """Return the shared AsyncASCIIGenerator, creating it on first use."""
+    default = globals().get("_default")
+    if default is None:
+        default = globals().setdefault("_default", AsyncASCIIGenerator())
+    return default
+
+
+def configure(
+    threshold: int = DEFAULT_THRESHOLD, max_concurrency: Optional[int] = 4, executor: Optional[Executor] = None
+) -> None:
+    """
+    Change the offloading settings of the module-level ``generate`` and ``generate_many``.
+
+    Rendering still uses the global ``ASCIIGenerator`` instance.
+
+    Args:
+        threshold (int, optional): Number of input characters above which rendering is offloaded. Defaults to 4096.
+        max_concurrency (int, optional): Maximum number of offloaded renders running at once. Defaults to 4.
+        executor (concurrent.futures.Executor, optional): Executor to offload to. Defaults to None (a shared thread
+            pool).
+
+    Raises:
+        ValueError: If threshold is negative or max_concurrency is not positive.
+    """
+    new = AsyncASCIIGenerator(None, threshold, max_concurrency, executor)
+    old = globals().get("_default")
+    globals()["_default"] = new
+    if old is not None:
+        old.close()
+
+
+async def generate(
+    text: str,
+    font: str = "simple",
+    color: str = None,
+    border: str = None,
+    width: Optional[int] = None,
+    align: str = "left",
+    backend: Optional[str] = None,
+    layout: str = "full",
+    line_spacing: int = _BAND_SPACING,
+) -> str:
+    """
+    Generate ASCII art using the global ASCIIGenerator instance without blocking the event loop.
+
+    Args:
+        text (str): Input string.
+        font (str, optional): Font name. Defaults to "simple".
+        color (str, optional): Output color (see list_colors()). Defaults to None.
+        border (str | BorderStyle, optional): Border character or style name (see list_borders()). Defaults to None.
+        width (int, optional): Maximum output width in columns; longer text is wrapped. Defaults to None.
+        align (str, optional): Alignment of wrapped bands ("left", "center" or "right"). Defaults to "left".
+        backend (str, optional): Rendering backend (see ``ASCIIGenerator.generate()``). Defaults to None.
+        layout (str, optional): Glyph layout (see ``ASCIIGenerator.generate()``). Defaults to "full".
+        line_spacing (int, optional): Blank rows between glyph bands (see ``ASCIIGenerator.generate()``). Defaults to 1.
+
+    Returns:
+        str: Generated ASCII art string.
+    """
+    return await _get_default().generate(text, font, color, border, width, align, backend, layout, line_spacing)
+
+
+async def generate_many(
+    texts: Iterable[str],
+    font: str = "simple",
+    color: str = None,
+    border: str = None,
+    *,
+    chunksize: int = 256,
+    width: Optional[int] = None,
+    align: str = "left",
+    backend: Optional[str] = None,
+    layout: str = "full",
+    line_spacing: int = _BAND_SPACING,
+) -> List[str]:
+    """
+    Generate ASCII art for many texts using the global ASCIIGenerator instance without blocking the event loop.
+
+    Args:
+        texts (Iterable[str]): Input strings to convert.
+        font (str, optional): Font name. Defaults to "simple".
+        color (str, optional): Output color (see list_colors()). Defaults to None.
+        border (str | BorderStyle, optional): Border character or style name (see list_borders()). Defaults to None.
+        chunksize (int, optional): Number of texts rendered per executor job. Defaults to 256.
+        width (int, optional): Maximum output width in columns; longer text is wrapped. Defaults to None.
+        align (str, optional): Alignment of wrapped bands ("left", "center" or "right"). Defaults to "left".
+        backend (str, optional): Rendering backend (see ``ASCIIGenerator.generate()``). Defaults to None.
+        layout (str, optional): Glyph layout (see ``ASCIIGenerator.generate()``). Defaults to "full".
+        line_spacing (int, optional): Blank rows between glyph bands (see ``ASCIIGenerator.generate()``). Defaults to 1.
+
+    Returns:
+        List[str]: Generated ASCII art strings, in input order.
+    """
+    return await _get_default().generate_many(
+        texts,
+        font,
+        color,
+        border,
+        chunksize=chunksize,
+        width=width,
+        align=align,
+        backend=backend,
+        layout=layout,
+        line_spacing=line_spacing,
+    )
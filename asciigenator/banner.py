@@ -0,0 +1,321 @@
+"""
+Live-updating banners for terminal dashboards: clocks, counters and tickers that are redrawn many times per second.
+"""
+
+from __future__ import annotations
+
+from .core import _BAND_SPACING, ASCIIGenerator, _border_lines, _get_generator, _resolve_border
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import List, Optional, Tuple
+
+    from .core import _RowTable
+
+# Unchanged cells between two changed runs are rewritten instead of skipped when the gap is at most this wide,
+# since a cursor movement sequence costs about as many bytes.
+_MERGE_GAP = 4
+
+
+def _common_prefix(a: str, b: str) -> int:
+    """Length of the common prefix of two strings, found by bisection on slice comparisons."""
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix(a: str, b: str, limit: int) -> int:
+    """Length of the common suffix of two strings, at most ``limit``."""
+    lo, hi = 0, min(len(a), len(b), limit)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid :] == b[len(b) - mid :]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _band_pieces(
+    rows: List[_RowTable], text: str, old_text: Optional[str] = None, old_pieces: Optional[List[List[str]]] = None
+) -> List[List[str]]:
+    """
+    Glyph row pieces of one band, reusing those of the characters shared with the previous text of the band.
+
+    Args:
+        rows (List[_RowTable]): Row tables of the compiled font.
+        text (str): Text of the band.
+        old_text (str, optional): Previous text of the band, or None if the band is new.
+        old_pieces (List[List[str]], optional): Glyph row pieces of ``old_text``.
+
+    Returns:
+        List[List[str]]: pieces[row][i] is row ``row`` of the glyphs of text[i], with their letter spacing.
+    """
+    if old_pieces is None:
+        codes = list(map(ord, text))
+        return [[row[code] for code in codes] for row in rows]
+    if old_text == text:
+        return old_pieces
+    head = _common_prefix(old_text, text)
+    tail = _common_suffix(old_text, text, min(len(old_text), len(text)) - head)
+    codes = list(map(ord, text[head : len(text) - tail]))
+    return [
+        row_pieces[:head] + [row[code] for code in codes] + row_pieces[len(row_pieces) - tail :]
+        for row_pieces, row in zip(old_pieces, rows)
+    ]
+
+
+class _Frame:
+    """
+    A rendered frame.
+
+    Keeps the glyph row pieces of every character, band by band, so the next frame only looks up the characters
+    that changed, and the output lines without color codes together with the span of cells drawn in color, for
+    diffing.
+    """
+
+    __slots__ = ("text", "pieces", "plain", "start", "end", "_lines")
+
+    def __init__(self, text: str, pieces: List[List[List[str]]], plain: List[str], start: tuple, end: tuple):
+        self.text = text
+        self.pieces = pieces  # pieces[band]: the glyph row pieces of one line of the text (see _band_pieces)
+        self.plain = plain
+        # Color is switched on at cell ``start`` and reset at cell ``end``, both (row, column).
+        self.start = start
+        self.end = end
+        self._lines = None
+
+    def colored(self, row: int) -> Tuple[int, float]:
+        """Columns ``[a, b)`` of ``row`` that are drawn in color."""
+        if not self.start < self.end or not self.start[0] <= row <= self.end[0]:
+            return 0, 0
+        a = self.start[1] if row == self.start[0] else 0
+        b = self.end[1] if row == self.end[0] else float("inf")
+        return a, b
+
+
+class BannerRenderer:
+    """
+    Stateful renderer for a banner whose text changes over time.
+
+    Each ``update()`` looks up glyphs only for the characters that changed since the previous text and returns the
+    ANSI escape sequences that repaint just the changed cells, with the cursor at the banner's top-left corner
+    before and after. The banner is assumed to start at the beginning of a line. ``render()`` returns full frames
+    instead, identical to ``ASCIIGenerator.generate``. Like there, every ``"\n"`` in the text starts a new glyph
+    band, and the bands are diffed one by one.
+
+    Attributes:
+        generator (ASCIIGenerator): Generator providing fonts and colors.
+        font (str): Font name.
+        color (Optional[str]): Color name, or None.
+        border (Optional[str]): Border character or style name, or None.
+    """
+
+    def __init__(
+        self,
+        font: str = "simple",
+        color: Optional[str] = None,
+        border: Optional[str] = None,
+        generator: Optional[ASCIIGenerator] = None,
+    ):
+        """
+        Args:
+            font (str, optional): Font to use. Defaults to "simple".
+            color (str, optional): Solid color specification (see ``asciigenator.colors``). Defaults to None
+                (no color).
+            border (str | BorderStyle, optional): Border character or style name (see list_borders()). Defaults
+                to None (no border).
+            generator (ASCIIGenerator, optional): Generator to render with. Defaults to None (the global instance).
+
+        Raises:
+            ValueError: If the specified font or color is not available, or the color is a gradient.
+        """
+        self.generator = generator if generator is not None else _get_generator()
+        self.generator._check_style(font, color)
+        self.font = font
+        self.color = color
+        self.border = border
+        self._compiled = self.generator._compile_font(font)
+        self._prefix, self._suffix, gradient = self.generator._color_codes(color)
+        if gradient is not None:
+            raise ValueError(f"Color '{color}' is a gradient, which live banners do not support.")
+        self._style = _resolve_border(border)
+        self._frame = None  # last frame rendered
+        self._painted = None  # last frame painted by update(), None if the terminal holds no frame
+
+    @property
+    def text(self) -> str:
+        """str: Text of the last rendered frame."""
+        return self._frame.text if self._frame is not None else ""
+
+    @property
+    def frame(self) -> str:
+        """str: The last rendered frame, as ``generate`` would return it."""
+        return "\n".join(self._lines(self._frame)) if self._frame is not None else ""
+
+    def _lines(self, frame: _Frame) -> List[str]:
+        """Output lines of a frame with color codes, built on first use since diffs do not need them."""
+        if frame._lines is None:
+            rows = frame.plain
+            if self._prefix:
+                rows = list(rows)
+                (r0, c0), (r1, c1) = frame.start, frame.end
+                rows[r1] = rows[r1][:c1] + self._suffix + rows[r1][c1:]
+                rows[r0] = rows[r0][:c0] + self._prefix + rows[r0][c0:]
+            frame._lines = rows
+        return frame._lines
+
+    def _render_frame(self, text: str) -> _Frame:
+        """Render ``text``, looking up glyphs only for the characters that differ from the previous frame."""
+        previous = self._frame
+        if previous is not None and previous.text == text:
+            frame = _Frame(text, previous.pieces, previous.plain, previous.start, previous.end)
+            frame._lines = previous._lines
+            return frame
+        rows = self._compiled.rows
+        old_lines = previous.text.split("\n") if previous is not None else []
+        pieces = []
+        glyph_lines = []
+        for n, line in enumerate(text.split("\n")):
+            if n < len(old_lines):
+                band = _band_pieces(rows, line, old_lines[n], previous.pieces[n])
+            else:
+                band = _band_pieces(rows, line)
+            pieces.append(band)
+            if n:
+                glyph_lines.extend([""] * _BAND_SPACING)
+            glyph_lines.extend("".join(row_pieces).rstrip() for row_pieces in band)
+        glyph_lines = glyph_lines or [""]
+        widths = [len(line) for line in glyph_lines]
+        style = self._style
+        # Mirrors _decorate: empty art only gets a border when it is colored.
+        if style and (any(widths) or (self._prefix + self._suffix).strip()):
+            plain = list(_border_lines(glyph_lines, widths, style))
+            first, offset = 2, len(style.left) + 1  # below the top edge and one padding row
+        else:
+            plain, first, offset = glyph_lines, 0, 0
+        end = (first + len(glyph_lines) - 1, offset + widths[-1])
+        start = (first, offset) if self._prefix else end
+        return _Frame(text, pieces, plain, start, end)
+
+    def render(self, text: str) -> str:
+        """
+        Render a new text and return the full frame.
+
+        Args:
+            text (str): Banner text.
+
+        Returns:
+            str: The frame, identical to ``generate(text, font, color, border)``.
+        """
+        self._frame = self._render_frame(text)
+        return self.frame
+
+    def update(self, text: str) -> str:
+        """
+        Render a new text and return the escape sequences that turn the painted banner into the new frame.
+
+        The first update, and any update that changes the banner's height, repaints every line. Later updates
+        rewrite only the cells that changed. The cursor must be at the banner's top-left corner and is returned
+        there.
+
+        Args:
+            text (str): Banner text.
+
+        Returns:
+            str: Text to write to the terminal.
+        """
+        new = self._frame = self._render_frame(text)
+        old, self._painted = self._painted, new
+        if old is None or len(old.plain) != len(new.plain):
+            return self._repaint(old, new)
+        out = []
+        cursor = [0, 0]
+        for row, (old_line, new_line) in enumerate(zip(old.plain, new.plain)):
+            old_span, new_span = old.colored(row), new.colored(row)
+            if old_line == new_line and old_span == new_span:
+                continue
+            self._paint_row(out, cursor, row, old_line, new_line, old_span, new_span)
+        if cursor[0]:
+            out.append(f"\033[{cursor[0]}A")
+        if cursor[1]:
+            out.append("\r")
+        return "".join(out)
+
+    def _paint_row(
+        self,
+        out: List[str],
+        cursor: List[int],
+        row: int,
+        old_line: str,
+        new_line: str,
+        old_span: Tuple[int, float],
+        new_span: Tuple[int, float],
+    ) -> None:
+        """Append the sequences that repaint the changed cells of one row, tracking the cursor position."""
+        # Cells past the end of a line were never painted, so they are not colored either.
+        old_span = (old_span[0], min(old_span[1], len(old_line)))
+        new_span = (new_span[0], min(new_span[1], len(new_line)))
+        width = max(len(old_line), len(new_line))
+        old_line, new_line = old_line.ljust(width), new_line.ljust(width)
+        if old_span == new_span:
+            lo = _common_prefix(old_line, new_line)
+            hi = width - _common_suffix(old_line, new_line, width - lo)
+        else:
+            # Cells whose color changed must be repainted even if their character did not.
+            lo, hi = 0, width
+        changed = [
+            col
+            for col in range(lo, hi)
+            if old_line[col] != new_line[col] or (old_span[0] <= col < old_span[1]) != (new_span[0] <= col < new_span[1])
+        ]
+        runs = []
+        for col in changed:
+            if runs and col - runs[-1][1] <= _MERGE_GAP:
+                runs[-1][1] = col + 1
+            else:
+                runs.append([col, col + 1])
+        for a, b in runs:
+            if row != cursor[0]:
+                out.append(f"\033[{row - cursor[0]}B" if row > cursor[0] else f"\033[{cursor[0] - row}A")
+            if a < cursor[1]:
+                out.append("\r")
+                cursor[1] = 0
+            if a > cursor[1]:
+                out.append(f"\033[{a - cursor[1]}C")
+            cuts = sorted({a, b, *(x for x in new_span if a < x < b)})
+            for start, end in zip(cuts, cuts[1:]):
+                cells = new_line[start:end]
+                out.append(self._prefix + cells + self._suffix if new_span[0] <= start < new_span[1] else cells)
+            cursor[0], cursor[1] = row, b
+
+    def _repaint(self, old: Optional[_Frame], new: _Frame) -> str:
+        """Paint every line of ``new`` and clear the lines ``old`` had beyond it."""
+        out = []
+        for row, line in enumerate(self._lines(new)):
+            if row:
+                out.append("\n")
+            out.append("\r" + line + "\033[K")
+        extra = len(old.plain) - len(new.plain) if old is not None else 0
+        for _ in range(extra):
+            out.append("\n\r\033[K")
+        up = len(new.plain) - 1 + max(extra, 0)
+        if up:
+            out.append(f"\033[{up}A")
+        out.append("\r")
+        return "".join(out)
+
+    def finish(self) -> str:
+        """
+        Move the cursor below the banner and forget what was painted, so the next ``update()`` repaints in full.
+
+        Returns:
+            str: Text to write to the terminal.
+        """
+        painted, self._painted = self._painted, None
+        return "\r" + "\n" * len(painted.plain) if painted is not None else ""
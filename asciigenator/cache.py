@@ -0,0 +1,239 @@
+"""
+Thread-safe, size-bounded LRU cache used to memoize rendered ASCII art.
+"""
+
+from collections import OrderedDict, namedtuple
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+import sys
+import threading
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize", "maxbytes", "currbytes"])
+CacheInfo.__doc__ = """
+Cache statistics, modelled on ``functools.lru_cache().cache_info()``.
+
+Attributes:
+    hits (int): Number of lookups answered from the cache.
+    misses (int): Number of lookups that were not cached.
+    maxsize (Optional[int]): Maximum number of entries, or None if unbounded.
+    currsize (int): Current number of entries.
+    maxbytes (Optional[int]): Maximum total size of the cached values in bytes, or None if unbounded.
+    currbytes (int): Current total size of the cached values in bytes.
+"""
+
+
+class LRUCache:
+    """
+    Least-recently-used cache bounded by entry count and/or total value size.
+
+    All operations take an internal lock, so one instance can be shared between threads.
+
+    Attributes:
+        maxsize (Optional[int]): Maximum number of entries, or None for no entry limit.
+        maxbytes (Optional[int]): Maximum total size of the cached values in bytes, or None for no size limit.
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = None,
+        maxbytes: Optional[int] = None,
+        sizeof: Callable[[Any], int] = sys.getsizeof,
+    ):
+        """
+        Args:
+            maxsize (int, optional): Maximum number of entries. Defaults to None (no entry limit).
+            maxbytes (int, optional): Maximum total size of cached values in bytes. Defaults to None (no size limit).
+            sizeof (Callable[[Any], int], optional): Function measuring a value's size in bytes.
+                Defaults to ``sys.getsizeof``.
+
+        Raises:
+            ValueError: If a limit is negative.
+        """
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(f"Cache size must not be negative, got {maxsize}.")
+        if maxbytes is not None and maxbytes < 0:
+            raise ValueError(f"Cache byte limit must not be negative, got {maxbytes}.")
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self._sizeof = sizeof
+        self._data = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Look up a key and mark it as most recently used.
+
+        Args:
+            key (Hashable): Cache key.
+            default (Any, optional): Value returned when the key is not cached. Defaults to None.
+
+        Returns:
+            Any: The cached value, or ``default``.
+        """
+        with self._lock:
+            try:
+                value = self._data[key][0]
+            except KeyError:
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting least recently used entries until the cache is within its limits.
+
+        Values larger than ``maxbytes`` on their own are not stored.
+
+        Args:
+            key (Hashable): Cache key.
+            value (Any): Value to cache.
+        """
+        size = self._sizeof(value)
+        if self.maxbytes is not None and size > self.maxbytes:
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._data[key] = (value, size)
+            self._bytes += size
+            while (self.maxsize is not None and len(self._data) > self.maxsize) or (
+                self.maxbytes is not None and self._bytes > self.maxbytes
+            ):
+                self._bytes -= self._data.popitem(last=False)[1][1]
+
+    def discard(self, predicate: Callable[[Hashable], bool]) -> None:
+        """
+        Remove every entry whose key matches ``predicate``.
+
+        Args:
+            predicate (Callable[[Hashable], bool]): Returns True for keys that should be dropped.
+        """
+        with self._lock:
+            for key in [key for key in self._data if predicate(key)]:
+                self._bytes -= self._data.pop(key)[1]
+
+    def info(self) -> CacheInfo:
+        """
+        Report cache statistics.
+
+        Returns:
+            CacheInfo: Hit/miss counters together with the current and maximum sizes.
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._data), self.maxbytes, self._bytes)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class ClockCache:
+    """
+    Entry-bounded cache whose lookups are plain dictionary reads, for hot paths where the lock and reordering of
+    ``LRUCache`` would cost about as much as the work being cached.
+
+    Eviction follows the CLOCK approximation of LRU: lookups only mark an entry as referenced, and a full cache
+    evicts the oldest entry that was not looked up since it was last passed over. Stores take a lock, so one
+    instance can be shared between threads; the hit and miss counters may then be approximate.
+
+    Attributes:
+        maxsize (int): Maximum number of entries.
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        Args:
+            maxsize (int): Maximum number of entries.
+
+        Raises:
+            ValueError: If ``maxsize`` is not positive.
+        """
+        if maxsize < 1:
+            raise ValueError(f"Cache size must be positive, got {maxsize}.")
+        self.maxsize = maxsize
+        self._data = {}
+        self._referenced = set()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Look up a key and mark it as referenced.
+
+        Args:
+            key (Hashable): Cache key.
+            default (Any, optional): Value returned when the key is not cached. Defaults to None.
+
+        Returns:
+            Any: The cached value, or ``default``.
+        """
+        value = self._data.get(key, default)
+        if value is default:
+            self._misses += 1
+        else:
+            self._hits += 1
+            self._referenced.add(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting entries until the cache is within its limit.
+
+        Args:
+            key (Hashable): Cache key.
+            value (Any): Value to cache.
+        """
+        with self._lock:
+            data, referenced = self._data, self._referenced
+            while len(data) >= self.maxsize and key not in data:
+                oldest = next(iter(data))
+                if oldest in referenced:
+                    # Second chance: move it to the back of the queue.
+                    referenced.discard(oldest)
+                    data[oldest] = data.pop(oldest)
+                else:
+                    del data[oldest]
+            data[key] = value
+
+    def info(self) -> CacheInfo:
+        """
+        Report cache statistics.
+
+        Returns:
+            CacheInfo: Hit/miss counters together with the current and maximum number of entries.
+        """
+        return CacheInfo(self._hits, self._misses, self.maxsize, len(self._data), None, 0)
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """
+        Get the cached entries, without marking them as referenced.
+
+        Returns:
+            List[Tuple[Hashable, Any]]: Key and value of every entry, oldest first.
+        """
+        with self._lock:
+            return list(self._data.items())
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self._referenced.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,41 +1,397 @@
 import argparse
+import os
 import sys
-from .core import generate, list_fonts, list_colors
 
 
-def main():
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the ``asciigen`` argument parser."""
     parser = argparse.ArgumentParser(description="Generate ASCII art from text", prog="asciigen")
     parser.add_argument("text", nargs="?", help="Text to convert to ASCII art")
     parser.add_argument("-f", "--font", default="simple", help="Font to use (default: simple)")
-    parser.add_argument("-c", "--color", help="Color to use for text")
-    parser.add_argument("-b", "--border", help="Character to use for border around the text")
+    parser.add_argument(
+        "-c",
+        "--color",
+        help="Color name, #rrggbb, 256-color index, gradient such as red:blue@vertical or rainbow@glyph, "
+        "optionally followed by 'on BACKGROUND'",
+    )
+    parser.add_argument(
+        "--color-mode",
+        default="always",
+        choices=["always", "auto", "never"],
+        help="When to apply --color: auto only colors terminals and honors NO_COLOR (default: always)",
+    )
+    parser.add_argument("-b", "--border", help="Character or style name (see --list-borders) to use for border around the text")
+    parser.add_argument("-w", "--width", type=int, help="Wrap the art to at most this many columns")
+    parser.add_argument(
+        "-a", "--align", default="left", choices=["left", "center", "right"], help="Alignment of lines and wrapped bands"
+    )
+    parser.add_argument(
+        "--layout",
+        default="full",
+        choices=["full", "kerning", "smush"],
+        help="Glyph layout: full width, kerning (glyphs touch) or smush (touching edges merge) (default: full)",
+    )
+    parser.add_argument(
+        "--line-spacing",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Blank rows between the lines of the text and between wrapped bands (default: 1)",
+    )
+    parser.add_argument(
+        "--format",
+        default="ansi",
+        choices=["ansi", "text", "html", "svg"],
+        help="Output format; text leaves out color codes (default: ansi)",
+    )
+    parser.add_argument(
+        "--font-dir",
+        action="append",
+        default=[],
+        metavar="DIR",
+        help="Directory of .flf/.json/.toml fonts to make available (repeatable)",
+    )
+    parser.add_argument(
+        "--profile", action="store_true", help="Render in this process and print the time spent in each stage to stderr"
+    )
     parser.add_argument("--list-fonts", action="store_true", help="List available fonts")
     parser.add_argument("--list-colors", action="store_true", help="List available colors")
+    parser.add_argument("--list-borders", action="store_true", help="List named border styles")
+
+    batch = parser.add_argument_group("batch mode")
+    source = batch.add_mutually_exclusive_group()
+    source.add_argument("--stdin", action="store_true", help="Render one banner per line read from standard input")
+    source.add_argument("--input", metavar="FILE", help="Render one banner per line of FILE ('-' for standard input)")
+    batch.add_argument("-o", "--output", metavar="FILE", help="Write the banners to FILE instead of standard output")
+    batch.add_argument(
+        "--separator",
+        default="\\n",
+        metavar="SEP",
+        help="Written between banners; understands \\n and \\t escapes (default: \\n, a blank line)",
+    )
+    batch.add_argument("-j", "--jobs", type=int, default=1, metavar="N", help="Render with N worker processes (default: 1)")
+
+    server = parser.add_argument_group("server mode")
+    server.add_argument("--serve", action="store_true", help="Run a rendering server that --server calls forward to")
+    server.add_argument("--socket", metavar="PATH", help="Server socket (default: $ASCIIGENATOR_SOCKET or per user)")
+    server.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=600.0,
+        metavar="SECONDS",
+        help="Stop the server after this long without requests, 0 to never stop (default: 600)",
+    )
+    server.add_argument(
+        "--server",
+        action="store_true",
+        help="Forward to a running server, rendering in this process if there is none (default: $ASCIIGENATOR_SERVER)",
+    )
+    server.add_argument("--server-stats", action="store_true", help="Print request and latency stats of the server")
+    server.add_argument("--stop-server", action="store_true", help="Stop the running server")
+    return parser
+
+
+# Options that describe what to render, as opposed to how to reach the server. These are what gets forwarded.
+_RENDER_OPTIONS = (
+    "text",
+    "font",
+    "color",
+    "border",
+    "width",
+    "align",
+    "layout",
+    "line_spacing",
+    "format",
+    "font_dir",
+    "list_fonts",
+    "list_colors",
+    "list_borders",
+)
 
-    args = parser.parse_args()
+
+def _execute(args: argparse.Namespace, stdout, stderr, cached: bool = False, generator=None) -> int:
+    """
+    Carry out a parsed command line, writing to the given streams.
+
+    Args:
+        args (argparse.Namespace): Parsed render options (see ``_RENDER_OPTIONS``).
+        stdout: Text stream for output.
+        stderr: Text stream for error messages.
+        cached (bool, optional): Render the whole art at once through the render cache instead of streaming it
+            line by line. Defaults to False.
+        generator (ASCIIGenerator, optional): Generator to render with. Defaults to None (the global one, which
+            also loads ``args.font_dir``; a given generator is expected to have its font directories loaded).
+
+    Returns:
+        int: Exit status.
+    """
+    from . import core
+
+    api = generator
+    if api is None:
+        api = core
+        try:
+            for directory in args.font_dir:
+                core.load_font_dir(directory)
+        except OSError as e:
+            print(f"Error: {e}", file=stderr)
+            return 1
 
     if args.list_fonts:
-        print("Available fonts:")
-        for font in list_fonts():
-            print(f"  {font}")
-        return
+        print("Available fonts:", file=stdout)
+        for font in api.list_fonts():
+            print(f"  {font}", file=stdout)
+        return 0
 
     if args.list_colors:
-        print("Available colors:")
-        for color in list_colors():
-            print(f"  {color}")
+        print("Available colors:", file=stdout)
+        for color in api.list_colors():
+            print(f"  {color}", file=stdout)
+        return 0
+
+    if args.list_borders:
+        print("Available borders:", file=stdout)
+        for border in api.list_borders():
+            print(f"  {border}", file=stdout)
+        return 0
+
+    options = (args.text, args.format, args.font, args.color, args.border, args.width, args.align)
+    try:
+        if args.format != "ansi" and cached:
+            stdout.write(api.export(*options, layout=args.layout, line_spacing=args.line_spacing) + "\n")
+        elif args.format != "ansi":
+            for chunk in api.iter_export(*options, layout=args.layout, line_spacing=args.line_spacing):
+                stdout.write(chunk)
+            stdout.write("\n")
+        elif cached:
+            art = api.generate(
+                args.text,
+                args.font,
+                args.color,
+                args.border,
+                args.width,
+                args.align,
+                layout=args.layout,
+                line_spacing=args.line_spacing,
+            )
+            stdout.write(art + "\n")
+        else:
+            api.render_to(
+                stdout,
+                args.text,
+                args.font,
+                args.color,
+                args.border,
+                end="\n",
+                width=args.width,
+                align=args.align,
+                layout=args.layout,
+                line_spacing=args.line_spacing,
+            )
+    except (ValueError, ImportError) as e:
+        print(f"Error: {e}", file=stderr)
+        return 1
+    return 0
+
+
+# Batch output is collected and written in chunks of about this many characters.
+_WRITE_CHUNK = 1 << 16
+
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "0": "\0", "\\": "\\"}
+
+
+def _unescape(text: str) -> str:
+    """Expand the backslash escapes understood by --separator; unknown escapes are kept as is."""
+    result = []
+    chars = iter(text)
+    for char in chars:
+        if char == "\\":
+            char = next(chars, "")
+            result.append(_ESCAPES.get(char, "\\" + char))
+        else:
+            result.append(char)
+    return "".join(result)
+
+
+def _run_batch(args: argparse.Namespace, stdout, stderr) -> int:
+    """
+    Render one banner per input line, streaming the input and writing the output in large chunks.
+
+    Args:
+        args (argparse.Namespace): Parsed command line with ``--stdin`` or ``--input``.
+        stdout: Text stream used when there is no ``--output``.
+        stderr: Text stream for error messages.
+
+    Returns:
+        int: Exit status.
+    """
+    from contextlib import ExitStack
+    from .core import export, iter_generate, load_font_dir
+
+    if args.jobs < 1:
+        print(f"Error: Number of jobs must be positive, got {args.jobs}.", file=stderr)
+        return 1
+    separator = _unescape(args.separator)
+    with ExitStack() as stack:
+        try:
+            for directory in args.font_dir:
+                load_font_dir(directory)
+            if args.stdin or args.input == "-":
+                source = sys.stdin
+            else:
+                source = stack.enter_context(open(args.input, encoding="utf-8"))
+            out = stdout
+            if args.output:
+                out = stack.enter_context(open(args.output, "w", encoding="utf-8"))
+            texts = (line.rstrip("\r\n") for line in source)
+            workers = args.jobs if args.jobs > 1 else None
+            if args.format == "ansi":
+                arts = iter_generate(
+                    texts,
+                    args.font,
+                    args.color,
+                    args.border,
+                    workers=workers,
+                    width=args.width,
+                    align=args.align,
+                    layout=args.layout,
+                    line_spacing=args.line_spacing,
+                )
+            else:
+                # Only ANSI output is rendered in worker processes; other formats render here.
+                arts = (
+                    export(
+                        text,
+                        args.format,
+                        args.font,
+                        args.color,
+                        args.border,
+                        args.width,
+                        args.align,
+                        layout=args.layout,
+                        line_spacing=args.line_spacing,
+                    )
+                    for text in texts
+                )
+            buffer, size = [], 0
+            for i, art in enumerate(arts):
+                if i:
+                    buffer.append(separator)
+                buffer.append(art)
+                buffer.append("\n")
+                size += len(art) + len(separator) + 1
+                if size >= _WRITE_CHUNK:
+                    out.write("".join(buffer))
+                    buffer, size = [], 0
+            out.write("".join(buffer))
+            out.flush()
+        except (OSError, ValueError, ImportError) as e:
+            print(f"Error: {e}", file=stderr)
+            return 1
+    return 0
+
+
+def _use_color(args: argparse.Namespace, stream) -> bool:
+    """Whether --color applies to output written to ``stream`` (None for a file), according to --color-mode."""
+    if args.color_mode != "auto":
+        return args.color_mode == "always"
+    from .colors import color_enabled
+
+    return color_enabled(stream)
+
+
+def _print_stats(stats: dict, prefix: str = "") -> None:
+    """Print server stats as ``key: value`` lines, indenting nested groups."""
+    for key, value in stats.items():
+        if isinstance(value, dict):
+            print(f"{prefix}{key}:")
+            _print_stats(value, prefix + "  ")
+        else:
+            print(f"{prefix}{key}: {value}")
+
+
+def _server_command(args: argparse.Namespace) -> int:
+    """Handle --serve, --server-stats and --stop-server."""
+    from . import server
+
+    if args.serve:
+        try:
+            server.serve(args.socket, args.idle_timeout, [os.path.abspath(d) for d in args.font_dir])
+        except OSError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        return 0
+
+    reply = server.request({"command": "stats" if args.server_stats else "stop"}, args.socket)
+    if reply is None:
+        print(f"Error: No server running on '{args.socket or server.default_socket_path()}'.", file=sys.stderr)
+        return 1
+    if args.server_stats:
+        _print_stats(reply["stats"])
+    return 0
+
+
+def main():
+    parser = _build_parser()
+    args = parser.parse_args()
+
+    if args.serve or args.server_stats or args.stop_server:
+        code = _server_command(args)
+        if code:
+            sys.exit(code)
         return
 
-    if not args.text:
+    # Decided here rather than where the art is rendered, which may be a server writing to a pipe. Only escape codes
+    # depend on the terminal; other formats keep their colors.
+    if args.color and args.format == "ansi" and not _use_color(args, None if args.output else sys.stdout):
+        from .core import _get_generator
+
+        try:
+            _get_generator()._color_codes(args.color)  # still report invalid colors
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        args.color = None
+
+    profiler = None
+    if args.profile:
+        from .core import _get_generator
+
+        profiler = _get_generator().enable_profiling()
+
+    if args.stdin or args.input:
+        # Batches stream their input, so they always render in this process.
+        code = _run_batch(args, sys.stdout, sys.stderr)
+        if profiler is not None:
+            print(profiler.report(), file=sys.stderr)
+        if code:
+            sys.exit(code)
+        return
+
+    if not (args.text or args.list_fonts or args.list_colors or args.list_borders):
         parser.print_help()
         return
 
-    try:
-        result = generate(args.text, args.font, args.color, args.border)
-        print(result)
-    except ValueError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+    reply = None
+    # Profiles measure this process, so profiled runs are never forwarded.
+    if not args.profile and (args.server or os.environ.get("ASCIIGENATOR_SERVER", "") not in ("", "0")):
+        from . import server
+
+        options = {name: getattr(args, name) for name in _RENDER_OPTIONS}
+        # The server has its own working directory.
+        options["font_dir"] = [os.path.abspath(directory) for directory in args.font_dir]
+        reply = server.request({"command": "render", "options": options}, args.socket)
+    if reply is not None:
+        sys.stdout.write(reply["stdout"])
+        sys.stderr.write(reply["stderr"])
+        code = reply["code"]
+    else:
+        # Profiled renders go through generate(), which is what the profiler instruments.
+        code = _execute(args, sys.stdout, sys.stderr, cached=profiler is not None)
+    if profiler is not None and not code:
+        print(profiler.report(), file=sys.stderr)
+    if code:
+        sys.exit(code)
 
 
 if __name__ == "__main__":
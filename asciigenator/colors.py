@@ -0,0 +1,366 @@
+"""
+Color specifications: 16 named colors, 256-color indexes, 24-bit colors, backgrounds and gradients.
+
+A color specification is one of::
+
+    red                   a color name (see ``list_colors()``)
+    #ff8800  #f80         a 24-bit color
+    208                   a 256-color palette index
+    red:yellow:green      a gradient through two or more colors, across the columns of the art
+    red:blue@vertical     a gradient across its rows, or ``@glyph`` for one color per character
+    rainbow               the rainbow gradient, which also takes a mode: ``rainbow@glyph``
+    white on blue         any of the above in front of a solid background color
+    on blue               a background color alone
+
+Specifications are parsed once per generator and the escape sequences of a gradient are computed once per number of
+steps, so coloring costs one string concatenation per run of cells sharing a color. Cells that are blank are never
+switched to a new color, which merges runs across the gaps between letters.
+
+Gradients whose stops are all 256-color indexes are drawn with the 256-color palette; all others use 24-bit color.
+"""
+
+from __future__ import annotations
+
+from collections import namedtuple
+import os
+
+from .cache import ClockCache
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Dict, List, Optional, Sequence, Tuple
+
+GRADIENT_MODES = ("horizontal", "vertical", "glyph")
+
+# Numbers of steps (widths, heights or character counts) whose colors, escape sequences and runs each gradient keeps.
+_STEPS_CACHE_SIZE = 256
+
+# Ends the foreground color of a gradient row while keeping any background color.
+FOREGROUND_RESET = "\033[39m"
+
+# xterm's default RGB values of the 16 named colors, used to interpolate gradients between them.
+NAMED_RGB = {
+    "black": (0, 0, 0),
+    "red": (205, 0, 0),
+    "green": (0, 205, 0),
+    "yellow": (205, 205, 0),
+    "blue": (0, 0, 238),
+    "magenta": (205, 0, 205),
+    "cyan": (0, 205, 205),
+    "white": (229, 229, 229),
+    "bright_black": (127, 127, 127),
+    "bright_red": (255, 0, 0),
+    "bright_green": (0, 255, 0),
+    "bright_yellow": (255, 255, 0),
+    "bright_blue": (92, 92, 255),
+    "bright_magenta": (255, 0, 255),
+    "bright_cyan": (0, 255, 255),
+    "bright_white": (255, 255, 255),
+}
+
+RAINBOW = ((255, 0, 0), (255, 127, 0), (255, 255, 0), (0, 200, 0), (0, 127, 255), (75, 0, 130), (148, 0, 211))
+
+# Channel values of the 6x6x6 color cube at indexes 16-231 of the 256-color palette.
+_CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+
+Palette = namedtuple("Palette", ["prefix", "gradient", "foreground", "background"])
+Palette.__doc__ = """
+A parsed color specification: the escape code written before the art (foreground and/or background color), the
+gradient painted over the glyph rows or None for a solid color, and the RGB values of the solid foreground and of
+the background, or None where there is none or it is not known (colors added to ``ASCIIGenerator.colors``).
+"""
+
+
+def _index_rgb(index: int) -> Tuple[int, int, int]:
+    """RGB value of a 256-color palette index."""
+    if index < 16:
+        return list(NAMED_RGB.values())[index]
+    if index < 232:
+        index -= 16
+        return _CUBE_LEVELS[index // 36], _CUBE_LEVELS[index // 6 % 6], _CUBE_LEVELS[index % 6]
+    return (8 + 10 * (index - 232),) * 3
+
+
+def nearest_index(rgb: Tuple[int, int, int]) -> int:
+    """
+    Find the closest color of the 256-color palette, among the color cube and the gray ramp.
+
+    Args:
+        rgb (Tuple[int, int, int]): Red, green and blue, 0-255.
+
+    Returns:
+        int: Palette index, 16-255.
+    """
+
+    def level(value):
+        return min(range(6), key=lambda i: abs(_CUBE_LEVELS[i] - value))
+
+    r, g, b = rgb
+    cube = 16 + 36 * level(r) + 6 * level(g) + level(b)
+    gray = 232 + min(23, max(0, round((sum(rgb) / 3 - 8) / 10)))
+
+    def distance(index):
+        return sum((x - y) ** 2 for x, y in zip(_index_rgb(index), rgb))
+
+    return min(cube, gray, key=distance)
+
+
+class Gradient:
+    """
+    Colors interpolated between stops, with their escape sequences computed once per number of steps.
+
+    Attributes:
+        stops (Tuple[Tuple[int, int, int], ...]): RGB colors the gradient passes through, at equal distances.
+        mode (str): "horizontal" (one color per column), "vertical" (per row) or "glyph" (per character).
+        palette256 (bool): Whether escape sequences use the 256-color palette instead of 24-bit color.
+    """
+
+    __slots__ = ("stops", "mode", "palette256", "_colors", "_escapes", "_runs")
+
+    def __init__(self, stops: Sequence[Tuple[int, int, int]], mode: str = "horizontal", palette256: bool = False):
+        """
+        Args:
+            stops (Sequence[Tuple[int, int, int]]): At least two RGB colors.
+            mode (str, optional): One of ``GRADIENT_MODES``. Defaults to "horizontal".
+            palette256 (bool, optional): Use 256-color escape sequences. Defaults to False (24-bit color).
+        """
+        self.stops = tuple(stops)
+        self.mode = mode
+        self.palette256 = palette256
+        self._colors = ClockCache(_STEPS_CACHE_SIZE)
+        self._escapes = ClockCache(_STEPS_CACHE_SIZE)
+        self._runs = ClockCache(_STEPS_CACHE_SIZE)
+
+    def __reduce__(self):
+        # The caches hold a lock, and are rebuilt on demand anyway.
+        return Gradient, (self.stops, self.mode, self.palette256)
+
+    def color(self, position: float) -> Tuple[int, int, int]:
+        """
+        Interpolate the gradient.
+
+        Args:
+            position (float): 0 for the first stop, 1 for the last.
+
+        Returns:
+            Tuple[int, int, int]: The RGB color at ``position``.
+        """
+        scaled = min(max(position, 0.0), 1.0) * (len(self.stops) - 1)
+        i = min(int(scaled), len(self.stops) - 2)
+        t = scaled - i
+        return tuple(round(a + (b - a) * t) for a, b in zip(self.stops[i], self.stops[i + 1]))
+
+    def colors(self, steps: int) -> Tuple[Tuple[int, int, int], ...]:
+        """
+        ``steps`` colors spread evenly from the first stop to the last, as they are drawn.
+
+        Args:
+            steps (int): Number of colors.
+
+        Returns:
+            Tuple[Tuple[int, int, int], ...]: RGB value of each step, snapped to the 256-color palette for
+            256-color gradients.
+        """
+        colors = self._colors.get(steps)
+        if colors is None:
+            colors = [self.color(step / (steps - 1) if steps > 1 else 0.0) for step in range(steps)]
+            if self.palette256:
+                colors = [_index_rgb(nearest_index(rgb)) for rgb in colors]
+            colors = tuple(colors)
+            self._colors.put(steps, colors)
+        return colors
+
+    def escapes(self, steps: int) -> Tuple[str, ...]:
+        """
+        Escape sequences of ``steps`` colors spread evenly from the first stop to the last.
+
+        Args:
+            steps (int): Number of colors.
+
+        Returns:
+            Tuple[str, ...]: One foreground escape sequence per step. Adjacent steps that round to the same color
+            share the same string object.
+        """
+        escapes = self._escapes.get(steps)
+        if escapes is None:
+            result = []
+            for rgb in self.colors(steps):
+                if self.palette256:
+                    escape = f"\033[38;5;{nearest_index(rgb)}m"
+                else:
+                    escape = "\033[38;2;{};{};{}m".format(*rgb)
+                result.append(result[-1] if result and result[-1] == escape else escape)
+            escapes = tuple(result)
+            self._escapes.put(steps, escapes)
+        return escapes
+
+    def column_runs(self, width: int) -> List[Tuple[int, int, str]]:
+        """
+        Horizontal gradient over ``width`` columns, as runs of columns sharing one color.
+
+        Args:
+            width (int): Number of columns.
+
+        Returns:
+            List[Tuple[int, int, str]]: Start column, end column and escape sequence of each run.
+        """
+        runs = self._runs.get(width)
+        if runs is None:
+            runs = merge_runs(self.escapes(width))
+            self._runs.put(width, runs)
+        return runs
+
+
+def merge_runs(values: Sequence) -> List[Tuple[int, int, object]]:
+    """
+    Group per-column values into runs of equal adjacent values.
+
+    Args:
+        values (Sequence): Value of each column.
+
+    Returns:
+        List[Tuple[int, int, object]]: Start column, end column and value of each run.
+    """
+    runs = []
+    for column, value in enumerate(values):
+        if runs and runs[-1][2] == value:
+            runs[-1] = (runs[-1][0], column + 1, value)
+        else:
+            runs.append((column, column + 1, value))
+    return runs
+
+
+def paint_row(line: str, runs: Sequence[Tuple[int, int, str]]) -> str:
+    """
+    Color the columns of one output row.
+
+    Runs of blank cells keep the current color instead of switching, so consecutive runs separated only by blanks
+    share one escape sequence.
+
+    Args:
+        line (str): Row without color codes.
+        runs (Sequence[Tuple[int, int, str]]): Start column, end column and escape sequence of each run, in order.
+
+    Returns:
+        str: The row with color codes, ending in a foreground color reset if any color was switched on.
+    """
+    out = []
+    current = None
+    end = len(line)
+    for start, stop, escape in runs:
+        if start >= end:
+            break
+        cells = line[start:stop]
+        if escape != current and not cells.isspace():
+            out.append(escape)
+            current = escape
+        out.append(cells)
+    if current is None:
+        return line
+    if stop < end:
+        out.append(line[stop:])
+    out.append(FOREGROUND_RESET)
+    return "".join(out)
+
+
+def _parse_rgb(token: str, named: Dict[str, str]) -> Tuple[Tuple[int, int, int], bool]:
+    """Parse one gradient stop, returning its RGB value and whether it is a 256-color index."""
+    if token.startswith("#"):
+        return _parse_hex(token), False
+    if token.isdigit() and int(token) < 256:
+        return _index_rgb(int(token)), True
+    if token in NAMED_RGB and token in named:
+        return NAMED_RGB[token], False
+    raise ValueError(token)
+
+
+def _parse_hex(token: str) -> Tuple[int, int, int]:
+    """Parse ``#rgb`` or ``#rrggbb``."""
+    digits = token[1:]
+    if len(digits) == 3:
+        digits = "".join(digit * 2 for digit in digits)
+    if len(digits) != 6:
+        raise ValueError(token)
+    value = int(digits, 16)
+    return value >> 16, (value >> 8) & 0xFF, value & 0xFF
+
+
+def _solid(token: str, named: Dict[str, str], background: bool) -> Tuple[str, Optional[Tuple[int, int, int]]]:
+    """Escape code and RGB value of one solid color, as a foreground or background color."""
+    if token.startswith("#"):
+        rgb = _parse_hex(token)
+        return "\033[{};2;{};{};{}m".format(48 if background else 38, *rgb), rgb
+    if token.isdigit() and int(token) < 256:
+        return f"\033[{48 if background else 38};5;{int(token)}m", _index_rgb(int(token))
+    code = named.get(token)
+    if code is None:
+        raise ValueError(token)
+    rgb = NAMED_RGB.get(token)
+    if not background:
+        return code, rgb
+    # The 16 named colors have their background variant 10 codes above the foreground one.
+    number = code[2:-1] if code.startswith("\033[") and code.endswith("m") else ""
+    if not number.isdigit() or not (30 <= int(number) <= 37 or 90 <= int(number) <= 97):
+        raise ValueError(token)
+    return f"\033[{int(number) + 10}m", rgb
+
+
+def parse_color(spec: str, named: Dict[str, str]) -> Palette:
+    """
+    Parse a color specification (see the module documentation).
+
+    Args:
+        spec (str): Color specification.
+        named (Dict[str, str]): Escape code of each color name.
+
+    Returns:
+        Palette: The escape code written before the art, and the gradient to paint, if any.
+
+    Raises:
+        ValueError: If the specification is not valid.
+    """
+    try:
+        foreground, _, background = spec.strip().partition(" on ")
+        if spec.strip().startswith("on "):
+            foreground, background = "", spec.strip()[3:]
+        foreground, background = foreground.strip(), background.strip()
+        if not foreground and not background:
+            raise ValueError(spec)
+        prefix, back = _solid(background, named, True) if background else ("", None)
+        name, _, mode = foreground.partition("@")
+        if ":" not in name and name != "rainbow":
+            if mode:
+                raise ValueError(spec)
+            code, fore = _solid(name, named, False) if name else ("", None)
+            return Palette(code + prefix, None, fore, back)
+        if mode and mode not in GRADIENT_MODES:
+            raise ValueError(spec)
+        if name == "rainbow":
+            return Palette(prefix, Gradient(RAINBOW, mode or "horizontal"), None, back)
+        stops = [_parse_rgb(token.strip(), named) for token in name.split(":")]
+        palette256 = all(indexed for _, indexed in stops)
+        return Palette(prefix, Gradient([rgb for rgb, _ in stops], mode or "horizontal", palette256), None, back)
+    except ValueError:
+        raise ValueError(f"Color '{spec}' not available.") from None
+
+
+def color_enabled(stream, environ: Optional[Dict[str, str]] = None) -> bool:
+    """
+    Decide whether colored output should be written to a stream.
+
+    Args:
+        stream: The output stream.
+        environ (Dict[str, str], optional): Environment variables. Defaults to None (``os.environ``).
+
+    Returns:
+        bool: False if ``NO_COLOR`` is set to a non-empty value (see https://no-color.org), ``TERM`` is "dumb" or
+        the stream is not a terminal; True otherwise.
+    """
+    environ = os.environ if environ is None else environ
+    if environ.get("NO_COLOR") or environ.get("TERM") == "dumb":
+        return False
+    isatty = getattr(stream, "isatty", None)
+    try:
+        return bool(isatty and isatty())
+    except ValueError:  # closed stream
+        return False
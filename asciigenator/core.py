@@ -1,9 +1,516 @@
 """
-ASCII Art Generator supporting all letters A-Z (uppercase), space, colors, and borders.
+ASCII Art Generator supporting letters, digits, punctuation, accented text, colors, and borders.
 """
 
-from typing import Dict, List
-import re
+from __future__ import annotations
+
+from collections import namedtuple
+from collections.abc import MutableMapping
+import io
+import itertools
+import os
+import sys
+import time
+
+from .glyphs import GlyphIssue, GlyphTable
+
+# typing is only needed by type checkers; importing it at runtime would dominate ``import asciigenator``.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+    from .cache import CacheInfo, ClockCache
+    from .colors import Gradient, Palette
+    from .formats import Art, Bitmap
+    from .profiling import Profiler
+    from .renderer import Renderer
+    from .vectorized import GlyphArray
+
+
+ALIGNMENTS = ("left", "center", "right")
+# "upper" draws every character with the glyph of its upper case form; "preserve" prefers the font's own glyph for
+# the character as typed, for fonts that define lower case letters.
+CASES = ("upper", "preserve")
+# "auto" uses the NumPy backend for bands of at least _VECTORIZE_MIN_CHARS characters when NumPy is installed.
+BACKENDS = ("python", "numpy", "auto")
+_VECTORIZE_MIN_CHARS = 256
+# "full" draws glyphs at full width with one column of letter spacing; "kerning" and "smush" fit them together
+# (see ``asciigenator.kerning``).
+LAYOUTS = ("full", "kerning", "smush")
+# Blank rows inserted between glyph bands, from the lines of the text or from wrapping, unless ``line_spacing`` is given.
+_BAND_SPACING = 1
+# Border rows a renderer keeps, one set per inner width (see ``_border_lines``).
+_FRAME_MEMO_SIZE = 64
+# Parsed color specifications a generator keeps.
+_PALETTE_CACHE_SIZE = 256
+
+BorderStyle = namedtuple(
+    "BorderStyle", ["top_left", "top", "top_right", "left", "right", "bottom_left", "bottom", "bottom_right"]
+)
+BorderStyle.__doc__ = """
+Characters used to draw a border: four corners, the horizontal top and bottom edges, and the vertical sides.
+
+The top and bottom edges are repeated once per inner column, so they should be one column wide.
+"""
+
+BORDER_STYLES = {
+    "ascii": BorderStyle("+", "-", "+", "|", "|", "+", "-", "+"),
+    "single": BorderStyle("┌", "─", "┐", "│", "│", "└", "─", "┘"),
+    "double": BorderStyle("╔", "═", "╗", "║", "║", "╚", "═", "╝"),
+    "rounded": BorderStyle("╭", "─", "╮", "│", "│", "╰", "─", "╯"),
+    "heavy": BorderStyle("┏", "━", "┓", "┃", "┃", "┗", "━", "┛"),
+}
+
+BUILTIN_FONT_NAMES = ("simple", "block")
+
+# Letters and punctuation that NFKD does not decompose into characters the built-in fonts have, keyed by upper case.
+_TRANSLITERATIONS = {
+    "Æ": "AE",
+    "Œ": "OE",
+    "Ø": "O",
+    "Đ": "D",
+    "Ð": "D",
+    "Þ": "TH",
+    "Ł": "L",
+    "Ħ": "H",
+    "Ŧ": "T",
+    "ẞ": "SS",
+    "‘": "'",
+    "’": "'",
+    "‚": ",",
+    "“": '"',
+    "”": '"',
+    "„": '"',
+    "–": "-",
+    "—": "-",
+    "−": "-",
+    "«": "<<",
+    "»": ">>",
+    "×": "X",
+    "¿": "?",
+    "¡": "!",
+}
+
+_ANSI_ESCAPE = None
+# Words and the runs of separators between them, the segments memoized by the segment cache. Shorter bands are
+# translated directly, which is faster than looking up their segments.
+_SEGMENT = None
+_SEGMENT_MIN_CHARS = 8
+
+
+def _color_names(spec: str) -> List[str]:
+    """The words of a color specification, among them the color names it uses."""
+    return spec.replace(":", " ").replace("@", " ").split()
+
+
+def _strip_ansi(text: str) -> str:
+    """Remove ANSI escape codes from ``text``, compiling the pattern once on first use."""
+    global _ANSI_ESCAPE
+    if _ANSI_ESCAPE is None:
+        import re
+
+        _ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+    return _ANSI_ESCAPE.sub("", text)
+
+
+def _palette_cache() -> "ClockCache":
+    """An empty cache of parsed color specifications."""
+    from .cache import ClockCache
+
+    return ClockCache(_PALETTE_CACHE_SIZE)
+
+
+class _RowTable(dict):
+    """
+    Lookup table keyed by code point that fills itself from the font on first use of each character.
+
+    Used as a ``str.translate`` table for one glyph row, and as a code point to glyph width table. Each character,
+    including ones that resolve to the fallback glyph, is looked up in the font only once and then memoized, so
+    large fonts never have tables built for glyphs that are not rendered.
+    """
+
+    __slots__ = ("_resolve",)
+
+    def __init__(self, resolve: Callable[[int], object]):
+        super().__init__()
+        self._resolve = resolve
+
+    def __missing__(self, key: int):
+        value = self[key] = self._resolve(key)
+        return value
+
+
+class _CompiledFont:
+    """
+    A font compiled into one ``str.translate`` table per glyph row.
+
+    Each table maps a code point to that glyph's row followed by the single column of letter spacing, so an
+    output row is produced by one ``text.translate(row)`` call instead of per-character concatenation.
+
+    The glyphs a code point is drawn with are resolved once, on first use, and memoized in ``glyphs``: the
+    character itself or its upper case form according to the case policy, then its NFKD decomposition without
+    accents or a transliteration (see ``_TRANSLITERATIONS``), and finally the fallback policy. A code point may be
+    drawn with several glyphs, e.g. "ß" as "SS".
+
+    Fonts compiled with the "kerning" or "smush" layout compose their bands with a ``Composer`` instead of the row
+    tables; ``with_layout()`` returns them.
+
+    Attributes:
+        source (GlyphTable): The glyphs the tables are compiled from.
+        height (int): Number of rows of every glyph.
+        case (str): Case policy, see ``CASES``.
+        fallback (str): Fallback policy: "space", "raise" or a placeholder character.
+        glyphs (_RowTable): Glyph numbers each code point is drawn with, empty for a blank.
+        rows (List[_RowTable]): One translate table per glyph row.
+        advances (_RowTable): Columns taken by each code point, glyph width plus letter spacing.
+        array (GlyphArray): The font as a NumPy array for the vectorized backend, built on first use.
+        fallbacks (Set[int]): Code points resolved so far that are drawn according to the fallback policy.
+        segments (Optional[ClockCache]): Glyph rows of recently rendered words and separators, or None if the
+            segment cache is disabled (see ``segment_rows``).
+        layout (str): Layout mode, see ``LAYOUTS``.
+        composer (Optional[Composer]): Composes bands with kerning or smushing, None for the "full" layout.
+        variants (Dict[str, _CompiledFont]): The font compiled with other layouts, see ``with_layout()``.
+    """
+
+    __slots__ = (
+        "source",
+        "height",
+        "case",
+        "fallback",
+        "glyphs",
+        "rows",
+        "advances",
+        "array",
+        "fallbacks",
+        "segments",
+        "layout",
+        "composer",
+        "variants",
+        "_blank",
+    )
+
+    def __init__(
+        self,
+        table: GlyphTable,
+        case: str = "upper",
+        fallback: str = "space",
+        segment_cache: int = 0,
+        layout: str = "full",
+    ):
+        self.source = table
+        self.height = table.height
+        self.case = case
+        self.fallback = fallback
+        # Fonts without a space glyph fall back to a blank as wide as their first glyph.
+        self._blank = " " * (table.glyph_width(0) if len(table) else 0) + " "
+        self.glyphs = _RowTable(self._resolve)
+        self.rows = [_RowTable(lambda code, i=i: self._row(i, code)) for i in range(self.height)]
+        self.advances = _RowTable(self._advance)
+        self.array = None
+        self.fallbacks = set()
+        self.segments = None
+        if segment_cache:
+            from .cache import ClockCache
+
+            self.segments = ClockCache(segment_cache)
+        self.layout = layout
+        self.composer = None
+        if layout != "full":
+            from .kerning import Composer
+
+            self.composer = Composer(self, layout == "smush")
+        self.variants = {}
+
+    def __reduce__(self):
+        # Compiled tables are rebuilt lazily from the glyphs, so only those are sent to worker processes, which
+        # keep segment caches of their own.
+        segment_cache = self.segments.maxsize if self.segments is not None else 0
+        return type(self), (self.source, self.case, self.fallback, segment_cache, self.layout)
+
+    def with_layout(self, layout: str) -> "_CompiledFont":
+        """
+        The same font compiled with another layout, built on first use and kept with this one.
+
+        Args:
+            layout (str): Layout mode, see ``LAYOUTS``.
+
+        Returns:
+            _CompiledFont: This font if it already has the layout, otherwise its variant.
+        """
+        if layout == self.layout:
+            return self
+        variant = self.variants.get(layout)
+        if variant is None:
+            variant = self.variants.setdefault(layout, _CompiledFont(self.source, self.case, self.fallback, 0, layout))
+        return variant
+
+    def _find(self, text: str, transliterate: bool = True) -> Optional[Tuple[int, ...]]:
+        """Glyph numbers that draw ``text``, or None if a character has no glyph."""
+        glyphs = []
+        for char in text:
+            found = self._find_char(char, transliterate)
+            if found is None:
+                return None
+            glyphs.extend(found)
+        return tuple(glyphs)
+
+    def _find_char(self, char: str, transliterate: bool) -> Optional[Tuple[int, ...]]:
+        index = self.source.index
+        if self.case == "preserve":
+            glyph = index(char)
+            if glyph is not None:
+                return (glyph,)
+        upper = char.upper()
+        if len(upper) == 1:
+            glyph = index(upper)
+            if glyph is None and self.case == "upper":
+                glyph = index(char)
+            if glyph is not None:
+                return (glyph,)
+        else:
+            found = self._find(upper, transliterate)
+            if found is not None:
+                return found
+        if not transliterate:
+            return None
+        replacement = _TRANSLITERATIONS.get(upper)
+        if replacement is None:
+            import unicodedata
+
+            replacement = "".join(c for c in unicodedata.normalize("NFKD", char) if not unicodedata.combining(c))
+        if not replacement or replacement == char:
+            return None
+        return self._find(replacement, False)
+
+    def _resolve(self, code: int) -> Tuple[int, ...]:
+        char = chr(code)
+        glyphs = self._find(char)
+        if glyphs is None:
+            if self.fallback == "raise":
+                raise ValueError(f"Character '{char}' not available in font.")
+            self.fallbacks.add(code)
+            if self.fallback != "space":
+                glyphs = self._find(self.fallback, False)
+            if glyphs is None:
+                glyphs = self._find(" ", False) or ()
+        return glyphs
+
+    def _row(self, i: int, code: int) -> str:
+        glyphs = self.glyphs[code]
+        if not glyphs:
+            return self._blank
+        row = self.source.row
+        return "".join([row(glyph, i) + " " for glyph in glyphs])
+
+    def _advance(self, code: int) -> int:
+        glyphs = self.glyphs[code]
+        if not glyphs:
+            return len(self._blank)
+        width = self.source.glyph_width
+        return sum(width(glyph) + 1 for glyph in glyphs)
+
+    def segment_rows(self, band: str) -> List[str]:
+        """
+        Glyph rows of a band, assembled from the memoized rows of its words and of the separators between them.
+
+        Each distinct segment is looked up once per band and translated only when it is not in ``segments``, so
+        texts that share words with earlier ones skip most of the per-character work.
+
+        Args:
+            band (str): Text of the band.
+
+        Returns:
+            List[str]: The glyph rows, including the trailing letter spacing column.
+        """
+        global _SEGMENT
+        if _SEGMENT is None:
+            import re
+
+            _SEGMENT = re.compile(r"[^\W\d]+|\d+|\W+")
+        segments = self.segments
+        parts = _SEGMENT.findall(band)
+        if not parts:
+            return [""] * self.height
+        found = {}
+        for segment in parts:
+            if segment not in found:
+                rows = segments.get(segment)
+                if rows is None:
+                    rows = tuple([segment.translate(row) for row in self.rows])
+                    segments.put(segment, rows)
+                found[segment] = rows
+        return ["".join(row) for row in zip(*[found[segment] for segment in parts])]
+
+    def text_width(self, text: str) -> int:
+        """
+        Number of columns ``text`` occupies, from glyph widths alone and without rendering it.
+
+        Args:
+            text (str): Upper-cased input text.
+
+        Returns:
+            int: Sum of the glyph widths plus the spacing between them, or the composed width for the "kerning"
+            and "smush" layouts.
+        """
+        if self.composer is not None:
+            return self.composer.compose(text).width
+        return max(sum(map(self.advances.__getitem__, map(ord, text))) - 1, 0)
+
+
+def _load_builtin_font(name: str) -> Dict[str, List[str]]:
+    """Load the glyphs of a built-in font, importing the glyph data module on first use."""
+    from .fonts import BUILTIN_FONTS
+
+    return dict(BUILTIN_FONTS[name])
+
+
+def _load_font_file(path: str) -> Dict[str, List[str]]:
+    """Load a font file through the precompiled font cache."""
+    from .fontfile import load_font_file
+
+    return load_font_file(path)
+
+
+def _register_font_dir(fonts: "FontRegistry", directory: str) -> List[str]:
+    """Register the font files found in ``directory`` with a registry, returning their names."""
+    from .fontfile import font_files
+
+    names = font_files(directory)
+    fonts.register_many({name: (lambda path=path: _load_font_file(path)) for name, path in names.items()})
+    return list(names)
+
+
+# Registering fonts and colors never changes a dictionary that renders may be reading: new dictionaries replace the
+# old ones, published source first, then what is derived from it (``fonts`` before ``_compiled``, ``colors`` before
+# ``_palettes``). Renders read in the opposite order, so one racing a change either sees the new source, or stores
+# what it derived from the old one into a dictionary that is already being retired.
+def _registry_lock():
+    """The lock serializing changes to font registries and generator colors, created on first use."""
+    lock = globals().get("_REGISTRY_LOCK")
+    if lock is None:
+        import threading
+
+        # setdefault is atomic, so concurrent first calls still share one lock.
+        lock = globals().setdefault("_REGISTRY_LOCK", threading.RLock())
+    return lock
+
+
+class FontRegistry(MutableMapping):
+    """
+    Mapping of font names to glyph tables that loads each font the first time it is looked up.
+
+    Fonts are registered by name with a zero-argument loader returning a glyph dictionary. Membership tests,
+    iteration and ``len`` only look at the registered names, so listing fonts never loads one. Assigning a glyph
+    dictionary registers an already loaded font. Loaded fonts are packed into read-only ``GlyphTable`` objects.
+
+    The registry is copy-on-write: every change builds new dictionaries and publishes them with one attribute
+    assignment, so lookups take no lock and see either all of a change or none of it. Changes are serialized by a
+    lock; loading a font only adds its table to the dictionaries it was looked up in.
+    """
+
+    def __init__(self, loaders: Optional[Dict[str, Callable[[], Dict[str, List[str]]]]] = None):
+        """
+        Args:
+            loaders (Dict[str, Callable[[], Dict[str, List[str]]]], optional): Loader for each font name.
+                Defaults to None (no fonts).
+        """
+        # Loader of every registered name, and glyph table of every loaded one.
+        self._snapshot = (dict(loaders or {}), {})
+
+    def register(self, name: str, loader: Callable[[], Dict[str, List[str]]]) -> None:
+        """
+        Register a font to be loaded on first use, replacing any font with the same name.
+
+        Args:
+            name (str): Font name.
+            loader (Callable[[], Dict[str, List[str]]]): Returns the font's glyph dictionary.
+        """
+        self.register_many({name: loader})
+
+    def register_many(self, loaders: Dict[str, Callable[[], Dict[str, List[str]]]]) -> None:
+        """
+        Register several fonts to be loaded on first use in one change, replacing any fonts with the same names.
+
+        Args:
+            loaders (Dict[str, Callable[[], Dict[str, List[str]]]]): Loader for each font name.
+        """
+        with _registry_lock():
+            current, loaded = self._snapshot
+            loaded = {name: table for name, table in loaded.items() if name not in loaders}
+            self._snapshot = ({**current, **loaders}, loaded)
+
+    def is_loaded(self, name: str) -> bool:
+        """
+        Check whether a font has already been loaded.
+
+        Args:
+            name (str): Font name.
+
+        Returns:
+            bool: True if the font's glyphs are in memory.
+        """
+        return name in self._snapshot[1]
+
+    def loaded(self) -> Dict[str, GlyphTable]:
+        """
+        Get the fonts that have been loaded so far, without loading any others.
+
+        Returns:
+            Dict[str, GlyphTable]: Glyph table of each loaded font.
+        """
+        return dict(self._snapshot[1])
+
+    def __getitem__(self, name: str) -> GlyphTable:
+        loaders, tables = self._snapshot
+        try:
+            return tables[name]
+        except KeyError:
+            loader = loaders[name]
+        # setdefault keeps a single winner if two threads load the same font at once.
+        return tables.setdefault(name, GlyphTable.from_glyphs(loader()))
+
+    def __setitem__(self, name: str, font: Dict[str, List[str]]) -> None:
+        # Packed before taking the lock, so other changes do not wait for it.
+        table = GlyphTable.from_glyphs(font)
+        with _registry_lock():
+            current, loaded = self._snapshot
+            self._snapshot = ({**current, name: None}, {**loaded, name: table})
+
+    def __delitem__(self, name: str) -> None:
+        with _registry_lock():
+            current, loaded = self._snapshot
+            if name not in current:
+                raise KeyError(name)
+            current, loaded = dict(current), dict(loaded)
+            del current[name]
+            loaded.pop(name, None)
+            self._snapshot = (current, loaded)
+
+    def __contains__(self, name) -> bool:
+        return name in self._snapshot[0]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._snapshot[0])
+
+    def __len__(self) -> int:
+        return len(self._snapshot[0])
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._snapshot[0])!r})"
+
+
+class _EncodingWriter:
+    """Minimal text-stream adapter that encodes everything written to it before passing it to a binary ``write``."""
+
+    __slots__ = ("_write", "_encoding")
+
+    def __init__(self, write: Callable[[bytes], object], encoding: str):
+        self._write = write
+        self._encoding = encoding
+
+    def write(self, text: str) -> None:
+        if text:
+            self._write(text.encode(self._encoding))
 
 
 class ASCIIGenerator:
@@ -11,13 +518,57 @@ class ASCIIGenerator:
     ASCII Art Generator class with full A-Z alphabet, space, colors, and border support.
 
     Attributes:
-        fonts (Dict[str, Dict[str, List[str]]]): Dictionary of available fonts. Each font maps characters (A-Z, space)
-            to their ASCII art representations.
-        colors (Dict[str, str]): Mapping of color names to ANSI escape codes for terminal color support.
+        fonts (FontRegistry): Mapping of available fonts, loaded on first use. Each font is a read-only mapping of
+            characters (A-Z, space) to their ASCII art representations.
+        colors (Dict[str, str]): Mapping of color names to ANSI escape codes for terminal color support. Replaced
+            as a whole by ``register_color``, so readers never see it change.
         reset (str): ANSI reset escape code used to clear formatting after applying colors.
+        backend (str): Rendering backend used when a call does not choose one ("python", "numpy" or "auto").
+        fallback (str): How characters without a glyph are drawn ("space", "raise" or a placeholder character).
+        case (str): Case policy ("upper" or "preserve").
+        profiler (Optional[Profiler]): Instrumentation of ``generate`` and the batch methods, or None when
+            profiling is disabled (see ``enable_profiling``).
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache_size: Optional[int] = None,
+        cache_bytes: Optional[int] = None,
+        backend: str = "auto",
+        fallback: str = "space",
+        case: str = "upper",
+        segment_cache_size: Optional[int] = None,
+    ):
+        """
+        Args:
+            cache_size (int, optional): Maximum number of rendered results to keep in the render cache.
+                Defaults to None (no entry limit).
+            cache_bytes (int, optional): Maximum total size in bytes of the render cache. Defaults to None
+                (no size limit).
+            backend (str, optional): Default rendering backend. "python" renders with ``str.translate``, "numpy"
+                with vectorized array indexing, and "auto" uses NumPy for long texts when it is installed and
+                Python otherwise. Defaults to "auto".
+            fallback (str, optional): How characters a font cannot draw, even without their accents, are rendered:
+                "space" draws a space, "raise" raises ValueError, and any single character (such as "?") is drawn
+                in its place. Defaults to "space".
+            case (str, optional): "upper" draws every character in upper case; "preserve" uses a font's lower case
+                glyphs where it has them. Defaults to "upper".
+            segment_cache_size (int, optional): Number of words and separators per font whose glyph rows are
+                memoized by the segment cache. Defaults to None (disabled).
+
+        The render cache is disabled unless at least one of the limits is given.
+
+        Raises:
+            ValueError: If the backend, fallback or case policy is not available, or a cache size is negative.
+        """
+        self._check_backend(backend)
+        if fallback not in ("space", "raise") and len(fallback) != 1:
+            raise ValueError(f"Fallback '{fallback}' not available.")
+        if case not in CASES:
+            raise ValueError(f"Case '{case}' not available.")
+        self.backend = backend
+        self.fallback = fallback
+        self.case = case
         self.fonts = self._load_fonts()
         self.colors = {
             "black": "\033[30m",
@@ -38,79 +589,248 @@ class ASCIIGenerator:
             "bright_white": "\033[97m",
         }
         self.reset = "\033[0m"
+        self._palettes = _palette_cache()
+        self._compiled = {}
+        self._cache = None
+        self._segment_cache_size = 0
+        self.profiler = None
+        self.configure_cache(cache_size, cache_bytes)
+        self.configure_segment_cache(segment_cache_size)
 
-    def _load_fonts(self) -> Dict[str, Dict[str, List[str]]]:
-        """Load full alphabet A-Z for simple and block fonts."""
-        simple = {
-            "A": [" * ", "* *", "***", "* *", "* *"],
-            "B": ["** ", "* *", "** ", "* *", "** "],
-            "C": [" **", "*  ", "*  ", "*  ", " **"],
-            "D": ["** ", "* *", "* *", "* *", "** "],
-            "E": ["***", "*  ", "** ", "*  ", "***"],
-            "F": ["***", "*  ", "** ", "*  ", "*  "],
-            "G": [" **", "*  ", "* *", "* *", " **"],
-            "H": ["* *", "* *", "***", "* *", "* *"],
-            "I": ["***", " * ", " * ", " * ", "***"],
-            "J": ["  *", "  *", "  *", "* *", " * "],
-            "K": ["* *", "** ", "*  ", "** ", "* *"],
-            "L": ["*  ", "*  ", "*  ", "*  ", "***"],
-            "M": ["*   *", "** **", "* * *", "*   *", "*   *"],
-            "N": ["*   *", "**  *", "* * *", "*  **", "*   *"],
-            "O": ["***", "* *", "* *", "* *", "***"],
-            "P": ["** ", "* *", "** ", "*  ", "*  "],
-            "Q": ["***", "* *", "* *", " **", "  *"],
-            "R": ["** ", "* *", "** ", "* *", "* *"],
-            "S": [" **", "*  ", " * ", "  *", "** "],
-            "T": ["***", " * ", " * ", " * ", " * "],
-            "U": ["* *", "* *", "* *", "* *", "***"],
-            "V": ["* *", "* *", "* *", "* *", " * "],
-            "W": ["*   *", "*   *", "* * *", "** **", "*   *"],
-            "X": ["* *", "* *", " * ", "* *", "* *"],
-            "Y": ["* *", "* *", " * ", " * ", " * "],
-            "Z": ["***", "  *", " * ", "*  ", "***"],
-            " ": ["   ", "   ", "   ", "   ", "   "],
-        }
+    def configure_cache(self, maxsize: Optional[int] = None, maxbytes: Optional[int] = None) -> None:
+        """
+        Enable, resize or disable the render cache.
 
-        block = {
-            "A": ["  █  ", " █ █ ", "█████", "█   █", "█   █"],
-            "B": ["████ ", "█   █", "████ ", "█   █", "████ "],
-            "C": [" ████", "█    ", "█    ", "█    ", " ████"],
-            "D": ["████ ", "█   █", "█   █", "█   █", "████ "],
-            "E": ["█████", "█    ", "████ ", "█    ", "█████"],
-            "F": ["█████", "█    ", "████ ", "█    ", "█    "],
-            "G": [" ████", "█    ", "█  ██", "█   █", " ████"],
-            "H": ["█   █", "█   █", "█████", "█   █", "█   █"],
-            "I": ["█████", "  █  ", "  █  ", "  █  ", "█████"],
-            "J": ["    █", "    █", "    █", "█   █", " ███ "],
-            "K": ["█  █", "█ █ ", "██  ", "█ █ ", "█  █"],
-            "L": ["█    ", "█    ", "█    ", "█    ", "█████"],
-            "M": ["█   █", "██ ██", "█ █ █", "█   █", "█   █"],
-            "N": ["█   █", "██  █", "█ █ █", "█  ██", "█   █"],
-            "O": ["█████", "█   █", "█   █", "█   █", "█████"],
-            "P": ["████ ", "█   █", "████ ", "█    ", "█    "],
-            "Q": ["█████", "█   █", "█   █", "█  ██", "█████"],
-            "R": ["████ ", "█   █", "████ ", "█  █ ", "█   █"],
-            "S": [" ████", "█    ", " ███ ", "    █", "████ "],
-            "T": ["█████", "  █  ", "  █  ", "  █  ", "  █  "],
-            "U": ["█   █", "█   █", "█   █", "█   █", "█████"],
-            "V": ["█   █", "█   █", "█   █", " █ █ ", "  █  "],
-            "W": ["█   █", "█   █", "█ █ █", "██ ██", "█   █"],
-            "X": ["█   █", " █ █ ", "  █  ", " █ █ ", "█   █"],
-            "Y": ["█   █", " █ █ ", "  █  ", "  █  ", "  █  "],
-            "Z": ["█████", "   █ ", "  █  ", " █   ", "█████"],
-            " ": ["     ", "     ", "     ", "     ", "     "],
-        }
+        Rendered results are cached by their text and rendering options and evicted least recently used first.
+        Reconfiguring drops all cached results. Call ``cache_clear()`` after editing ``colors`` in place rather than
+        through ``register_color``.
+
+        Args:
+            maxsize (int, optional): Maximum number of cached results. Defaults to None (no entry limit).
+            maxbytes (int, optional): Maximum total size of cached results in bytes. Defaults to None (no size limit).
+                The cache is disabled when neither limit is given.
+
+        Raises:
+            ValueError: If a limit is negative.
+        """
+        if maxsize or maxbytes:
+            from .cache import LRUCache
+
+            self._cache = LRUCache(maxsize or None, maxbytes or None)
+        else:
+            self._cache = None
+
+    def configure_segment_cache(self, maxsize: Optional[int] = None) -> None:
+        """
+        Enable, resize or disable the segment cache.
+
+        The segment cache keeps the glyph rows of recently rendered words, and of the separators between them, for
+        each font. Texts are then assembled from cached words, which speeds up texts that share words with earlier
+        ones even when whole texts rarely repeat and the render cache does not help. Segments are evicted roughly
+        least recently used first (see ``ClockCache``) and are dropped with the compiled font when it changes. The
+        output is unchanged.
+
+        Args:
+            maxsize (int, optional): Maximum number of segments kept per font. Defaults to None (disabled).
+
+        Raises:
+            ValueError: If ``maxsize`` is negative.
+        """
+        from .cache import ClockCache
+
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(f"Cache size must not be negative, got {maxsize}.")
+        self._segment_cache_size = maxsize or 0
+        for compiled in list(self._compiled.values()):
+            compiled.segments = ClockCache(maxsize) if maxsize else None
+
+    def segment_cache_info(self) -> "CacheInfo":
+        """
+        Report segment cache statistics, summed over all compiled fonts.
+
+        Returns:
+            CacheInfo: Hits, misses and current size; ``maxsize`` is the limit per font. All zero and None when the
+            segment cache is disabled.
+        """
+        from .cache import CacheInfo
+
+        hits = misses = size = 0
+        for compiled in list(self._compiled.values()):
+            if compiled.segments is not None:
+                info = compiled.segments.info()
+                hits, misses, size = hits + info.hits, misses + info.misses, size + info.currsize
+        return CacheInfo(hits, misses, self._segment_cache_size or None, size, None, 0)
+
+    def cache_info(self) -> "CacheInfo":
+        """
+        Report render cache statistics.
+
+        Returns:
+            CacheInfo: Hits, misses and current/maximum sizes. All zero and None when the cache is disabled.
+        """
+        if self._cache is None:
+            from .cache import CacheInfo
+
+            return CacheInfo(0, 0, None, 0, None, 0)
+        return self._cache.info()
+
+    def cache_clear(self) -> None:
+        """Remove all results from the render cache, reset its statistics and forget parsed color specifications."""
+        self._palettes = _palette_cache()
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _load_fonts(self) -> "FontRegistry":
+        """Register the built-in fonts and the fonts in ``$ASCIIGENATOR_FONT_PATH``, to be loaded on first use."""
+        fonts = FontRegistry({name: (lambda name=name: _load_builtin_font(name)) for name in BUILTIN_FONT_NAMES})
+        for directory in os.environ.get("ASCIIGENATOR_FONT_PATH", "").split(os.pathsep):
+            if directory and os.path.isdir(directory):
+                _register_font_dir(fonts, directory)
+        return fonts
+
+    def load_font_dir(self, directory: str) -> List[str]:
+        """
+        Register every ``.flf``, ``.json`` and ``.toml`` font in a directory, named after its file.
+
+        Fonts are parsed on first use and cached in precompiled form (see ``asciigenator.fontfile``).
+
+        Args:
+            directory (str): Directory containing font files.
+
+        Returns:
+            List[str]: Names of the registered fonts.
+        """
+        return _register_font_dir(self.fonts, directory)
+
+    def register_font_file(self, path: str, name: Optional[str] = None) -> str:
+        """
+        Register a single ``.flf``, ``.json`` or ``.toml`` font file, to be parsed on first use.
+
+        Args:
+            path (str): Path to the font file.
+            name (str, optional): Font name. Defaults to None (the file name without extension).
+
+        Returns:
+            str: The registered font name.
+        """
+        name = name or os.path.splitext(os.path.basename(path))[0]
+        with _registry_lock():
+            self.fonts.register(name, lambda: _load_font_file(path))
+            self._forget_font(name)
+        return name
+
+    def register_font(self, name: str, font: Union[Dict[str, List[str]], Callable[[], Dict[str, List[str]]]]) -> None:
+        """
+        Add or replace a font, safely while other threads render.
+
+        Renders that started before the change finish with the old glyphs, and later ones use the new glyphs. Only
+        the compiled tables and cached results of this font are dropped.
+
+        Args:
+            name (str): Font name.
+            font (Dict[str, List[str]] | Callable[[], Dict[str, List[str]]]): Glyph dictionary, or a zero-argument
+                function returning one, called on first use.
+        """
+        if callable(font):
+            with _registry_lock():
+                self.fonts.register(name, font)
+                self._forget_font(name)
+            return
+        table = GlyphTable.from_glyphs(font)
+        with _registry_lock():
+            self.fonts[name] = table
+            self._forget_font(name)
+
+    def unregister_font(self, name: str) -> None:
+        """
+        Remove a font, safely while other threads render, dropping its compiled tables and cached results.
+
+        Args:
+            name (str): Font name.
+
+        Raises:
+            ValueError: If the font is not available.
+        """
+        with _registry_lock():
+            if name not in self.fonts:
+                raise ValueError(f"Font '{name}' not available.")
+            del self.fonts[name]
+            self._forget_font(name)
+
+    def register_color(self, name: str, code: str) -> None:
+        """
+        Add or replace a named color, safely while other threads render.
+
+        Only the parsed color specifications and cached results that use this name are dropped.
+
+        Args:
+            name (str): Color name, usable on its own or as a background (``"white on name"``).
+            code (str): ANSI escape code of the color as a foreground color.
+
+        Raises:
+            ValueError: If the name could be read as another part of a color specification.
+        """
+        if _color_names(name) != [name] or name in ("on", "rainbow") or name.startswith("#") or name.isdigit():
+            raise ValueError(f"Color name '{name}' not valid.")
+        with _registry_lock():
+            palettes = _palette_cache()
+            for spec, palette in self._palettes.items():
+                if name not in _color_names(spec):
+                    palettes.put(spec, palette)
+            self.colors = {**self.colors, name: code}
+            self._palettes = palettes
+        if self._cache is not None:
+            self._cache.discard(lambda key: bool(key[2]) and name in _color_names(key[2]))
+
+    def _forget_font(self, name: str) -> None:
+        """Drop the compiled tables and cached results of a font that was replaced or removed."""
+        with _registry_lock():
+            self._compiled = {font: entry for font, entry in self._compiled.items() if font != name}
+        if self._cache is not None:
+            self._cache.discard(lambda key: key[1] == name)
+
+    def _compile_font(self, font: str, layout: str = "full") -> "_CompiledFont":
+        """
+        Return the compiled row tables for a font, building them on first use.
+
+        The compiled tables are rebuilt whenever ``self.fonts[font]`` is replaced with a new dictionary or the
+        ``fallback`` or ``case`` policy changes. Glyphs edited in place on an already compiled font are not picked up.
+
+        Args:
+            font (str): Name of a font in ``self.fonts``.
+            layout (str, optional): Layout mode, see ``LAYOUTS``. Defaults to "full".
 
-        return {"simple": simple, "block": block}
+        Returns:
+            _CompiledFont: Compiled lookup tables for the font.
+
+        Raises:
+            ValueError: If the font is not available, e.g. because another thread just removed it.
+        """
+        compiled = self._compiled
+        try:
+            font_data = self.fonts[font]
+        except KeyError:
+            raise ValueError(f"Font '{font}' not available.") from None
+        entry = compiled.get(font)
+        if entry is None or (entry.source, entry.case, entry.fallback) != (font_data, self.case, self.fallback):
+            if entry is not None and self._cache is not None:
+                self._cache.discard(lambda key: key[1] == font)
+            entry = _CompiledFont(font_data, self.case, self.fallback, self._segment_cache_size)
+            compiled[font] = entry
+        return entry.with_layout(layout)
 
-    def _add_border(self, text: str, border_char: str, padding: int = 1) -> str:
+    @staticmethod
+    def _add_border(text: str, border_char, padding: int = 1, widths: Optional[List[int]] = None) -> str:
         """
         Add a border around the ASCII art text.
 
         Args:
             text (str): The ASCII art string to be bordered.
-            border_char (str): The character to use for the border.
+            border_char (str | BorderStyle): The character to use for the border, the name of a style in
+                ``BORDER_STYLES``, or a ``BorderStyle``.
             padding (int, optional): Number of spaces to insert between the text and the border. Defaults to 1.
+            widths (List[int], optional): Visible width of each line of ``text``, when already known. Defaults to
+                None (measured by stripping ANSI escape codes).
 
         Returns:
             str: ASCII art string with the border applied.
@@ -118,121 +838,1494 @@ class ASCIIGenerator:
         if not text.strip():
             return text
         lines = text.split("\n")
-        ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-        max_width = max(len(ansi_escape.sub("", line)) for line in lines)
-        inner_width = max_width + 2 * padding
-        border_width = inner_width + 2
-
-        top = border_char * border_width
-        bottom = border_char * border_width
-        bordered_lines = [top]
-
-        for _ in range(padding):
-            bordered_lines.append(border_char + " " * inner_width + border_char)
-
-        for line in lines:
-            clean_line = ansi_escape.sub("", line)
-            right_pad = " " * (inner_width - padding - len(clean_line))
-            bordered_lines.append(border_char + " " * padding + line + right_pad + border_char)
+        if widths is None:
+            widths = [len(_strip_ansi(line)) for line in lines]
+        return "\n".join(_border_lines(lines, widths, _resolve_border(border_char), padding))
 
-        for _ in range(padding):
-            bordered_lines.append(border_char + " " * inner_width + border_char)
-
-        bordered_lines.append(bottom)
-        return "\n".join(bordered_lines)
-
-    def generate(self, text: str, font: str = "simple", color: str = None, border: str = None) -> str:
+    def generate(
+        self,
+        text: str,
+        font: str = "simple",
+        color: str = None,
+        border: str = None,
+        width: Optional[int] = None,
+        align: str = "left",
+        backend: Optional[str] = None,
+        layout: str = "full",
+        line_spacing: int = _BAND_SPACING,
+    ) -> str:
         """
         Generate ASCII art for a given text with optional font, color, and border.
 
         Args:
-            text (str): The input string to convert into ASCII art (only uppercase A-Z and spaces supported).
+            text (str): The input string to convert into ASCII art. Letters are drawn in upper case, and accented
+                letters without a glyph of their own without their accents (see ``fallback`` and ``case``).
             font (str, optional): Font to use for ASCII art ("simple" or "block"). Defaults to "simple".
-            color (str, optional): Color name for output (see list_colors()). Defaults to None (no color).
-            border (str, optional): Character to use for surrounding border. Defaults to None (no border).
+            color (str, optional): Color name (see list_colors()) or specification such as "#ff8800", "red:blue" or
+                "white on blue" (see ``asciigenator.colors``). Defaults to None (no color).
+            border (str | BorderStyle, optional): Border character, or a style name from list_borders() such as
+                "single" or "double". Defaults to None (no border).
+            width (int, optional): Maximum output width in columns. Longer text is wrapped at word boundaries onto
+                several glyph bands. Defaults to None (single band).
+            align (str, optional): Alignment of wrapped bands: "left", "center" or "right". Defaults to "left".
+            backend (str, optional): Rendering backend: "python", "numpy" or "auto". The output is the same with
+                every backend. Defaults to None (the generator's ``backend``).
+            layout (str, optional): "full" draws every glyph at full width with one column of spacing, "kerning"
+                moves glyphs together until they touch and "smush" also merges their touching edges (see
+                ``asciigenator.kerning``). Defaults to "full".
+            line_spacing (int, optional): Blank rows between glyph bands: the lines of a text containing ``"\\n"``
+                and the bands of wrapped text. Defaults to 1.
 
         Returns:
             str: Formatted ASCII art string.
 
         Raises:
-            ValueError: If the specified font or color is not available.
+            ValueError: If the specified font, color or alignment is not available, width is not positive, or the
+                fallback policy is "raise" and the font cannot draw a character of the text.
         """
-        if font not in self.fonts:
-            raise ValueError(f"Font '{font}' not available.")
-        if color and color not in self.colors:
-            raise ValueError(f"Color '{color}' not available.")
-
-        text = text.upper()
-        font_data = self.fonts[font]
-
-        # Determine height
-        sample_char = next((c for c in text if c in font_data), " ")
-        height = len(font_data.get(sample_char, font_data[" "]))
-
-        lines = []
-        for i in range(height):
-            line = ""
-            for char in text:
-                char_lines = font_data.get(char, font_data.get(" ", [" " * len(font_data[sample_char][0])]))
-                line += char_lines[i] if i < len(char_lines) else " " * len(char_lines[0])
-                line += " "  # << add this space between letters
-            lines.append(line.rstrip())
-
-        result = "\n".join(lines)
-
-        if color:
-            result = f"{self.colors[color]}{result}{self.reset}"
-        if border:
-            result = self._add_border(result, border)
-        return result
+        profiler = self.profiler
+        if profiler is not None:
+            start = time.perf_counter()
+        self._check_style(font, color, width, align, backend, layout, line_spacing)
+        compiled = self._compile_font(font, layout)
+        prefix, suffix, gradient = self._color_codes(color)
+        backend = backend or self.backend
+        args = (text, font, color, border, width, align, backend, compiled, prefix, suffix, gradient, line_spacing)
+        if profiler is not None:
+            return self._render_profiled(profiler, *args, validated=time.perf_counter() - start)
+        return self._render(*args)
 
-    def list_fonts(self) -> List[str]:
+    def compile(
+        self,
+        font: str = "simple",
+        color: str = None,
+        border: str = None,
+        width: Optional[int] = None,
+        align: str = "left",
+        backend: Optional[str] = None,
+        layout: str = "full",
+        line_spacing: int = _BAND_SPACING,
+    ) -> "Renderer":
         """
-        Get list of available fonts.
+        Check a combination of style options once and return a renderer that draws texts in that style.
+
+        The renderer holds the compiled glyph tables, color escape codes and border rows, so each
+        ``Renderer.render(text)`` call skips the checks and lookups ``generate`` does (see ``asciigenator.renderer``).
+
+        Args:
+            font (str, optional): Font to use. Defaults to "simple".
+            color (str, optional): Color name or specification. Defaults to None (no color).
+            border (str | BorderStyle, optional): Border character or style. Defaults to None (no border).
+            width (int, optional): Maximum output width in columns. Defaults to None (no wrapping).
+            align (str, optional): Alignment of lines and wrapped bands. Defaults to "left".
+            backend (str, optional): Rendering backend (see ``generate()``). Defaults to None.
+            layout (str, optional): Glyph layout (see ``generate()``). Defaults to "full".
+            line_spacing (int, optional): Blank rows between glyph bands (see ``generate()``). Defaults to 1.
 
         Returns:
-            List[str]: Names of available fonts.
+            Renderer: Immutable renderer for the style, with the same output as ``generate``.
+
+        Raises:
+            ValueError: If the specified font, color or alignment is not available, or width is not positive.
         """
-        return list(self.fonts.keys())
+        from .renderer import Renderer
 
-    def list_colors(self) -> List[str]:
+        self._check_style(font, color, width, align, backend, layout, line_spacing)
+        compiled = self._compile_font(font, layout)
+        prefix, suffix, gradient = self._color_codes(color)
+        backend = backend or self.backend
+        return Renderer(
+            self, font, color, border, width, align, backend, layout, line_spacing, compiled, prefix, suffix, gradient
+        )
+
+    def generate_many(
+        self,
+        texts: Iterable[str],
+        font: str = "simple",
+        color: str = None,
+        border: str = None,
+        *,
+        workers: Optional[int] = None,
+        executor=None,
+        chunksize: int = 256,
+        width: Optional[int] = None,
+        align: str = "left",
+        backend: Optional[str] = None,
+        layout: str = "full",
+        line_spacing: int = _BAND_SPACING,
+    ) -> List[str]:
         """
-        Get list of available colors.
+        Generate ASCII art for many texts sharing the same font, color, and border.
+
+        Args:
+            texts (Iterable[str]): Input strings to convert.
+            font (str, optional): Font to use for ASCII art. Defaults to "simple".
+            color (str, optional): Color name (see list_colors()) or specification such as "#ff8800", "red:blue" or
+                "white on blue" (see ``asciigenator.colors``). Defaults to None (no color).
+            border (str | BorderStyle, optional): Border character, or a style name from list_borders() such as
+                "single" or "double". Defaults to None (no border).
+            workers (int, optional): Number of worker processes to spread the batch across. Defaults to None
+                (render in the calling thread).
+            executor (concurrent.futures.Executor, optional): Executor to submit chunks to instead of creating a
+                process pool. It is not shut down afterwards. Defaults to None.
+            chunksize (int, optional): Number of texts sent to a worker at a time. Defaults to 256.
+            width (int, optional): Maximum output width in columns. Longer text is wrapped at word boundaries onto
+                several glyph bands. Defaults to None (single band).
+            align (str, optional): Alignment of wrapped bands: "left", "center" or "right". Defaults to "left".
+            backend (str, optional): Rendering backend (see ``generate()``). Defaults to None.
+            layout (str, optional): Glyph layout (see ``generate()``). Defaults to "full".
+            line_spacing (int, optional): Blank rows between glyph bands (see ``generate()``). Defaults to 1.
 
         Returns:
-            List[str]: Names of available colors.
+            List[str]: Formatted ASCII art strings, in the same order as ``texts``.
+
+        Raises:
+            ValueError: If the specified font, color or alignment is not available, or width is not positive.
         """
-        return list(self.colors.keys())
+        return list(
+            self.iter_generate(
+                texts,
+                font,
+                color,
+                border,
+                workers=workers,
+                executor=executor,
+                chunksize=chunksize,
+                width=width,
+                align=align,
+                backend=backend,
+                layout=layout,
+                line_spacing=line_spacing,
+            )
+        )
 
+    def iter_generate(
+        self,
+        texts: Iterable[str],
+        font: str = "simple",
+        color: str = None,
+        border: str = None,
+        *,
+        workers: Optional[int] = None,
+        executor=None,
+        chunksize: int = 256,
+        width: Optional[int] = None,
+        align: str = "left",
+        backend: Optional[str] = None,
+        layout: str = "full",
+        line_spacing: int = _BAND_SPACING,
+    ) -> Iterator[str]:
+        """
+        Lazily generate ASCII art for many texts, yielding each result in input order as soon as it is ready.
 
-# Global instance
-_generator = ASCIIGenerator()
+        ``texts`` is consumed incrementally and only a bounded number of chunks is in flight at once, so memory
+        stays flat on very large batches. Font and color are validated immediately, before iteration starts.
 
+        Args:
+            texts (Iterable[str]): Input strings to convert.
+            font (str, optional): Font to use for ASCII art. Defaults to "simple".
+            color (str, optional): Color name (see list_colors()) or specification such as "#ff8800", "red:blue" or
+                "white on blue" (see ``asciigenator.colors``). Defaults to None (no color).
+            border (str | BorderStyle, optional): Border character, or a style name from list_borders() such as
+                "single" or "double". Defaults to None (no border).
+            workers (int, optional): Number of worker processes to spread the batch across. Defaults to None
+                (render in the calling thread).
+            executor (concurrent.futures.Executor, optional): Executor to submit chunks to instead of creating a
+                process pool. It is not shut down afterwards. Defaults to None.
+            chunksize (int, optional): Number of texts sent to a worker at a time. Defaults to 256.
+            width (int, optional): Maximum output width in columns. Longer text is wrapped at word boundaries onto
+                several glyph bands. Defaults to None (single band).
+            align (str, optional): Alignment of wrapped bands: "left", "center" or "right". Defaults to "left".
+            backend (str, optional): Rendering backend (see ``generate()``). Defaults to None.
+            layout (str, optional): Glyph layout (see ``generate()``). Defaults to "full".
+            line_spacing (int, optional): Blank rows between glyph bands (see ``generate()``). Defaults to 1.
 
-def generate(text: str, font: str = "simple", color: str = None, border: str = None) -> str:
-    """
-    Generate ASCII art text using the global ASCIIGenerator instance.
+        Returns:
+            Iterator[str]: Formatted ASCII art strings, in the same order as ``texts``.
 
-    Args:
-        text (str): Input string (A-Z and space supported).
-        font (str, optional): Font name ("simple" or "block"). Defaults to "simple".
-        color (str, optional): Output color (see list_colors()). Defaults to None.
-        border (str, optional): Border character. Defaults to None.
+        Raises:
+            ValueError: If the specified font, color or alignment is not available, or width is not positive.
+        """
+        self._check_style(font, color, width, align, backend, layout, line_spacing)
+        compiled = self._compile_font(font, layout)
+        prefix, suffix, gradient = self._color_codes(color)
+        backend = backend or self.backend
+        if executor is None and not workers:
+            args = (font, color, border, width, align, backend, compiled, prefix, suffix, gradient, line_spacing)
+            return (self._render(text, *args) for text in texts)
+        from functools import partial
 
-    Returns:
-        str: Generated ASCII art string.
-    """
-    return _generator.generate(text, font, color, border)
+        job = partial(_render_batch, compiled, prefix, suffix, border, width, align, backend, gradient, line_spacing)
+        return _iter_parallel(job, texts, workers, executor, chunksize)
 
+    def iter_lines(
+        self,
+        text: str,
+        font: str = "simple",
+        color: str = None,
+        border: str = None,
+        width: Optional[int] = None,
+        align: str = "left",
+        backend: Optional[str] = None,
+        layout: str = "full",
+        line_spacing: int = _BAND_SPACING,
+    ) -> Iterator[str]:
+        """
+        Generate ASCII art one finished output line at a time.
 
-def list_fonts() -> List[str]:
-    """
+        Joining the yielded lines with ``"\\n"`` gives exactly the result of ``generate``, but only one glyph row is
+        held in memory at a time. Font and color are validated immediately, before iteration starts. The render
+        cache is not used.
+
+        Args:
+            text (str): The input string to convert into ASCII art.
+            font (str, optional): Font to use for ASCII art. Defaults to "simple".
+            color (str, optional): Color name (see list_colors()) or specification such as "#ff8800", "red:blue" or
+                "white on blue" (see ``asciigenator.colors``). Defaults to None (no color).
+            border (str | BorderStyle, optional): Border character, or a style name from list_borders() such as
+                "single" or "double". Defaults to None (no border).
+            width (int, optional): Maximum output width in columns. Longer text is wrapped at word boundaries onto
+                several glyph bands. Defaults to None (single band).
+            align (str, optional): Alignment of wrapped bands: "left", "center" or "right". Defaults to "left".
+            backend (str, optional): Rendering backend (see ``generate()``). Defaults to None.
+            layout (str, optional): Glyph layout (see ``generate()``). Defaults to "full".
+            line_spacing (int, optional): Blank rows between glyph bands (see ``generate()``). Defaults to 1.
+
+        Returns:
+            Iterator[str]: Output lines without line terminators.
+
+        Raises:
+            ValueError: If the specified font, color or alignment is not available, or width is not positive.
+        """
+        self._check_style(font, color, width, align, backend, layout, line_spacing)
+        prefix, suffix, gradient = self._color_codes(color)
+        compiled = self._compile_font(font, layout)
+        backend = backend or self.backend
+        return _iter_lines(text, compiled, prefix, suffix, border, width, align, backend, gradient, line_spacing)
+
+    def render_to(
+        self,
+        stream,
+        text: str,
+        font: str = "simple",
+        color: str = None,
+        border: str = None,
+        end: str = "",
+        encoding: str = "utf-8",
+        width: Optional[int] = None,
+        align: str = "left",
+        backend: Optional[str] = None,
+        layout: str = "full",
+        line_spacing: int = _BAND_SPACING,
+    ) -> None:
+        """
+        Write ASCII art line by line to a text or binary file object.
+
+        Args:
+            stream: Writable file object. Binary streams receive the output encoded with ``encoding``.
+            text (str): The input string to convert into ASCII art.
+            font (str, optional): Font to use for ASCII art. Defaults to "simple".
+            color (str, optional): Color name (see list_colors()) or specification such as "#ff8800", "red:blue" or
+                "white on blue" (see ``asciigenator.colors``). Defaults to None (no color).
+            border (str | BorderStyle, optional): Border character, or a style name from list_borders() such as
+                "single" or "double". Defaults to None (no border).
+            end (str, optional): String written after the last line. Defaults to "".
+            encoding (str, optional): Encoding used for binary streams. Defaults to "utf-8".
+            width (int, optional): Maximum output width in columns. Longer text is wrapped at word boundaries onto
+                several glyph bands. Defaults to None (single band).
+            align (str, optional): Alignment of wrapped bands: "left", "center" or "right". Defaults to "left".
+            backend (str, optional): Rendering backend (see ``generate()``). Defaults to None.
+            layout (str, optional): Glyph layout (see ``generate()``). Defaults to "full".
+            line_spacing (int, optional): Blank rows between glyph bands (see ``generate()``). Defaults to 1.
+
+        Raises:
+            ValueError: If the specified font, color or alignment is not available, or width is not positive.
+        """
+        lines = self.iter_lines(text, font, color, border, width, align, backend, layout, line_spacing)
+        if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)) or "b" in getattr(stream, "mode", ""):
+            stream = _EncodingWriter(stream.write, encoding)
+        separator = ""
+        for line in lines:
+            stream.write(separator)
+            stream.write(line)
+            separator = "\n"
+        stream.write(end)
+
+    def iter_export(
+        self,
+        text: str,
+        format: str = "html",
+        font: str = "simple",
+        color: str = None,
+        border: str = None,
+        width: Optional[int] = None,
+        align: str = "left",
+        backend: Optional[str] = None,
+        layout: str = "full",
+        line_spacing: int = _BAND_SPACING,
+    ) -> Iterator[Union[str, bytes]]:
+        """
+        Render ASCII art in an output format, one chunk at a time.
+
+        Only one glyph row is held in memory at a time. Arguments are validated immediately, before iteration
+        starts. The render cache is not used.
+
+        Args:
+            text (str): The input string to convert into ASCII art.
+            format (str, optional): "text" (no color codes), "ansi" (as ``generate``), "html", "svg" or "bitmap"
+                (see ``asciigenator.formats``). Defaults to "html".
+            font (str, optional): Font to use for ASCII art. Defaults to "simple".
+            color (str, optional): Color name (see list_colors()) or specification such as "#ff8800", "red:blue" or
+                "white on blue" (see ``asciigenator.colors``). Ignored by "text". Defaults to None (no color).
+            border (str | BorderStyle, optional): Border character, or a style name from list_borders() such as
+                "single" or "double". Defaults to None (no border).
+            width (int, optional): Maximum output width in columns. Longer text is wrapped at word boundaries onto
+                several glyph bands. Defaults to None (single band).
+            align (str, optional): Alignment of wrapped bands: "left", "center" or "right". Defaults to "left".
+            backend (str, optional): Rendering backend (see ``generate()``). Defaults to None.
+            layout (str, optional): Glyph layout (see ``generate()``). Defaults to "full".
+            line_spacing (int, optional): Blank rows between glyph bands (see ``generate()``). Defaults to 1.
+
+        Returns:
+            Iterator[Union[str, bytes]]: Strings whose concatenation is the output, or for "bitmap" one ``bytes``
+            row of cells at a time.
+
+        Raises:
+            ValueError: If the specified format, font, color or alignment is not available, or width is not positive.
+        """
+        from .formats import FORMATS, write
+
+        if format not in FORMATS:
+            raise ValueError(f"Format '{format}' not available.")
+        if format in ("text", "ansi"):
+            color = color if format == "ansi" else None
+            return _separated(self.iter_lines(text, font, color, border, width, align, backend, layout, line_spacing))
+        self._check_style(font, color, width, align, backend, layout, line_spacing)
+        palette = self._palette(color) if color else None
+        compiled = self._compile_font(font, layout)
+        art = _art(text, compiled, palette, border, width, align, backend or self.backend, line_spacing)
+        return write(art, format)
+
+    def export(
+        self,
+        text: str,
+        format: str = "html",
+        font: str = "simple",
+        color: str = None,
+        border: str = None,
+        width: Optional[int] = None,
+        align: str = "left",
+        backend: Optional[str] = None,
+        layout: str = "full",
+        line_spacing: int = _BAND_SPACING,
+    ) -> Union[str, "Bitmap"]:
+        """
+        Render ASCII art in an output format.
+
+        Args:
+            text (str): The input string to convert into ASCII art.
+            format (str, optional): "text" (no color codes), "ansi" (as ``generate``), "html", "svg" or "bitmap"
+                (see ``asciigenator.formats``). Defaults to "html".
+            font (str, optional): Font to use for ASCII art. Defaults to "simple".
+            color (str, optional): Color name (see list_colors()) or specification such as "#ff8800", "red:blue" or
+                "white on blue" (see ``asciigenator.colors``). Ignored by "text". Defaults to None (no color).
+            border (str | BorderStyle, optional): Border character, or a style name from list_borders() such as
+                "single" or "double". Defaults to None (no border).
+            width (int, optional): Maximum output width in columns. Longer text is wrapped at word boundaries onto
+                several glyph bands. Defaults to None (single band).
+            align (str, optional): Alignment of wrapped bands: "left", "center" or "right". Defaults to "left".
+            backend (str, optional): Rendering backend (see ``generate()``). Defaults to None.
+            layout (str, optional): Glyph layout (see ``generate()``). Defaults to "full".
+            line_spacing (int, optional): Blank rows between glyph bands (see ``generate()``). Defaults to 1.
+
+        Returns:
+            Union[str, Bitmap]: The document, or for "bitmap" a ``Bitmap`` with one byte per cell.
+
+        Raises:
+            ValueError: If the specified format, font, color or alignment is not available, or width is not positive.
+        """
+        chunks = self.iter_export(text, format, font, color, border, width, align, backend, layout, line_spacing)
+        if format != "bitmap":
+            return "".join(chunks)
+        from .formats import Bitmap
+
+        rows = list(chunks)
+        return Bitmap(len(rows[0]), len(rows), bytearray().join(rows))
+
+    def _check_style(
+        self,
+        font: str,
+        color: Optional[str],
+        width: Optional[int] = None,
+        align: str = "left",
+        backend: Optional[str] = None,
+        layout: str = "full",
+        line_spacing: int = _BAND_SPACING,
+    ) -> None:
+        """
+        Raise ValueError if the font, color, alignment, backend or layout is not available, the width is not positive
+        or the line spacing is negative.
+        """
+        if font not in self.fonts:
+            raise ValueError(f"Font '{font}' not available.")
+        if color and color not in self.colors:
+            self._palette(color)
+        if align not in ALIGNMENTS:
+            raise ValueError(f"Alignment '{align}' not available.")
+        if width is not None and width < 1:
+            raise ValueError(f"Width must be positive, got {width}.")
+        if backend is not None:
+            self._check_backend(backend)
+        if layout not in LAYOUTS:
+            raise ValueError(f"Layout '{layout}' not available.")
+        if line_spacing < 0:
+            raise ValueError(f"Line spacing must not be negative, got {line_spacing}.")
+
+    @staticmethod
+    def _check_backend(backend: str) -> None:
+        """Raise ValueError if the backend is unknown, or is "numpy" and NumPy is not installed."""
+        if backend not in BACKENDS or (backend == "numpy" and not _numpy_available()):
+            raise ValueError(f"Backend '{backend}' not available.")
+
+    def _palette(self, color: str) -> "Palette":
+        """Parse a color specification, once per generator. Raises ValueError if it is not valid."""
+        palettes = self._palettes
+        palette = palettes.get(color)
+        if palette is None:
+            from .colors import parse_color
+
+            palette = parse_color(color, self.colors)
+            palettes.put(color, palette)
+        return palette
+
+    def _color_codes(self, color: Optional[str]) -> Tuple[str, str, Optional["Gradient"]]:
+        """Return the escape codes written before and after the art for ``color``, and the gradient to paint."""
+        if not color:
+            return "", "", None
+        code = self.colors.get(color)
+        if code is not None:
+            return code, self.reset, None
+        palette = self._palette(color)
+        prefix, gradient = palette.prefix, palette.gradient
+        return prefix, self.reset if prefix else "", gradient
+
+    def _render(
+        self,
+        text: str,
+        font: str,
+        color: Optional[str],
+        border: Optional[str],
+        width: Optional[int],
+        align: str,
+        backend: str,
+        compiled: "_CompiledFont",
+        prefix: str,
+        suffix: str,
+        gradient: Optional["Gradient"] = None,
+        spacing: int = _BAND_SPACING,
+        frames: Optional[Dict[int, Tuple[str, str, str, str]]] = None,
+    ) -> str:
+        """
+        Render already validated arguments, going through the render cache when it is enabled. ``frames`` is a memo
+        of border rows (see ``_border_lines``).
+        """
+        if self.profiler is not None:
+            args = (text, font, color, border, width, align, backend, compiled, prefix, suffix, gradient, spacing, frames)
+            return self._render_profiled(self.profiler, *args)
+        args = (compiled, prefix, suffix, border, width, align, backend, gradient, spacing, None, frames)
+        cache = self._cache
+        if cache is None:
+            return _render_text(text, *args)
+        # The compiled font and the color's escape code are part of the key, so a result rendered by another thread
+        # with a font or color that has since been replaced is never returned.
+        key = (text, font, color, border, width, align, compiled, prefix, spacing)
+        result = cache.get(key)
+        if result is None:
+            result = _render_text(text, *args)
+            cache.put(key, result)
+        return result
+
+    def _render_profiled(
+        self,
+        profiler: "Profiler",
+        text: str,
+        font: str,
+        color: Optional[str],
+        border: Optional[str],
+        width: Optional[int],
+        align: str,
+        backend: str,
+        compiled: "_CompiledFont",
+        prefix: str,
+        suffix: str,
+        gradient: Optional["Gradient"] = None,
+        spacing: int = _BAND_SPACING,
+        frames: Optional[Dict[int, Tuple[str, str, str, str]]] = None,
+        validated: float = 0.0,
+    ) -> str:
+        """Render like ``_render``, timing every stage and recording the render with ``profiler``."""
+        from .profiling import RenderSample
+
+        clock = time.perf_counter
+        stages = {"validate": validated, "cache": 0.0, "layout": 0.0, "glyphs": 0.0, "color": 0.0, "border": 0.0}
+        cache = self._cache
+        cache_hit = result = None
+        if cache is not None:
+            start = clock()
+            key = (text, font, color, border, width, align, compiled, prefix, spacing)
+            result = cache.get(key)
+            cache_hit = result is not None
+            stages["cache"] = clock() - start
+        fallbacks = 0
+        if result is None:
+            marks = [clock()]
+            args = (text, compiled, prefix, suffix, border, width, align, backend, gradient, spacing, marks, frames)
+            result = _render_text(*args)
+            for stage, start, end in zip(("layout", "glyphs", "color", "border"), marks, marks[1:]):
+                stages[stage] = end - start
+            if gradient is None:
+                stages["color"] = 0.0
+            if compiled.fallbacks:
+                fallbacks = sum(map(compiled.fallbacks.__contains__, map(ord, text)))
+            if cache is not None:
+                start = clock()
+                cache.put(key, result)
+                stages["cache"] += clock() - start
+        profiler.record(RenderSample(stages, len(text), fallbacks, cache_hit))
+        return result
+
+    def enable_profiling(self, profiler: Optional["Profiler"] = None) -> "Profiler":
+        """
+        Start timing the stages of ``generate``, ``generate_many`` and ``iter_generate`` (see
+        ``asciigenator.profiling``). Renders done in worker processes, streamed or exported are not profiled.
+
+        Args:
+            profiler (Profiler, optional): Profiler to record into, e.g. one shared between generators. Defaults to
+                None (keep the current profiler, or create one).
+
+        Returns:
+            Profiler: The profiler now attached to the generator.
+        """
+        if profiler is None:
+            from .profiling import Profiler
+
+            profiler = self.profiler if self.profiler is not None else Profiler()
+        self.profiler = profiler
+        return profiler
+
+    def disable_profiling(self) -> Optional["Profiler"]:
+        """
+        Stop profiling.
+
+        Returns:
+            Optional[Profiler]: The profiler that was attached, with its totals, or None.
+        """
+        profiler, self.profiler = self.profiler, None
+        return profiler
+
+    def list_fonts(self) -> List[str]:
+        """
+        Get list of available fonts.
+
+        Returns:
+            List[str]: Names of available fonts.
+        """
+        return list(self.fonts.keys())
+
+    def list_colors(self) -> List[str]:
+        """
+        Get list of available colors.
+
+        Returns:
+            List[str]: Names of available colors.
+        """
+        return list(self.colors.keys())
+
+    def validate_font(self, font: str) -> List[GlyphIssue]:
+        """
+        Report the malformed glyphs of a font, loading it if needed.
+
+        Fonts are normalized when they are loaded: ragged rows are padded to the glyph's width, short glyphs get
+        blank rows below, and glyphs that cannot be rendered are dropped. This lists what was fixed or dropped.
+
+        Args:
+            font (str): Font name.
+
+        Returns:
+            List[GlyphIssue]: The character and a description of each problem, empty if the font is well formed.
+
+        Raises:
+            ValueError: If the specified font is not available.
+        """
+        if font not in self.fonts:
+            raise ValueError(f"Font '{font}' not available.")
+        return list(self.fonts[font].issues)
+
+    def font_memory(self) -> Dict[str, int]:
+        """
+        Report the memory used by the glyph storage of each loaded font.
+
+        Fonts that have not been used yet are not loaded and not reported.
+
+        Returns:
+            Dict[str, int]: Approximate size in bytes of each loaded font.
+        """
+        return {name: table.nbytes for name, table in self.fonts.loaded().items()}
+
+    def list_borders(self) -> List[str]:
+        """
+        Get list of named border styles.
+
+        Returns:
+            List[str]: Names of available border styles.
+        """
+        return list(BORDER_STYLES.keys())
+
+
+def _wrap(text: str, compiled: _CompiledFont, width: int) -> List[str]:
+    """
+    Greedily split ``text`` into bands no wider than ``width`` columns.
+
+    Words are kept whole where they fit and broken between characters where they do not. Widths come from the
+    compiled glyph widths, so the whole pass is linear in the length of ``text``. Kerned and smushed bands are never
+    wider than their full width, so they fit as well.
+    """
+    advances = compiled.advances
+    # Glyph advances include the spacing column, so a band fits when its summed advances reach width + 1.
+    capacity = width + 1
+    space = advances[32]
+    bands = []
+    band, used = [], 0
+    for word in text.split(" "):
+        word_width = sum(map(advances.__getitem__, map(ord, word)))
+        if band and used + space + word_width <= capacity:
+            band.append(word)
+            used += space + word_width
+            continue
+        if band:
+            bands.append(" ".join(band))
+            band, used = [], 0
+            if not word:
+                # Drop the extra spaces that fall on a line break.
+                continue
+        while word_width > capacity and len(word) > 1:
+            cut, cut_width = 0, 0
+            while cut < len(word) and (cut == 0 or cut_width + advances[ord(word[cut])] <= capacity):
+                cut_width += advances[ord(word[cut])]
+                cut += 1
+            bands.append(word[:cut])
+            word, word_width = word[cut:], word_width - cut_width
+        band, used = [word], word_width
+    bands.append(" ".join(band))
+    return bands
+
+
+def _layout(text: str, compiled: _CompiledFont, width: Optional[int], align: str) -> List[Tuple[str, int]]:
+    """
+    Lay out ``text`` into glyph bands, one or more per line of the text.
+
+    Args:
+        text (str): Input text. Every ``"\n"`` starts a new band.
+        compiled (_CompiledFont): Compiled font used for glyph widths.
+        width (int, optional): Maximum band width in columns, or None to keep each line on one band.
+        align (str): Alignment of narrower bands against the widest one ("left", "center" or "right").
+
+    Returns:
+        List[Tuple[str, int]]: Text of each band and the number of columns it is indented by.
+    """
+    if "\n" in text:
+        lines = text.split("\n")
+        bands = lines if width is None else [band for line in lines for band in _wrap(line, compiled, width)]
+    elif width is None:
+        return [(text, 0)]
+    else:
+        bands = _wrap(text, compiled, width)
+    if align == "left" or len(bands) == 1:
+        return [(band, 0) for band in bands]
+    widths = [compiled.text_width(band) for band in bands]
+    block_width = max(widths)
+    if align == "right":
+        return [(band, block_width - band_width) for band, band_width in zip(bands, widths)]
+    return [(band, (block_width - band_width) // 2) for band, band_width in zip(bands, widths)]
+
+
+def _numpy_available() -> bool:
+    """Whether NumPy can be imported, checked without importing it."""
+    available = globals().get("_HAS_NUMPY")
+    if available is None:
+        from importlib.util import find_spec
+
+        available = globals()["_HAS_NUMPY"] = find_spec("numpy") is not None
+    return available
+
+
+def _glyph_array(compiled: _CompiledFont, band: str, backend: str) -> Optional["GlyphArray"]:
+    """Return the NumPy glyph array to render ``band`` with, or None to use the pure-Python path."""
+    if backend == "python" or (backend == "auto" and (len(band) < _VECTORIZE_MIN_CHARS or not _numpy_available())):
+        return None
+    array = compiled.array
+    if array is None:
+        from .vectorized import GlyphArray
+
+        array = compiled.array = GlyphArray(compiled)
+    return array if array.supported else None
+
+
+def _band_rows(band: str, indent: int, compiled: _CompiledFont, backend: str = "python") -> Iterable[str]:
+    """The undecorated glyph rows of one band, ``compiled.height`` of them."""
+    pad = " " * indent
+    array = _glyph_array(compiled, band, backend) if compiled.composer is None else None
+    lines = None
+    if array is not None:
+        # Bands with characters the font does not define directly are resolved by the compiled tables.
+        lines = array.rows(band.upper() if compiled.case == "upper" else band)
+    if compiled.composer is not None:
+        lines = [line.rstrip() for line in compiled.composer.compose(band).rows]
+    elif lines is None and compiled.segments is not None and len(band) >= _SEGMENT_MIN_CHARS:
+        lines = [line.rstrip() for line in compiled.segment_rows(band)]
+    elif lines is None:
+        lines = (band.translate(row).rstrip() for row in compiled.rows)
+    if not pad:
+        return lines
+    return [pad + line if line else line for line in lines]
+
+
+def _glyph_rows(
+    bands: List[Tuple[str, int]], compiled: _CompiledFont, backend: str = "python", spacing: int = _BAND_SPACING
+) -> Iterator[str]:
+    """Yield the undecorated glyph rows of laid out bands, with ``spacing`` blank rows between bands."""
+    for n, (band, indent) in enumerate(bands):
+        if n:
+            for _ in range(spacing):
+                yield ""
+        yield from _band_rows(band, indent, compiled, backend)
+
+
+def _canvas(
+    bands: List[Tuple[str, int]], compiled: _CompiledFont, backend: str = "python", spacing: int = _BAND_SPACING
+) -> List[str]:
+    """
+    The undecorated glyph rows of laid out bands as one list.
+
+    The list is allocated up front with the blank rows between bands already in place, and the rows of every band
+    are assigned into it as one slice.
+    """
+    height = compiled.height
+    canvas = [""] * (height * len(bands) + spacing * (len(bands) - 1))
+    for n, (band, indent) in enumerate(bands):
+        start = n * (height + spacing)
+        canvas[start : start + height] = _band_rows(band, indent, compiled, backend)
+    return canvas
+
+
+def _gradient_runs(
+    bands: List[Tuple[str, int]],
+    compiled: _CompiledFont,
+    gradient: "Gradient",
+    rgb: bool = False,
+    spacing: int = _BAND_SPACING,
+) -> Iterator[Sequence[Tuple[int, int, object]]]:
+    """
+    Column runs of a gradient for every undecorated glyph row of laid out bands.
+
+    Args:
+        bands (List[Tuple[str, int]]): Laid out bands.
+        compiled (_CompiledFont): Compiled font used for glyph widths.
+        gradient (Gradient): Gradient to paint.
+        rgb (bool, optional): Give each run its RGB color instead of its escape sequence. Defaults to False.
+        spacing (int, optional): Blank rows between bands. Defaults to 1.
+
+    Returns:
+        Iterator[Sequence[Tuple[int, int, object]]]: Start column, end column and color of each run, per row.
+    """
+    colors = gradient.colors if rgb else gradient.escapes
+    rows = compiled.height * len(bands) + spacing * (len(bands) - 1)
+    if gradient.mode == "vertical":
+        return (((0, sys.maxsize, color),) for color in colors(rows))
+    if gradient.mode == "horizontal":
+        width = max(indent + compiled.text_width(band) for band, indent in bands)
+        if rgb:
+            from .colors import merge_runs
+
+            return itertools.repeat(merge_runs(colors(width)), rows)
+        return itertools.repeat(gradient.column_runs(width), rows)
+    # One color per character: the rows of each band get the column runs of its characters.
+    band_colors = iter(colors(sum(len(band) for band, _ in bands)))
+    advances = compiled.advances
+    band_runs = []
+    for band, start in bands:
+        if compiled.composer is not None:
+            spans = compiled.composer.compose(band).spans
+            band_runs.append([(start + a, start + b, next(band_colors)) for a, b in spans])
+            continue
+        runs = []
+        for code in map(ord, band):
+            runs.append((start, start + advances[code], next(band_colors)))
+            start += advances[code]
+        band_runs.append(runs)
+    gap = [()] * spacing
+    return iter([row for n, runs in enumerate(band_runs) for row in (gap if n else []) + [runs] * compiled.height])
+
+
+def _paint_gradient(
+    lines: Iterable[str],
+    bands: List[Tuple[str, int]],
+    compiled: _CompiledFont,
+    gradient: "Gradient",
+    spacing: int = _BAND_SPACING,
+) -> Iterator[str]:
+    """
+    Color undecorated glyph rows with a gradient as they are produced.
+
+    Args:
+        lines (Iterable[str]): Glyph rows of ``bands``, as produced by ``_glyph_rows``.
+        bands (List[Tuple[str, int]]): Laid out bands.
+        compiled (_CompiledFont): Compiled font used for glyph widths.
+        gradient (Gradient): Gradient to paint.
+        spacing (int, optional): Blank rows between bands. Defaults to 1.
+
+    Returns:
+        Iterator[str]: The rows with color codes.
+    """
+    from .colors import paint_row
+
+    return map(paint_row, lines, _gradient_runs(bands, compiled, gradient, spacing=spacing))
+
+
+def _resolve_border(border) -> Optional[BorderStyle]:
+    """Turn a border argument into a BorderStyle. Plain strings that are not style names are used for every edge."""
+    if not border or isinstance(border, BorderStyle):
+        return border or None
+    style = BORDER_STYLES.get(border)
+    if style is None:
+        style = BorderStyle(*[border] * len(BorderStyle._fields))
+    return style
+
+
+def _border_frame(style: BorderStyle, inner_width: int, padding: int = 1) -> Tuple[str, str, str, str]:
+    """The top row, left side with padding, blank padding row and bottom row of a border around ``inner_width`` columns."""
+    return (
+        style.top_left + style.top * inner_width + style.top_right,
+        style.left + " " * padding,
+        style.left + " " * inner_width + style.right,
+        style.bottom_left + style.bottom * inner_width + style.bottom_right,
+    )
+
+
+def _border_lines(
+    lines: Iterable[str],
+    widths: List[int],
+    style: BorderStyle,
+    padding: int = 1,
+    frames: Optional[Dict[int, Tuple[str, str, str, str]]] = None,
+) -> Iterator[str]:
+    """
+    Surround lines with a border as they are produced.
+
+    Args:
+        lines (Iterable[str]): Lines to border.
+        widths (List[int]): Visible width of each line, known before the lines themselves are produced.
+        style (BorderStyle): Border characters.
+        padding (int, optional): Number of spaces between the text and the border. Defaults to 1.
+        frames (Dict[int, Tuple[str, str, str, str]], optional): Memo of ``_border_frame`` results for this style
+            and padding by inner width, e.g. kept by a ``Renderer``. Defaults to None (built for every call).
+
+    Yields:
+        str: Bordered lines, without line terminators.
+    """
+    inner_width = max(widths) + 2 * padding
+    frame = frames.get(inner_width) if frames is not None else None
+    if frame is None:
+        frame = _border_frame(style, inner_width, padding)
+        if frames is not None and len(frames) < _FRAME_MEMO_SIZE:
+            frames[inner_width] = frame
+    top, left, blank, bottom = frame
+    right = style.right
+    yield top
+    for _ in range(padding):
+        yield blank
+    for line, width in zip(lines, widths):
+        yield left + line + " " * (inner_width - padding - width) + right
+    for _ in range(padding):
+        yield blank
+    yield bottom
+
+
+def _decorate(
+    lines: Iterable[str],
+    widths: List[int],
+    prefix: str,
+    suffix: str,
+    border: Optional[BorderStyle],
+    padding: int = 1,
+    frames: Optional[Dict[int, Tuple[str, str, str, str]]] = None,
+) -> Iterator[str]:
+    """
+    Apply color codes and an optional border to glyph rows as they are produced.
+
+    Args:
+        lines (Iterable[str]): Undecorated glyph rows.
+        widths (List[int]): Visible width of each row, known before the rows themselves are produced.
+        prefix (str): Escape code written before the first row.
+        suffix (str): Escape code written after the last row.
+        border (BorderStyle, optional): Border characters, or None for no border.
+        padding (int, optional): Number of spaces between the text and the border. Defaults to 1.
+        frames (Dict[int, Tuple[str, str, str, str]], optional): Memo of border rows by inner width (see
+            ``_border_lines``). Defaults to None.
+
+    Returns:
+        Iterator[str]: Finished output lines, without line terminators.
+    """
+    if not widths:
+        lines, widths = [""], [0]
+    if prefix or suffix:
+        lines = _colorize(lines, len(widths) - 1, prefix, suffix)
+    if not border or (not any(widths) and not (prefix + suffix).strip()):
+        return iter(lines)
+    if prefix or suffix:
+        widths = list(widths)
+        widths[0] += len(_strip_ansi(prefix))
+        widths[-1] += len(_strip_ansi(suffix))
+    return _border_lines(lines, widths, border, padding, frames)
+
+
+def _colorize(lines: Iterable[str], last: int, prefix: str, suffix: str) -> Iterator[str]:
+    """Open the color on the first line and reset it after the last one."""
+    for i, line in enumerate(lines):
+        if i == 0:
+            line = prefix + line
+        if i == last:
+            line += suffix
+        yield line
+
+
+def _iter_lines(
+    text: str,
+    compiled: _CompiledFont,
+    prefix: str,
+    suffix: str,
+    border,
+    width: Optional[int] = None,
+    align: str = "left",
+    backend: str = "python",
+    gradient: Optional["Gradient"] = None,
+    spacing: int = _BAND_SPACING,
+) -> Iterator[str]:
+    """Yield finished output lines for one text while holding only one glyph row in memory at a time."""
+    border = _resolve_border(border)
+    if border and width is not None:
+        width -= 2 + len(border.left) + len(border.right)
+    bands = _layout(text, compiled, width, align)
+    if border:
+        widths = [len(line) for line in _glyph_rows(bands, compiled, backend, spacing)]
+    else:
+        widths = [0] * (compiled.height * len(bands) + spacing * (len(bands) - 1))
+    lines = _glyph_rows(bands, compiled, backend, spacing)
+    if gradient is not None:
+        lines = _paint_gradient(lines, bands, compiled, gradient, spacing)
+    return _decorate(lines, widths, prefix, suffix, border)
+
+
+def _separated(lines: Iterable[str]) -> Iterator[str]:
+    """Yield lines with a line break before every line but the first."""
+    lines = iter(lines)
+    for line in lines:
+        yield line
+        break
+    for line in lines:
+        yield "\n" + line
+
+
+def _art(
+    text: str,
+    compiled: _CompiledFont,
+    palette: Optional["Palette"],
+    border,
+    width: Optional[int],
+    align: str,
+    backend: str,
+    spacing: int = _BAND_SPACING,
+) -> "Art":
+    """Lay out one text into the cell grid the HTML, SVG and bitmap formats are written from."""
+    from .formats import Art, spans
+
+    border = _resolve_border(border)
+    if border and width is not None:
+        width -= 2 + len(border.left) + len(border.right)
+    bands = _layout(text, compiled, width, align)
+    widths = [len(line) for line in _glyph_rows(bands, compiled, backend, spacing)]
+    lines = _glyph_rows(bands, compiled, backend, spacing)
+    if palette is not None and palette.gradient is not None:
+        rows = map(spans, lines, _gradient_runs(bands, compiled, palette.gradient, True, spacing))
+    else:
+        foreground = palette.foreground if palette is not None else None
+        rows = ([(line, foreground)] if line else [] for line in lines)
+    if not widths:
+        rows, widths = [[]], [0]
+    # Mirrors _decorate: empty art only gets a border when it is colored.
+    if not any(widths) and not (palette is not None and palette.prefix):
+        border = None
+    return Art(rows, widths, palette.background if palette is not None else None, border)
+
+
+def _render_text(
+    text: str,
+    compiled: _CompiledFont,
+    prefix: str,
+    suffix: str,
+    border,
+    width: Optional[int] = None,
+    align: str = "left",
+    backend: str = "python",
+    gradient: Optional["Gradient"] = None,
+    spacing: int = _BAND_SPACING,
+    marks: Optional[List[float]] = None,
+    frames: Optional[Dict[int, Tuple[str, str, str, str]]] = None,
+) -> str:
+    """
+    Render one text with compiled glyph tables, wrapping it in color codes and an optional border.
+
+    The glyph rows of all bands are rendered into one canvas (see ``_canvas``), whose row widths are known before
+    the single border pass.
+
+    ``marks``, when given, receives the ``time.perf_counter()`` readings after layout, glyph lookup, gradient painting
+    and decoration, for profiling. ``frames`` is a memo of border rows (see ``_border_lines``).
+    """
+    border = _resolve_border(border)
+    if border and width is not None:
+        width -= 2 + len(border.left) + len(border.right)
+    bands = _layout(text, compiled, width, align)
+    if marks is not None:
+        marks.append(time.perf_counter())
+    lines = _canvas(bands, compiled, backend, spacing)
+    widths = [len(line) for line in lines]
+    if marks is not None:
+        marks.append(time.perf_counter())
+    if gradient is not None:
+        lines = _paint_gradient(lines, bands, compiled, gradient, spacing)
+        if marks is not None:
+            lines = list(lines)
+    if marks is None:
+        return "\n".join(_decorate(lines, widths, prefix, suffix, border, 1, frames))
+    marks.append(time.perf_counter())
+    result = "\n".join(_decorate(lines, widths, prefix, suffix, border, 1, frames))
+    marks.append(time.perf_counter())
+    return result
+
+
+def _render_batch(
+    compiled: _CompiledFont,
+    prefix: str,
+    suffix: str,
+    border: Optional[str],
+    width: Optional[int],
+    align: str,
+    backend: str,
+    gradient: Optional["Gradient"],
+    spacing: int,
+    texts: List[str],
+) -> List[str]:
+    """Render a chunk of texts. Module level so it can be shipped to worker processes."""
+    return [_render_text(text, compiled, prefix, suffix, border, width, align, backend, gradient, spacing) for text in texts]
+
+
+def _iter_parallel(job, texts: Iterable[str], workers: Optional[int], executor, chunksize: int) -> Iterator[str]:
+    """Submit ``texts`` to an executor chunk by chunk and yield the results in input order."""
+    from collections import deque
+    from itertools import islice
+
+    own_executor = executor is None
+    if own_executor:
+        from concurrent.futures import ProcessPoolExecutor
+
+        executor = ProcessPoolExecutor(max_workers=workers)
+    # Keep a couple of chunks queued per worker so they never idle, without reading all input up front.
+    max_pending = 2 * (workers or getattr(executor, "_max_workers", None) or 4)
+    pending = deque()
+    texts = iter(texts)
+    try:
+        while True:
+            chunk = list(islice(texts, chunksize))
+            if not chunk:
+                break
+            pending.append(executor.submit(job, chunk))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if own_executor:
+            executor.shutdown(wait=True)
+
+
+def _get_generator() -> ASCIIGenerator:
+    """Return the global ASCIIGenerator instance, creating it on first use."""
+    generator = globals().get("_generator")
+    if generator is None:
+        # setdefault is atomic, so concurrent first calls still share one instance.
+        generator = globals().setdefault("_generator", ASCIIGenerator())
+    return generator
+
+
+def __getattr__(name: str):
+    # The global instance is created lazily; ``core._generator`` still resolves before first use.
+    if name == "_generator":
+        return _get_generator()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def generate(
+    text: str,
+    font: str = "simple",
+    color: str = None,
+    border: str = None,
+    width: Optional[int] = None,
+    align: str = "left",
+    backend: Optional[str] = None,
+    layout: str = "full",
+    line_spacing: int = _BAND_SPACING,
+) -> str:
+    """
+    Generate ASCII art text using the global ASCIIGenerator instance.
+
+    Args:
+        text (str): Input string (A-Z and space supported).
+        font (str, optional): Font name ("simple" or "block"). Defaults to "simple".
+        color (str, optional): Output color or gradient (see ``asciigenator.colors``). Defaults to None.
+        border (str | BorderStyle, optional): Border character or style name (see list_borders()). Defaults to None.
+        width (int, optional): Maximum output width in columns; longer text is wrapped. Defaults to None.
+        align (str, optional): Alignment of wrapped bands ("left", "center" or "right"). Defaults to "left".
+        backend (str, optional): Rendering backend (see ``ASCIIGenerator.generate()``). Defaults to None.
+        layout (str, optional): Glyph layout (see ``ASCIIGenerator.generate()``). Defaults to "full".
+        line_spacing (int, optional): Blank rows between glyph bands (see ``ASCIIGenerator.generate()``). Defaults to 1.
+
+    Returns:
+        str: Generated ASCII art string.
+    """
+    return _get_generator().generate(text, font, color, border, width, align, backend, layout, line_spacing)
+
+
+def generate_many(
+    texts: Iterable[str],
+    font: str = "simple",
+    color: str = None,
+    border: str = None,
+    *,
+    workers: Optional[int] = None,
+    executor=None,
+    chunksize: int = 256,
+    width: Optional[int] = None,
+    align: str = "left",
+    backend: Optional[str] = None,
+    layout: str = "full",
+    line_spacing: int = _BAND_SPACING,
+) -> List[str]:
+    """
+    Generate ASCII art for many texts using the global ASCIIGenerator instance.
+
+    Args:
+        texts (Iterable[str]): Input strings to convert.
+        font (str, optional): Font name. Defaults to "simple".
+        color (str, optional): Output color or gradient (see ``asciigenator.colors``). Defaults to None.
+        border (str | BorderStyle, optional): Border character or style name (see list_borders()). Defaults to None.
+        workers (int, optional): Number of worker processes. Defaults to None (render in the calling thread).
+        executor (concurrent.futures.Executor, optional): Executor to use instead of a new process pool.
+        chunksize (int, optional): Number of texts sent to a worker at a time. Defaults to 256.
+        width (int, optional): Maximum output width in columns; longer text is wrapped. Defaults to None.
+        align (str, optional): Alignment of wrapped bands ("left", "center" or "right"). Defaults to "left".
+        backend (str, optional): Rendering backend (see ``ASCIIGenerator.generate()``). Defaults to None.
+        layout (str, optional): Glyph layout (see ``ASCIIGenerator.generate()``). Defaults to "full".
+        line_spacing (int, optional): Blank rows between glyph bands (see ``ASCIIGenerator.generate()``). Defaults to 1.
+
+    Returns:
+        List[str]: Generated ASCII art strings, in input order.
+    """
+    return _get_generator().generate_many(
+        texts,
+        font,
+        color,
+        border,
+        workers=workers,
+        executor=executor,
+        chunksize=chunksize,
+        width=width,
+        align=align,
+        backend=backend,
+        layout=layout,
+        line_spacing=line_spacing,
+    )
+
+
+def iter_generate(
+    texts: Iterable[str],
+    font: str = "simple",
+    color: str = None,
+    border: str = None,
+    *,
+    workers: Optional[int] = None,
+    executor=None,
+    chunksize: int = 256,
+    width: Optional[int] = None,
+    align: str = "left",
+    backend: Optional[str] = None,
+    layout: str = "full",
+    line_spacing: int = _BAND_SPACING,
+) -> Iterator[str]:
+    """
+    Lazily generate ASCII art for many texts using the global ASCIIGenerator instance.
+
+    Args:
+        texts (Iterable[str]): Input strings to convert.
+        font (str, optional): Font name. Defaults to "simple".
+        color (str, optional): Output color or gradient (see ``asciigenator.colors``). Defaults to None.
+        border (str | BorderStyle, optional): Border character or style name (see list_borders()). Defaults to None.
+        workers (int, optional): Number of worker processes. Defaults to None (render in the calling thread).
+        executor (concurrent.futures.Executor, optional): Executor to use instead of a new process pool.
+        chunksize (int, optional): Number of texts sent to a worker at a time. Defaults to 256.
+        width (int, optional): Maximum output width in columns; longer text is wrapped. Defaults to None.
+        align (str, optional): Alignment of wrapped bands ("left", "center" or "right"). Defaults to "left".
+        backend (str, optional): Rendering backend (see ``ASCIIGenerator.generate()``). Defaults to None.
+        layout (str, optional): Glyph layout (see ``ASCIIGenerator.generate()``). Defaults to "full".
+        line_spacing (int, optional): Blank rows between glyph bands (see ``ASCIIGenerator.generate()``). Defaults to 1.
+
+    Returns:
+        Iterator[str]: Generated ASCII art strings, in input order.
+    """
+    return _get_generator().iter_generate(
+        texts,
+        font,
+        color,
+        border,
+        workers=workers,
+        executor=executor,
+        chunksize=chunksize,
+        width=width,
+        align=align,
+        backend=backend,
+        layout=layout,
+        line_spacing=line_spacing,
+    )
+
+
+def iter_lines(
+    text: str,
+    font: str = "simple",
+    color: str = None,
+    border: str = None,
+    width: Optional[int] = None,
+    align: str = "left",
+    backend: Optional[str] = None,
+    layout: str = "full",
+    line_spacing: int = _BAND_SPACING,
+) -> Iterator[str]:
+    """
+    Generate ASCII art one output line at a time using the global ASCIIGenerator instance.
+
+    Args:
+        text (str): Input string.
+        font (str, optional): Font name. Defaults to "simple".
+        color (str, optional): Output color or gradient (see ``asciigenator.colors``). Defaults to None.
+        border (str | BorderStyle, optional): Border character or style name (see list_borders()). Defaults to None.
+        width (int, optional): Maximum output width in columns; longer text is wrapped. Defaults to None.
+        align (str, optional): Alignment of wrapped bands ("left", "center" or "right"). Defaults to "left".
+        backend (str, optional): Rendering backend (see ``ASCIIGenerator.generate()``). Defaults to None.
+        layout (str, optional): Glyph layout (see ``ASCIIGenerator.generate()``). Defaults to "full".
+        line_spacing (int, optional): Blank rows between glyph bands (see ``ASCIIGenerator.generate()``). Defaults to 1.
+
+    Returns:
+        Iterator[str]: Output lines without line terminators.
+    """
+    return _get_generator().iter_lines(text, font, color, border, width, align, backend, layout, line_spacing)
+
+
+def render_to(
+    stream,
+    text: str,
+    font: str = "simple",
+    color: str = None,
+    border: str = None,
+    end: str = "",
+    encoding: str = "utf-8",
+    width: Optional[int] = None,
+    align: str = "left",
+    backend: Optional[str] = None,
+    layout: str = "full",
+    line_spacing: int = _BAND_SPACING,
+) -> None:
+    """
+    Write ASCII art line by line to a text or binary file object using the global ASCIIGenerator instance.
+
+    Args:
+        stream: Writable text or binary file object.
+        text (str): Input string.
+        font (str, optional): Font name. Defaults to "simple".
+        color (str, optional): Output color or gradient (see ``asciigenator.colors``). Defaults to None.
+        border (str | BorderStyle, optional): Border character or style name (see list_borders()). Defaults to None.
+        end (str, optional): String written after the last line. Defaults to "".
+        encoding (str, optional): Encoding used for binary streams. Defaults to "utf-8".
+        width (int, optional): Maximum output width in columns; longer text is wrapped. Defaults to None.
+        align (str, optional): Alignment of wrapped bands ("left", "center" or "right"). Defaults to "left".
+        backend (str, optional): Rendering backend (see ``ASCIIGenerator.generate()``). Defaults to None.
+        layout (str, optional): Glyph layout (see ``ASCIIGenerator.generate()``). Defaults to "full".
+        line_spacing (int, optional): Blank rows between glyph bands (see ``ASCIIGenerator.generate()``). Defaults to 1.
+    """
+    _get_generator().render_to(
+        stream,
+        text,
+        font,
+        color,
+        border,
+        end,
+        encoding,
+        width=width,
+        align=align,
+        backend=backend,
+        layout=layout,
+        line_spacing=line_spacing,
+    )
+
+
+def export(
+    text: str,
+    format: str = "html",
+    font: str = "simple",
+    color: str = None,
+    border: str = None,
+    width: Optional[int] = None,
+    align: str = "left",
+    backend: Optional[str] = None,
+    layout: str = "full",
+    line_spacing: int = _BAND_SPACING,
+) -> Union[str, "Bitmap"]:
+    """
+    Render ASCII art in an output format using the global ASCIIGenerator instance.
+
+    Args:
+        text (str): Input string.
+        format (str, optional): "text", "ansi", "html", "svg" or "bitmap". Defaults to "html".
+        font (str, optional): Font name. Defaults to "simple".
+        color (str, optional): Output color or gradient (see ``asciigenator.colors``). Defaults to None.
+        border (str | BorderStyle, optional): Border character or style name (see list_borders()). Defaults to None.
+        width (int, optional): Maximum output width in columns; longer text is wrapped. Defaults to None.
+        align (str, optional): Alignment of wrapped bands ("left", "center" or "right"). Defaults to "left".
+        backend (str, optional): Rendering backend (see ``ASCIIGenerator.generate()``). Defaults to None.
+        layout (str, optional): Glyph layout (see ``ASCIIGenerator.generate()``). Defaults to "full".
+        line_spacing (int, optional): Blank rows between glyph bands (see ``ASCIIGenerator.generate()``). Defaults to 1.
+
+    Returns:
+        Union[str, Bitmap]: The document, or for "bitmap" a ``Bitmap`` with one byte per cell.
+    """
+    return _get_generator().export(text, format, font, color, border, width, align, backend, layout, line_spacing)
+
+
+def iter_export(
+    text: str,
+    format: str = "html",
+    font: str = "simple",
+    color: str = None,
+    border: str = None,
+    width: Optional[int] = None,
+    align: str = "left",
+    backend: Optional[str] = None,
+    layout: str = "full",
+    line_spacing: int = _BAND_SPACING,
+) -> Iterator[Union[str, bytes]]:
+    """
+    Render ASCII art in an output format one chunk at a time using the global ASCIIGenerator instance.
+
+    Args:
+        text (str): Input string.
+        format (str, optional): "text", "ansi", "html", "svg" or "bitmap". Defaults to "html".
+        font (str, optional): Font name. Defaults to "simple".
+        color (str, optional): Output color or gradient (see ``asciigenator.colors``). Defaults to None.
+        border (str | BorderStyle, optional): Border character or style name (see list_borders()). Defaults to None.
+        width (int, optional): Maximum output width in columns; longer text is wrapped. Defaults to None.
+        align (str, optional): Alignment of wrapped bands ("left", "center" or "right"). Defaults to "left".
+        backend (str, optional): Rendering backend (see ``ASCIIGenerator.generate()``). Defaults to None.
+        layout (str, optional): Glyph layout (see ``ASCIIGenerator.generate()``). Defaults to "full".
+        line_spacing (int, optional): Blank rows between glyph bands (see ``ASCIIGenerator.generate()``). Defaults to 1.
+
+    Returns:
+        Iterator[Union[str, bytes]]: Chunks of the document, or for "bitmap" one ``bytes`` row at a time.
+    """
+    return _get_generator().iter_export(text, format, font, color, border, width, align, backend, layout, line_spacing)
+
+
+def load_font_dir(directory: str) -> List[str]:
+    """
+    Register every font file in a directory with the global ASCIIGenerator instance.
+
+    Args:
+        directory (str): Directory containing ``.flf``, ``.json`` or ``.toml`` font files.
+
+    Returns:
+        List[str]: Names of the registered fonts.
+    """
+    return _get_generator().load_font_dir(directory)
+
+
+def register_font(name: str, font: Union[Dict[str, List[str]], Callable[[], Dict[str, List[str]]]]) -> None:
+    """
+    Add or replace a font of the global ASCIIGenerator instance, safely while other threads render.
+
+    Args:
+        name (str): Font name.
+        font (Dict[str, List[str]] | Callable[[], Dict[str, List[str]]]): Glyph dictionary, or a zero-argument
+            function returning one, called on first use.
+    """
+    _get_generator().register_font(name, font)
+
+
+def unregister_font(name: str) -> None:
+    """
+    Remove a font of the global ASCIIGenerator instance, safely while other threads render.
+
+    Args:
+        name (str): Font name.
+
+    Raises:
+        ValueError: If the font is not available.
+    """
+    _get_generator().unregister_font(name)
+
+
+def register_color(name: str, code: str) -> None:
+    """
+    Add or replace a named color of the global ASCIIGenerator instance, safely while other threads render.
+
+    Args:
+        name (str): Color name.
+        code (str): ANSI escape code of the color as a foreground color.
+
+    Raises:
+        ValueError: If the name could be read as another part of a color specification.
+    """
+    _get_generator().register_color(name, code)
+
+
+def validate_font(font: str) -> List[GlyphIssue]:
+    """
+    Report the malformed glyphs of a font of the global ASCIIGenerator instance.
+
+    Args:
+        font (str): Font name.
+
+    Returns:
+        List[GlyphIssue]: The character and a description of each problem, empty if the font is well formed.
+    """
+    return _get_generator().validate_font(font)
+
+
+def list_fonts() -> List[str]:
+    """
     Get list of available fonts.
 
     Returns:
         List[str]: Names of available fonts.
     """
-    return _generator.list_fonts()
+    return _get_generator().list_fonts()
 
 
 def list_colors() -> List[str]:
@@ -242,4 +2335,64 @@ def list_colors() -> List[str]:
     Returns:
         List[str]: Names of available colors.
     """
-    return _generator.list_colors()
+    return _get_generator().list_colors()
+
+
+def list_borders() -> List[str]:
+    """
+    Get list of named border styles.
+
+    Returns:
+        List[str]: Names of available border styles.
+    """
+    return _get_generator().list_borders()
+
+
+def configure_cache(maxsize: Optional[int] = None, maxbytes: Optional[int] = None) -> None:
+    """
+    Enable, resize or disable the render cache of the global ASCIIGenerator instance.
+
+    Args:
+        maxsize (int, optional): Maximum number of cached results. Defaults to None (no entry limit).
+        maxbytes (int, optional): Maximum total size of cached results in bytes. Defaults to None (no size limit).
+            The cache is disabled when neither limit is given.
+    """
+    _get_generator().configure_cache(maxsize, maxbytes)
+
+
+def cache_info() -> "CacheInfo":
+    """
+    Report render cache statistics of the global ASCIIGenerator instance.
+
+    Returns:
+        CacheInfo: Hits, misses and current/maximum sizes.
+    """
+    return _get_generator().cache_info()
+
+
+def cache_clear() -> None:
+    """Clear the render cache of the global ASCIIGenerator instance."""
+    _get_generator().cache_clear()
+
+
+def configure_segment_cache(maxsize: Optional[int] = None) -> None:
+    """
+    Enable, resize or disable the segment cache of the global ASCIIGenerator instance.
+
+    Args:
+        maxsize (int, optional): Maximum number of words and separators kept per font. Defaults to None (disabled).
+
+    Raises:
+        ValueError: If ``maxsize`` is negative.
+    """
+    _get_generator().configure_segment_cache(maxsize)
+
+
+def segment_cache_info() -> "CacheInfo":
+    """
+    Report segment cache statistics of the global ASCIIGenerator instance.
+
+    Returns:
+        CacheInfo: Hits, misses and current/maximum sizes.
+    """
+    return _get_generator().segment_cache_info()
@@ -0,0 +1,311 @@
+"""
+Loading fonts from files: FIGlet ``.flf`` fonts and a simple JSON/TOML glyph format.
+
+A JSON or TOML font maps each character to the rows of its glyph, either at the top level or under a ``glyphs``
+key::
+
+    {"glyphs": {"A": [" # ", "# #", "###", "# #", "# #"], " ": ["   ", "   ", "   ", "   ", "   "]}}
+
+Parsed fonts are written to a compact binary cache so later processes can load them without parsing the source
+file again. The cache lives in ``$ASCIIGENATOR_CACHE_DIR``, or ``asciigenator`` under the user cache directory.
+
+Directories listed in ``$ASCIIGENATOR_FONT_PATH`` are registered with every new ``ASCIIGenerator``.
+"""
+
+from __future__ import annotations
+
+from array import array
+import os
+import struct
+import sys
+
+from .glyphs import GlyphTable
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Dict, List, Optional
+
+FONT_EXTENSIONS = (".flf", ".json", ".toml")
+
+# Characters every FIGlet font defines, in file order, before any code-tagged characters.
+_FLF_REQUIRED = list(range(32, 127)) + [196, 214, 220, 228, 246, 252, 223]
+
+# Cache layout: header, then the GlyphTable arrays (code point, height, width and first row per glyph, then the end
+# offset of every row in code points), then all rows as a single UTF-8 blob. Arrays are little-endian.
+_CACHE_MAGIC = b"AGFC"
+_CACHE_VERSION = 3
+_CACHE_HEADER = struct.Struct("<4sHxxqQ32sIII")
+_CACHE_ARRAYS = ("codes", "heights", "widths", "firsts", "ends")
+_CACHE_TYPECODES = {"codes": "I", "heights": "H", "widths": "H", "firsts": "I", "ends": "I"}
+
+
+def parse_flf(text: str) -> Dict[str, List[str]]:
+    """
+    Parse a FIGlet font.
+
+    Hardblanks are turned into spaces and the endmarks closing every glyph row are removed.
+
+    Args:
+        text (str): Contents of a ``.flf`` file.
+
+    Returns:
+        Dict[str, List[str]]: Glyph rows for every character defined by the font.
+
+    Raises:
+        ValueError: If the text is not a valid FIGlet font.
+    """
+    lines = text.splitlines()
+    header = lines[0].split() if lines else []
+    if not header or not header[0].startswith("flf2a") or len(header[0]) < 6 or len(header) < 6:
+        raise ValueError("Not a FIGlet font: missing 'flf2a' header.")
+    hardblank = header[0][5]
+    try:
+        height = int(header[1])
+        comment_lines = int(header[5])
+    except ValueError:
+        raise ValueError("Not a FIGlet font: malformed header.") from None
+    if height < 1:
+        raise ValueError(f"Invalid FIGlet font height {height}.")
+
+    glyphs = {}
+    pos = 1 + comment_lines
+
+    def read_glyph():
+        nonlocal pos
+        rows = lines[pos : pos + height]
+        if len(rows) < height:
+            raise ValueError("Truncated FIGlet font.")
+        pos += height
+        return [_strip_endmark(row).replace(hardblank, " ") for row in rows]
+
+    for code in _FLF_REQUIRED:
+        if pos >= len(lines):
+            break
+        glyphs[chr(code)] = read_glyph()
+    while pos < len(lines):
+        tag = lines[pos].split(None, 1)
+        pos += 1
+        if not tag:
+            continue
+        code = _parse_code(tag[0])
+        rows = read_glyph()
+        if code is not None and 0 <= code <= 0x10FFFF:
+            glyphs[chr(code)] = rows
+    return glyphs
+
+
+def _strip_endmark(row: str) -> str:
+    """Remove the one or two endmark characters that close a FIGlet glyph row."""
+    row = row.rstrip("\r\n")
+    if not row:
+        return row
+    endmark = row[-1]
+    row = row[:-1]
+    if row.endswith(endmark):
+        row = row[:-1]
+    return row
+
+
+def _parse_code(token: str) -> Optional[int]:
+    """Parse a FIGlet code tag, which may be decimal, octal (leading 0) or hexadecimal (leading 0x)."""
+    try:
+        if token[:2].lower() == "0x":
+            return int(token[2:], 16)
+        if token.startswith("0") and len(token) > 1:
+            return int(token[1:], 8)
+        return int(token)
+    except ValueError:
+        return None
+
+
+def parse_json(text: str) -> Dict[str, List[str]]:
+    """
+    Parse a JSON glyph font.
+
+    Args:
+        text (str): Contents of a ``.json`` font file.
+
+    Returns:
+        Dict[str, List[str]]: Glyph rows for every character defined by the font.
+
+    Raises:
+        ValueError: If the document is not a valid glyph font.
+    """
+    import json
+
+    return _glyphs_from_document(json.loads(text))
+
+
+def parse_toml(text: str) -> Dict[str, List[str]]:
+    """
+    Parse a TOML glyph font.
+
+    Uses ``tomllib`` on Python 3.11+ and the ``tomli`` package on older versions.
+
+    Args:
+        text (str): Contents of a ``.toml`` font file.
+
+    Returns:
+        Dict[str, List[str]]: Glyph rows for every character defined by the font.
+
+    Raises:
+        ImportError: If no TOML parser is available.
+        ValueError: If the document is not a valid glyph font.
+    """
+    try:
+        import tomllib
+    except ImportError:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            raise ImportError("Reading TOML fonts requires Python 3.11+ or the 'tomli' package.") from None
+    return _glyphs_from_document(tomllib.loads(text))
+
+
+def _glyphs_from_document(document) -> Dict[str, List[str]]:
+    """
+    Return the glyphs of a decoded JSON/TOML font document. Malformed glyphs are passed on as they are, for
+    ``GlyphTable.from_glyphs()`` to skip and report in ``issues`` like those of any other font.
+    """
+    glyphs = document.get("glyphs", document) if isinstance(document, dict) else None
+    if not isinstance(glyphs, dict):
+        raise ValueError("Font document must map characters to lists of rows.")
+    return glyphs
+
+
+_PARSERS = {".flf": parse_flf, ".json": parse_json, ".toml": parse_toml}
+
+
+def font_files(directory: str) -> Dict[str, str]:
+    """
+    Find the font files in a directory.
+
+    Args:
+        directory (str): Directory to scan (not recursively).
+
+    Returns:
+        Dict[str, str]: Font name (the file name without extension) to file path, sorted by name.
+    """
+    found = {}
+    for entry in sorted(os.scandir(directory), key=lambda entry: entry.name):
+        name, ext = os.path.splitext(entry.name)
+        if ext.lower() in FONT_EXTENSIONS and entry.is_file():
+            found.setdefault(name, entry.path)
+    return found
+
+
+def default_cache_dir() -> str:
+    """
+    Directory used for precompiled font caches.
+
+    Returns:
+        str: ``$ASCIIGENATOR_CACHE_DIR`` if set, otherwise ``asciigenator`` under ``$XDG_CACHE_HOME`` or ``~/.cache``.
+    """
+    path = os.environ.get("ASCIIGENATOR_CACHE_DIR")
+    if path:
+        return path
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "asciigenator")
+
+
+def load_font_file(path: str, cache_dir: Optional[str] = None, use_cache: bool = True) -> GlyphTable:
+    """
+    Load a ``.flf``, ``.json`` or ``.toml`` font, going through the precompiled cache.
+
+    The cache entry is used as is while the source file's modification time and size are unchanged. Otherwise
+    the source is hashed, and only re-parsed if its contents actually changed.
+
+    Args:
+        path (str): Path to the font file.
+        cache_dir (str, optional): Cache directory. Defaults to None (see ``default_cache_dir()``).
+        use_cache (bool, optional): Whether to read and write the cache. Defaults to True.
+
+    Returns:
+        GlyphTable: Glyph rows for every character defined by the font.
+
+    Raises:
+        ValueError: If the file type is not supported or the file is not a valid font.
+    """
+    import hashlib
+
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in _PARSERS:
+        raise ValueError(f"Unsupported font file '{path}'.")
+    stat = os.stat(path)
+    cache_path = None
+    if use_cache:
+        key = hashlib.sha256(os.path.abspath(path).encode("utf-8")).hexdigest()
+        cache_path = os.path.join(cache_dir or default_cache_dir(), key + ".agf")
+        cached = _read_cache(cache_path, stat.st_mtime_ns, stat.st_size, None)
+        if cached is not None:
+            return cached
+    with open(path, "rb") as f:
+        data = f.read()
+    digest = hashlib.sha256(data).digest()
+    if cache_path is not None:
+        # Touched but unchanged files only need their cache header refreshed.
+        cached = _read_cache(cache_path, None, None, digest)
+        if cached is not None:
+            _write_cache(cache_path, cached, stat.st_mtime_ns, stat.st_size, digest)
+            return cached
+    glyphs = GlyphTable.from_glyphs(_PARSERS[ext](data.decode("utf-8")))
+    # The cache only holds normalized glyphs, so fonts with issues are parsed again to report them.
+    if cache_path is not None and not glyphs.issues:
+        _write_cache(cache_path, glyphs, stat.st_mtime_ns, stat.st_size, digest)
+    return glyphs
+
+
+def _write_cache(cache_path: str, table: GlyphTable, mtime_ns: int, size: int, digest: bytes) -> None:
+    """Write glyphs to the binary cache. Failures are ignored; the cache is only an optimization."""
+    arrays = table.arrays()
+    blob = table.buffer.encode("utf-8")
+    n_glyphs, n_rows = len(arrays["codes"]), len(arrays["ends"])
+    parts = [_CACHE_HEADER.pack(_CACHE_MAGIC, _CACHE_VERSION, mtime_ns, size, digest, n_glyphs, n_rows, len(blob))]
+    for name in _CACHE_ARRAYS:
+        values = arrays[name]
+        if sys.byteorder == "big":
+            values = array(values.typecode, values)
+            values.byteswap()
+        parts.append(values.tobytes())
+    parts.append(blob)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(b"".join(parts))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _read_cache(cache_path: str, mtime_ns: Optional[int], size: Optional[int], digest: Optional[bytes]) -> Optional[GlyphTable]:
+    """Read glyphs from the binary cache if it matches the given stat fields or content digest."""
+    import mmap
+
+    try:
+        with open(cache_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            header = _CACHE_HEADER.unpack_from(buffer)
+            magic, version, cached_mtime, cached_size, cached_digest, n_glyphs, n_rows, n_bytes = header
+            if magic != _CACHE_MAGIC or version != _CACHE_VERSION:
+                return None
+            if digest is not None and digest != cached_digest:
+                return None
+            if digest is None and (mtime_ns, size) != (cached_mtime, cached_size):
+                return None
+            offset = _CACHE_HEADER.size
+            arrays = {}
+            for name in _CACHE_ARRAYS:
+                values = array(_CACHE_TYPECODES[name])
+                length = (n_rows if name == "ends" else n_glyphs) * values.itemsize
+                values.frombytes(buffer[offset : offset + length])
+                if sys.byteorder == "big":
+                    values.byteswap()
+                arrays[name] = values
+                offset += length
+            text = buffer[offset : offset + n_bytes].decode("utf-8")
+    except (OSError, ValueError, struct.error):
+        return None
+    return GlyphTable(buffer=text, **arrays)
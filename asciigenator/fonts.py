@@ -0,0 +1,141 @@
+"""
+Glyph data for the built-in fonts.
+
+This module is only imported when one of the built-in fonts is first used, so ``import asciigenator`` does not pay
+for building the glyph tables.
+"""
+
+SIMPLE = {
+    "A": [" * ", "* *", "***", "* *", "* *"],
+    "B": ["** ", "* *", "** ", "* *", "** "],
+    "C": [" **", "*  ", "*  ", "*  ", " **"],
+    "D": ["** ", "* *", "* *", "* *", "** "],
+    "E": ["***", "*  ", "** ", "*  ", "***"],
+    "F": ["***", "*  ", "** ", "*  ", "*  "],
+    "G": [" **", "*  ", "* *", "* *", " **"],
+    "H": ["* *", "* *", "***", "* *", "* *"],
+    "I": ["***", " * ", " * ", " * ", "***"],
+    "J": ["  *", "  *", "  *", "* *", " * "],
+    "K": ["* *", "** ", "*  ", "** ", "* *"],
+    "L": ["*  ", "*  ", "*  ", "*  ", "***"],
+    "M": ["*   *", "** **", "* * *", "*   *", "*   *"],
+    "N": ["*   *", "**  *", "* * *", "*  **", "*   *"],
+    "O": ["***", "* *", "* *", "* *", "***"],
+    "P": ["** ", "* *", "** ", "*  ", "*  "],
+    "Q": ["***", "* *", "* *", " **", "  *"],
+    "R": ["** ", "* *", "** ", "* *", "* *"],
+    "S": [" **", "*  ", " * ", "  *", "** "],
+    "T": ["***", " * ", " * ", " * ", " * "],
+    "U": ["* *", "* *", "* *", "* *", "***"],
+    "V": ["* *", "* *", "* *", "* *", " * "],
+    "W": ["*   *", "*   *", "* * *", "** **", "*   *"],
+    "X": ["* *", "* *", " * ", "* *", "* *"],
+    "Y": ["* *", "* *", " * ", " * ", " * "],
+    "Z": ["***", "  *", " * ", "*  ", "***"],
+    " ": ["   ", "   ", "   ", "   ", "   "],
+    "0": [" * ", "* *", "* *", "* *", " * "],
+    "1": [" * ", "** ", " * ", " * ", "***"],
+    "2": ["** ", "  *", " * ", "*  ", "***"],
+    "3": ["** ", "  *", " * ", "  *", "** "],
+    "4": ["* *", "* *", "***", "  *", "  *"],
+    "5": ["***", "*  ", "** ", "  *", "** "],
+    "6": [" **", "*  ", "***", "* *", "***"],
+    "7": ["***", "  *", " * ", " * ", " * "],
+    "8": ["***", "* *", "***", "* *", "***"],
+    "9": ["***", "* *", "***", "  *", "** "],
+    ".": [" ", " ", " ", " ", "*"],
+    ",": [" ", " ", " ", "*", "*"],
+    "!": ["*", "*", "*", " ", "*"],
+    "?": ["** ", "  *", " * ", "   ", " * "],
+    ":": [" ", "*", " ", "*", " "],
+    ";": [" ", "*", " ", "*", "*"],
+    "'": ["*", "*", " ", " ", " "],
+    '"': ["* *", "* *", "   ", "   ", "   "],
+    "-": ["   ", "   ", "***", "   ", "   "],
+    "+": ["   ", " * ", "***", " * ", "   "],
+    "=": ["   ", "***", "   ", "***", "   "],
+    "_": ["   ", "   ", "   ", "   ", "***"],
+    "/": ["  *", "  *", " * ", "*  ", "*  "],
+    "\\": ["*  ", "*  ", " * ", "  *", "  *"],
+    "(": [" *", "* ", "* ", "* ", " *"],
+    ")": ["* ", " *", " *", " *", "* "],
+    "[": ["**", "* ", "* ", "* ", "**"],
+    "]": ["**", " *", " *", " *", "**"],
+    "<": ["  *", " * ", "*  ", " * ", "  *"],
+    ">": ["*  ", " * ", "  *", " * ", "*  "],
+    "&": [" * ", "* *", " * ", "* *", " **"],
+    "#": ["* *", "***", "* *", "***", "* *"],
+    "@": [" **", "* *", "* *", "*  ", " **"],
+    "*": ["   ", "* *", " * ", "* *", "   "],
+    "%": ["* *", "  *", " * ", "*  ", "* *"],
+    "$": [" **", "** ", " * ", " **", "** "],
+}
+
+
+BLOCK = {
+    "A": ["  █  ", " █ █ ", "█████", "█   █", "█   █"],
+    "B": ["████ ", "█   █", "████ ", "█   █", "████ "],
+    "C": [" ████", "█    ", "█    ", "█    ", " ████"],
+    "D": ["████ ", "█   █", "█   █", "█   █", "████ "],
+    "E": ["█████", "█    ", "████ ", "█    ", "█████"],
+    "F": ["█████", "█    ", "████ ", "█    ", "█    "],
+    "G": [" ████", "█    ", "█  ██", "█   █", " ████"],
+    "H": ["█   █", "█   █", "█████", "█   █", "█   █"],
+    "I": ["█████", "  █  ", "  █  ", "  █  ", "█████"],
+    "J": ["    █", "    █", "    █", "█   █", " ███ "],
+    "K": ["█   █", "█  █ ", "███  ", "█  █ ", "█   █"],
+    "L": ["█    ", "█    ", "█    ", "█    ", "█████"],
+    "M": ["█   █", "██ ██", "█ █ █", "█   █", "█   █"],
+    "N": ["█   █", "██  █", "█ █ █", "█  ██", "█   █"],
+    "O": ["█████", "█   █", "█   █", "█   █", "█████"],
+    "P": ["████ ", "█   █", "████ ", "█    ", "█    "],
+    "Q": ["█████", "█   █", "█   █", "█  ██", "█████"],
+    "R": ["████ ", "█   █", "████ ", "█  █ ", "█   █"],
+    "S": [" ████", "█    ", " ███ ", "    █", "████ "],
+    "T": ["█████", "  █  ", "  █  ", "  █  ", "  █  "],
+    "U": ["█   █", "█   █", "█   █", "█   █", "█████"],
+    "V": ["█   █", "█   █", "█   █", " █ █ ", "  █  "],
+    "W": ["█   █", "█   █", "█ █ █", "██ ██", "█   █"],
+    "X": ["█   █", " █ █ ", "  █  ", " █ █ ", "█   █"],
+    "Y": ["█   █", " █ █ ", "  █  ", "  █  ", "  █  "],
+    "Z": ["█████", "   █ ", "  █  ", " █   ", "█████"],
+    " ": ["     ", "     ", "     ", "     ", "     "],
+    "0": [" ███ ", "█  ██", "█ █ █", "██  █", " ███ "],
+    "1": ["  █  ", " ██  ", "  █  ", "  █  ", "█████"],
+    "2": ["████ ", "    █", " ███ ", "█    ", "█████"],
+    "3": ["████ ", "    █", " ███ ", "    █", "████ "],
+    "4": ["█   █", "█   █", "█████", "    █", "    █"],
+    "5": ["█████", "█    ", "████ ", "    █", "████ "],
+    "6": [" ███ ", "█    ", "████ ", "█   █", " ███ "],
+    "7": ["█████", "    █", "   █ ", "  █  ", "  █  "],
+    "8": [" ███ ", "█   █", " ███ ", "█   █", " ███ "],
+    "9": [" ███ ", "█   █", " ████", "    █", " ███ "],
+    ".": ["     ", "     ", "     ", "     ", "  █  "],
+    ",": ["     ", "     ", "     ", "  █  ", " █   "],
+    "!": ["  █  ", "  █  ", "  █  ", "     ", "  █  "],
+    "?": [" ███ ", "█   █", "   █ ", "     ", "  █  "],
+    ":": ["     ", "  █  ", "     ", "  █  ", "     "],
+    ";": ["     ", "  █  ", "     ", "  █  ", " █   "],
+    "'": ["  █  ", "  █  ", "     ", "     ", "     "],
+    '"': [" █ █ ", " █ █ ", "     ", "     ", "     "],
+    "-": ["     ", "     ", " ███ ", "     ", "     "],
+    "+": ["     ", "  █  ", " ███ ", "  █  ", "     "],
+    "=": ["     ", "█████", "     ", "█████", "     "],
+    "_": ["     ", "     ", "     ", "     ", "█████"],
+    "/": ["    █", "   █ ", "  █  ", " █   ", "█    "],
+    "\\": ["█    ", " █   ", "  █  ", "   █ ", "    █"],
+    "(": ["   █ ", "  █  ", "  █  ", "  █  ", "   █ "],
+    ")": [" █   ", "  █  ", "  █  ", "  █  ", " █   "],
+    "[": [" ███ ", " █   ", " █   ", " █   ", " ███ "],
+    "]": [" ███ ", "   █ ", "   █ ", "   █ ", " ███ "],
+    "<": ["   █ ", "  █  ", " █   ", "  █  ", "   █ "],
+    ">": [" █   ", "  █  ", "   █ ", "  █  ", " █   "],
+    "&": [" ██  ", "█  █ ", " ██  ", "█  █ ", " ██ █"],
+    "#": [" █ █ ", "█████", " █ █ ", "█████", " █ █ "],
+    "@": [" ███ ", "█   █", "█ ███", "█ ██ ", " ██  "],
+    "*": ["     ", "█ █ █", " ███ ", "█ █ █", "     "],
+    "%": ["██  █", "██ █ ", "  █  ", " █ ██", "█  ██"],
+    "$": [" ████", "█ █  ", " ███ ", "  █ █", "████ "],
+}
+
+BUILTIN_FONTS = {"simple": SIMPLE, "block": BLOCK}
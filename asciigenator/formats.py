@@ -0,0 +1,264 @@
+"""
+Output formats written straight from the glyph cell grid: HTML, SVG and raw bitmaps.
+
+The plain ``text`` and ``ansi`` formats are the lines ``ASCIIGenerator.iter_lines`` produces. The other formats
+are built from the same undecorated glyph rows, split into spans of cells that share a color, without going through
+escape codes:
+
+* ``html``: a ``<pre>`` element with one ``<span style="color:...">`` per colored span. A background color becomes
+  the element's background and box-drawing borders ("single", "double", "rounded", "heavy") a CSS border.
+* ``svg``: a standalone SVG image on a grid of ``CELL_WIDTH`` x ``CELL_HEIGHT`` cells. Runs of full block
+  characters are drawn as ``<rect>`` elements and other characters as ``<text>`` stretched to their cells, so the
+  image does not depend on the metrics of the viewer's monospace font. Box-drawing borders become stroked rects.
+* ``bitmap``: one byte per cell, row by row: 0 for blank cells, 255 for uncolored ink and the luminance of their
+  color (at least 1) for colored cells. Borders are drawn with their characters.
+
+Every writer is a generator that produces the output one row at a time, so large banners can be written to a
+stream without being held in memory.
+"""
+
+from __future__ import annotations
+
+from collections import namedtuple
+from html import escape
+import re
+
+from .core import BORDER_STYLES
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterator, List, Optional, Sequence, Tuple
+
+FORMATS = ("text", "ansi", "html", "svg", "bitmap")
+
+# Size of one SVG cell in user units. The font size gives a typical monospace font an advance of one cell width.
+CELL_WIDTH = 10
+CELL_HEIGHT = 20
+_FONT_SIZE = 16.67
+_BASELINE = 15
+
+# Box-drawing border styles drawn with the format's own lines: line style, line width and corner radius in cells.
+_NATIVE_BORDERS = {
+    BORDER_STYLES["single"]: ("solid", 1, 0),
+    BORDER_STYLES["double"]: ("double", 3, 0),
+    BORDER_STYLES["rounded"]: ("solid", 1, 0.5),
+    BORDER_STYLES["heavy"]: ("solid", 3, 0),
+}
+
+# Blank cells between the art and its border, as in ``generate``.
+_PADDING = 1
+
+# Runs of full blocks, and runs of other visible characters.
+_SVG_CELLS = re.compile("(█+)|[^ █]+")
+
+Art = namedtuple("Art", ["rows", "widths", "background", "border"])
+Art.__doc__ = """
+The cell grid of one rendered text, as handed to the format writers.
+
+``rows`` yields the undecorated glyph rows, each a list of ``(cells, color)`` spans whose color is an RGB tuple or
+None. ``widths`` holds the width of every row and is known before the rows are produced. ``background`` is an RGB
+tuple or None, and ``border`` a ``BorderStyle`` or None.
+"""
+
+Bitmap = namedtuple("Bitmap", ["width", "height", "data"])
+Bitmap.__doc__ = """
+A rendered text as a 2-D grid of bytes, one per cell: ``data[y * width + x]`` is the cell in row ``y`` and column
+``x``. Blank cells are 0 and ink is 255, or the luminance of its color.
+"""
+
+
+def spans(line: str, runs: Sequence[Tuple[int, int, object]]) -> List[Tuple[str, Optional[Tuple[int, int, int]]]]:
+    """
+    Split one glyph row into spans of cells sharing a color.
+
+    Blank cells join the span before them, as ``colors.paint_row`` does not switch colors for them either.
+
+    Args:
+        line (str): Glyph row.
+        runs (Sequence[Tuple[int, int, object]]): Start column, end column and RGB color of each run, in order.
+
+    Returns:
+        List[Tuple[str, Optional[Tuple[int, int, int]]]]: The spans, covering the whole row.
+    """
+    result = []
+    position = 0
+
+    def add(cells, color):
+        if result and (cells.isspace() or result[-1][1] == color):
+            result[-1] = (result[-1][0] + cells, result[-1][1])
+        elif result and result[-1][0].isspace():
+            result[-1] = (result[-1][0] + cells, color)
+        else:
+            result.append((cells, color))
+
+    for start, stop, color in runs:
+        if start >= len(line):
+            break
+        if start > position:
+            add(line[position:start], None)
+        add(line[start:stop], color)
+        position = stop
+    if position < len(line):
+        add(line[position:], None)
+    return result
+
+
+def _hex(rgb: Tuple[int, int, int]) -> str:
+    """CSS notation of an RGB color."""
+    return "#{:02x}{:02x}{:02x}".format(*rgb)
+
+
+def _native_border(art: Art) -> Optional[Tuple[str, int, float]]:
+    """Line style, width and corner radius of a border drawn natively, or None if it is drawn with characters."""
+    return _NATIVE_BORDERS.get(art.border) if art.border else None
+
+
+def _framed(art: Art) -> Tuple[int, Iterator[List[Tuple[str, Optional[Tuple[int, int, int]]]]]]:
+    """Width in cells of the art with its border drawn in characters, and its rows as spans."""
+    style, widths = art.border, art.widths
+    if not style:
+        return max(widths), iter(art.rows)
+    inner = max(widths) + 2 * _PADDING
+    top = style.top_left + style.top * inner + style.top_right
+    bottom = style.bottom_left + style.bottom * inner + style.bottom_right
+    total = max(len(top), len(bottom), len(style.left) + inner + len(style.right))
+
+    def rows():
+        blank = [(style.left + " " * inner + style.right, None)]
+        yield [(top, None)]
+        for _ in range(_PADDING):
+            yield blank
+        for row, width in zip(art.rows, widths):
+            yield [(style.left + " " * _PADDING, None), *row, (" " * (inner - _PADDING - width) + style.right, None)]
+        for _ in range(_PADDING):
+            yield blank
+        yield [(bottom, None)]
+
+    return total, rows()
+
+
+def _html(art: Art) -> Iterator[str]:
+    """Write the art as a ``<pre>`` element, one line at a time."""
+    native = _native_border(art)
+    style = ["line-height:1"]
+    if art.background:
+        style.append(f"background-color:{_hex(art.background)}")
+    if native:
+        line, width, radius = native
+        style += [f"border:{width}px {line}", "padding:1em 1ch", "display:inline-block"]
+        if radius:
+            style.append(f"border-radius:{radius}em")
+        rows = iter(art.rows)
+    else:
+        _, rows = _framed(art)
+    yield f'<pre class="asciigenator" style="{";".join(style)}">'
+    for i, row in enumerate(rows):
+        cells = [
+            escape(text, quote=False)
+            if color is None or text.isspace()
+            else f'<span style="color:{_hex(color)}">{escape(text, quote=False)}</span>'
+            for text, color in row
+        ]
+        yield ("\n" if i else "") + "".join(cells)
+    yield "</pre>"
+
+
+def _svg(art: Art) -> Iterator[str]:
+    """Write the art as a standalone SVG image, one row of cells at a time."""
+    native = _native_border(art)
+    if native:
+        offset = 1 + _PADDING
+        columns, rows = max(art.widths) + 2 * offset, iter(art.rows)
+    else:
+        offset = 0
+        columns, rows = _framed(art)
+    height = len(art.widths) + (2 + 2 * _PADDING if art.border else 0)
+    w, h = columns * CELL_WIDTH, height * CELL_HEIGHT
+    yield (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{w}" height="{h}" viewBox="0 0 {w} {h}" '
+        f'fill="currentColor" font-family="monospace" font-size="{_FONT_SIZE}">\n'
+    )
+    if art.background:
+        yield f'<rect width="{w}" height="{h}" fill="{_hex(art.background)}"/>\n'
+    if native:
+        line, width, radius = native
+        # The border runs through the middle of the outermost cells; a double line is two thin ones.
+        insets = (-1, 1) if line == "double" else (0,)
+        for inset in insets:
+            x, y = CELL_WIDTH / 2 + inset, CELL_HEIGHT / 2 + inset
+            yield (
+                f'<rect x="{x:g}" y="{y:g}" width="{w - 2 * x:g}" height="{h - 2 * y:g}" rx="{radius * CELL_WIDTH:g}" '
+                f'fill="none" stroke="currentColor" stroke-width="{1 if line == "double" else width}"/>\n'
+            )
+    for y, row in enumerate(rows, offset):
+        out = []
+        x = offset
+        for text, color in row:
+            fill = f' fill="{_hex(color)}"' if color is not None else ""
+            for match in _SVG_CELLS.finditer(text):
+                start, n = x + match.start(), match.end() - match.start()
+                if match.group(1):
+                    out.append(
+                        f'<rect x="{start * CELL_WIDTH}" y="{y * CELL_HEIGHT}" width="{n * CELL_WIDTH}" '
+                        f'height="{CELL_HEIGHT}"{fill}/>'
+                    )
+                else:
+                    out.append(
+                        f'<text x="{start * CELL_WIDTH}" y="{y * CELL_HEIGHT + _BASELINE}" textLength="{n * CELL_WIDTH}" '
+                        f'lengthAdjust="spacingAndGlyphs"{fill}>{escape(match.group(), quote=False)}</text>'
+                    )
+            x += len(text)
+        if out:
+            yield "".join(out) + "\n"
+    yield "</svg>"
+
+
+class _InkTable(dict):
+    """``str.translate`` table turning blank cells into NUL and every other character into ``\\xff``."""
+
+    def __missing__(self, code: int) -> str:
+        value = self[code] = "\0" if code == 32 else "\xff"
+        return value
+
+
+_INK = _InkTable()
+
+
+def _bitmap(art: Art) -> Iterator[bytes]:
+    """Write the art as rows of one byte per cell."""
+    columns, rows = _framed(art)
+    luminance = {}
+    for row in rows:
+        cells = "".join([text for text, _ in row]).translate(_INK).encode("latin-1")
+        if all(color is None for _, color in row):
+            yield cells.ljust(columns, b"\0")
+            continue
+        out = bytearray(cells.ljust(columns, b"\0"))
+        x = 0
+        for text, color in row:
+            if color is not None:
+                value = luminance.get(color)
+                if value is None:
+                    r, g, b = color
+                    value = luminance[color] = bytes([max(1, round(0.299 * r + 0.587 * g + 0.114 * b))])
+                out[x : x + len(text)] = cells[x : x + len(text)].replace(b"\xff", value)
+            x += len(text)
+        yield bytes(out)
+
+
+_WRITERS = {"html": _html, "svg": _svg, "bitmap": _bitmap}
+
+
+def write(art: Art, format: str) -> Iterator:
+    """
+    Write the cell grid of a rendered text in one of the formats.
+
+    Args:
+        art (Art): Cell grid to write.
+        format (str): "html", "svg" or "bitmap".
+
+    Returns:
+        Iterator: Chunks of ``str`` whose concatenation is the document, or for "bitmap" one ``bytes`` row of cells
+        at a time.
+    """
+    return _WRITERS[format](art)
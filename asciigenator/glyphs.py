@@ -0,0 +1,305 @@
+"""
+Compact glyph storage shared by all fonts.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections import namedtuple
+from collections.abc import Mapping
+import sys
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Dict, Iterator, List, Optional, Tuple
+
+GlyphIssue = namedtuple("GlyphIssue", ["char", "message"])
+GlyphIssue.__doc__ = """
+A problem found in a font's glyphs: the offending key and a description of what is wrong and how it was handled.
+"""
+
+
+def _check_glyph(char, rows) -> Optional[str]:
+    """Describe why a glyph cannot be used at all, or return None if it can be normalized."""
+    if not isinstance(char, str) or len(char) != 1:
+        return "Key is not a single character; glyph skipped."
+    if not isinstance(rows, (list, tuple)) or not rows:
+        return "Glyph has no rows; glyph skipped."
+    if not all(isinstance(row, str) for row in rows):
+        return "Glyph rows must be strings; glyph skipped."
+    if any("\n" in row or "\r" in row for row in rows):
+        return "Glyph rows contain line breaks; glyph skipped."
+    return None
+
+
+def normalize_glyphs(glyphs: Mapping) -> Tuple[Dict[str, List[str]], List[GlyphIssue]]:
+    """
+    Make every glyph of a font a rectangle of the font's height.
+
+    Rows shorter than a glyph's widest row are padded with spaces on the right, and glyphs with fewer rows than the
+    tallest glyph get blank rows below. Glyphs that cannot be rendered at all are dropped.
+
+    Args:
+        glyphs (Mapping[str, List[str]]): Glyph rows for each character.
+
+    Returns:
+        Tuple[Dict[str, List[str]], List[GlyphIssue]]: The normalized glyphs, and what was wrong with the input.
+    """
+    issues = []
+    usable = {}
+    for char, rows in glyphs.items():
+        problem = _check_glyph(char, rows)
+        if problem is not None:
+            issues.append(GlyphIssue(char, problem))
+        else:
+            usable[char] = rows
+    height = max(map(len, usable.values()), default=0)
+    normalized = {}
+    for char, rows in usable.items():
+        width = max(map(len, rows))
+        if min(map(len, rows)) != width:
+            issues.append(GlyphIssue(char, f"Rows have different widths; padded to {width} columns."))
+        if len(rows) != height:
+            issues.append(GlyphIssue(char, f"Glyph has {len(rows)} of {height} rows; padded with blank rows."))
+        normalized[char] = [row.ljust(width) for row in rows] + [" " * width] * (height - len(rows))
+    return normalized, issues
+
+
+def validate_glyphs(glyphs: Mapping) -> List[GlyphIssue]:
+    """
+    Check a font's glyphs without building a table.
+
+    Args:
+        glyphs (Mapping[str, List[str]]): Glyph rows for each character.
+
+    Returns:
+        List[GlyphIssue]: Malformed glyphs, empty if every glyph is a rectangle of the font's height.
+    """
+    return normalize_glyphs(glyphs)[1]
+
+
+class GlyphTable(Mapping):
+    """
+    Read-only font storage that keeps every glyph row in one contiguous string.
+
+    Glyphs are indexed by a sorted array of code points; per-glyph heights, widths and first-row numbers and the
+    end offset of every row live in ``array`` buffers. This costs a few dozen bytes per glyph instead of a Python
+    list and one string object per row, which matters for fonts covering thousands of code points.
+
+    The table behaves like the ``Dict[str, List[str]]`` fonts used to be: looking up a character returns a new
+    list of its rows.
+
+    Glyphs are normalized when the table is built (see ``normalize_glyphs()``): every glyph is a rectangle exactly
+    ``height`` rows tall, so rendering never needs to check row counts or row lengths.
+
+    The edge profiles used by kerning and smushing (see ``edges()``) are computed for the whole table the first time
+    they are needed, in one pass over the row buffer.
+
+    Attributes:
+        height (int): Number of rows of every glyph.
+        issues (Tuple[GlyphIssue, ...]): Problems found in the glyphs the table was built from.
+    """
+
+    __slots__ = ("height", "issues", "_codes", "_heights", "_widths", "_firsts", "_ends", "_buffer", "_edges")
+
+    def __init__(
+        self,
+        codes: array,
+        heights: array,
+        widths: array,
+        firsts: array,
+        ends: array,
+        buffer: str,
+        issues: Tuple[GlyphIssue, ...] = (),
+    ):
+        """
+        Args:
+            codes (array): Sorted code point of each glyph (typecode ``"I"``).
+            heights (array): Number of rows of each glyph, all equal (typecode ``"H"``).
+            widths (array): Width in columns of each glyph, the length of each of its rows (typecode ``"H"``).
+            firsts (array): Index of each glyph's first row in ``ends`` (typecode ``"I"``).
+            ends (array): End offset of every row in ``buffer`` (typecode ``"I"``).
+            buffer (str): All glyph rows concatenated.
+            issues (Tuple[GlyphIssue, ...], optional): Problems found while normalizing the glyphs. Defaults to ().
+        """
+        self._codes = codes
+        self._heights = heights
+        self._widths = widths
+        self._firsts = firsts
+        self._ends = ends
+        self._buffer = buffer
+        self.height = max(heights, default=0)
+        self.issues = tuple(issues)
+        self._edges = None
+
+    @classmethod
+    def from_glyphs(cls, glyphs: Mapping) -> "GlyphTable":
+        """
+        Build a table from a mapping of characters to glyph rows, normalizing the glyphs.
+
+        Glyphs that cannot be rendered are skipped and ragged or short glyphs are padded; both are recorded in
+        ``issues``.
+
+        Args:
+            glyphs (Mapping[str, List[str]]): Glyph rows for each character.
+
+        Returns:
+            GlyphTable: The packed glyphs.
+        """
+        if isinstance(glyphs, GlyphTable):
+            return glyphs
+        normalized, issues = normalize_glyphs(glyphs)
+        items = sorted((ord(char), rows) for char, rows in normalized.items())
+        codes, heights, widths, firsts, ends = array("I"), array("H"), array("H"), array("I"), array("I")
+        parts = []
+        offset = 0
+        for code, rows in items:
+            codes.append(code)
+            heights.append(len(rows))
+            widths.append(len(rows[0]))
+            firsts.append(len(ends))
+            for row in rows:
+                parts.append(row)
+                offset += len(row)
+                ends.append(offset)
+        return cls(codes, heights, widths, firsts, ends, "".join(parts), issues)
+
+    def index(self, char: str) -> Optional[int]:
+        """
+        Find the glyph number of a character.
+
+        Args:
+            char (str): A single character.
+
+        Returns:
+            int: Position of the glyph in the table, or None if the font does not define the character.
+        """
+        return self.index_of(ord(char)) if len(char) == 1 else None
+
+    def index_of(self, code: int) -> Optional[int]:
+        """
+        Find the glyph number of a code point.
+
+        Args:
+            code (int): Unicode code point.
+
+        Returns:
+            int: Position of the glyph in the table, or None if the font does not define the code point.
+        """
+        i = bisect_left(self._codes, code)
+        if i < len(self._codes) and self._codes[i] == code:
+            return i
+        return None
+
+    def row(self, glyph: int, i: int) -> str:
+        """
+        Get one row of a glyph.
+
+        Args:
+            glyph (int): Glyph number, see ``index()``.
+            i (int): Row number, less than ``height``.
+
+        Returns:
+            str: The row.
+        """
+        row = self._firsts[glyph] + i
+        return self._buffer[self._ends[row - 1] if row else 0 : self._ends[row]]
+
+    def glyph_height(self, glyph: int) -> int:
+        """
+        Get the number of rows of a glyph.
+
+        Args:
+            glyph (int): Glyph number, see ``index()``.
+
+        Returns:
+            int: The glyph's height.
+        """
+        return self._heights[glyph]
+
+    def glyph_width(self, glyph: int) -> int:
+        """
+        Get the width of a glyph.
+
+        Args:
+            glyph (int): Glyph number, see ``index()``.
+
+        Returns:
+            int: Length of each of the glyph's rows.
+        """
+        return self._widths[glyph]
+
+    def edges(self, glyph: int) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        """
+        Get the edge profile of a glyph: how far its ink is from its left and right edges on every row.
+
+        Args:
+            glyph (int): Glyph number, see ``index()``.
+
+        Returns:
+            Tuple[Tuple[int, ...], Tuple[int, ...]]: Number of blank columns before the first non-blank column of
+            each row, and after the last one. Both are the glyph's width for blank rows.
+        """
+        if self._edges is None:
+            leads, trails = array("H"), array("H")
+            buffer, start = self._buffer, 0
+            for end in self._ends:
+                width = end - start
+                lead = width - len(buffer[start:end].lstrip(" "))
+                leads.append(lead)
+                trails.append(width if lead == width else width - len(buffer[start:end].rstrip(" ")))
+                start = end
+            self._edges = (leads, trails)
+        first = self._firsts[glyph]
+        last = first + self._heights[glyph]
+        leads, trails = self._edges
+        return tuple(leads[first:last]), tuple(trails[first:last])
+
+    @property
+    def nbytes(self) -> int:
+        """int: Approximate memory used by the table, in bytes."""
+        arrays = (self._codes, self._heights, self._widths, self._firsts, self._ends)
+        return sys.getsizeof(self._buffer) + sum(sys.getsizeof(values) for values in arrays)
+
+    def arrays(self) -> Dict[str, array]:
+        """
+        Get the underlying storage, for serialization.
+
+        Returns:
+            Dict[str, array]: The ``codes``, ``heights``, ``widths``, ``firsts`` and ``ends`` arrays.
+        """
+        return {
+            "codes": self._codes,
+            "heights": self._heights,
+            "widths": self._widths,
+            "firsts": self._firsts,
+            "ends": self._ends,
+        }
+
+    @property
+    def buffer(self) -> str:
+        """str: All glyph rows concatenated."""
+        return self._buffer
+
+    def __getitem__(self, char: str) -> List[str]:
+        glyph = self.index(char) if isinstance(char, str) else None
+        if glyph is None:
+            raise KeyError(char)
+        return [self.row(glyph, i) for i in range(self._heights[glyph])]
+
+    def __contains__(self, char) -> bool:
+        return isinstance(char, str) and self.index(char) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return map(chr, self._codes)
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __reduce__(self):
+        arrays = (self._codes, self._heights, self._widths, self._firsts, self._ends)
+        return type(self), (*arrays, self._buffer, self.issues)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} glyphs={len(self)} height={self.height} nbytes={self.nbytes}>"
@@ -0,0 +1,226 @@
+"""
+FIGlet-style kerning and smushing.
+
+The "full" layout draws every glyph at its full width followed by one column of letter spacing. The other layouts
+move each glyph left as far as its edges allow:
+
+* ``kerning``: glyphs touch, with no blank column between their closest non-blank characters.
+* ``smush``: glyphs overlap by one more column when every pair of characters that then share a cell can be merged
+  by one of the smushing rules (see ``smush()``).
+
+How far a glyph can move depends only on the blank columns at the edges of each of its rows, which
+``GlyphTable.edges()`` computes once for the whole font, so fitting a glyph against the text before it takes
+O(height) steps and never looks at the cells in between. The result for a pair of adjacent glyphs is cached, so
+common pairs are fitted only once per font.
+
+Glyphs without any ink, such as the space, are never overlapped, so the gaps between words stay as wide as the
+space glyph.
+"""
+
+from __future__ import annotations
+
+from collections import namedtuple
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import List, Optional
+
+    from .core import _CompiledFont
+
+# Characters merged by the hierarchy rule, in classes of increasing rank: "|", "/\", "[]", "{}", "()", "<>".
+_HIERARCHY = "|/\\[]{}()<>"
+_OPPOSITES = {"[]", "][", "{}", "}{", "()", ")("}
+_BIG_X = {"/\\": "|", "\\/": "Y", "><": "X"}
+
+# Number of composed bands kept per font, so measuring a band and then drawing it composes it only once.
+_MEMO_SIZE = 256
+
+Composition = namedtuple("Composition", ["rows", "width", "spans"])
+Composition.__doc__ = """
+Glyph rows of one band composed with kerning or smushing.
+
+``rows`` holds the rows, without the blank cells after their last glyph, ``width`` the number of columns the
+glyphs take up, and ``spans`` the start and end column of every character.
+Columns shared by overlapping characters belong to the first one, so the spans do not overlap.
+"""
+
+
+def smush(left: str, right: str) -> Optional[str]:
+    """
+    Merge two non-blank characters that share a cell, following FIGlet's controlled smushing rules.
+
+    The rules are tried in order: equal characters, an underscore replaced by a line character, the character of
+    the higher class in ``|``, ``/\\``, ``[]``, ``{}``, ``()``, ``<>``, opposite brackets merged into ``|``, and
+    ``/\\``, ``\\/`` and ``><`` merged into ``|``, ``Y`` and ``X``.
+
+    Args:
+        left (str): Character of the text so far.
+        right (str): Character of the glyph being added.
+
+    Returns:
+        Optional[str]: The merged character, or None if no rule applies.
+    """
+    if left == right:
+        return left
+    if left == "_" and right in _HIERARCHY:
+        return right
+    if right == "_" and left in _HIERARCHY:
+        return left
+    a, b = _HIERARCHY.find(left), _HIERARCHY.find(right)
+    if a >= 0 and b >= 0 and (a + 1) // 2 != (b + 1) // 2:
+        return left if a > b else right
+    pair = left + right
+    if pair in _OPPOSITES:
+        return "|"
+    return _BIG_X.get(pair)
+
+
+def _last(row: List[str]) -> int:
+    """Index of the last non-empty piece of a row."""
+    i = len(row) - 1
+    while not row[i]:
+        i -= 1
+    return i
+
+
+class Composer:
+    """
+    Composes the bands of one compiled font with kerning or smushing.
+
+    Attributes:
+        compiled (_CompiledFont): Font whose glyphs are composed.
+        smushing (bool): Whether glyphs are smushed, or only kerned.
+        pairs (dict): Fit of each pair of adjacent glyphs seen so far (see ``_fit()``), for pairs whose first
+            glyph has ink on every row.
+    """
+
+    __slots__ = ("compiled", "smushing", "pairs", "_glyphs", "_memo")
+
+    def __init__(self, compiled: _CompiledFont, smushing: bool):
+        """
+        Args:
+            compiled (_CompiledFont): Font whose glyphs are composed.
+            smushing (bool): Smush glyphs instead of only kerning them.
+        """
+        self.compiled = compiled
+        self.smushing = smushing
+        self.pairs = {}
+        self._glyphs = {}
+        self._memo = {}
+
+    def _glyph(self, glyph: int) -> tuple:
+        """Width, inked part of each row, edge profile and shape of a glyph; -1 is the blank of unknown characters."""
+        info = self._glyphs.get(glyph)
+        if info is None:
+            height = self.compiled.height
+            if glyph < 0:
+                width = len(self.compiled._blank) - 1
+                inks, leads, trails = ("",) * height, (width,) * height, (width,) * height
+            else:
+                table = self.compiled.source
+                width = table.glyph_width(glyph)
+                leads, trails = table.edges(glyph)
+                inks = tuple(table.row(glyph, i)[leads[i] : width - trails[i]] for i in range(height))
+            # solid: ink on every row, so the fit of the glyph placed after it only depends on the pair.
+            solid = all(lead < width for lead in leads)
+            empty = all(lead == width for lead in leads)
+            info = self._glyphs[glyph] = (width, inks, leads, trails, solid, empty)
+        return info
+
+    def _fit(self, rows: List[List[str]], ink: List[int], length: int, info: tuple, hard: bool) -> tuple:
+        """
+        Fit a glyph after the text so far.
+
+        Returns the kerning amount, the overlap, the merged ``(row, character)`` cells, the piece appended to each
+        row, how far each row's ink ends before the new end of the text, and whether the next glyph can be fitted
+        from the pair alone. When the text ends in a glyph with ink on every row or in one without any ink, all of
+        these only depend on the two glyphs.
+        """
+        width, inks, leads, trails, solid, empty = info
+        height = len(leads)
+        if empty:
+            pieces = tuple(" " * (length + width - end) for end in ink)
+            return 0, 0, (), pieces, (0,) * height, True
+        kern = min(width, length, *[length - end + lead for end, lead in zip(ink, leads)])
+        amount, merged = kern, ()
+        if self.smushing and not hard and kern < min(width, length):
+            found = []
+            for r, (end, lead) in enumerate(zip(ink, leads)):
+                if length - end + lead == kern:
+                    row = rows[r]
+                    char = smush(row[_last(row)][-1], inks[r][0])
+                    if char is None:
+                        break
+                    found.append((r, char))
+            else:
+                amount, merged = kern + 1, tuple(found)
+        x = length - amount
+        pieces, backs = [], []
+        for r in range(height):
+            lead, end = leads[r], ink[r]
+            if lead < width:
+                start = x + lead
+                # Only the cell merged with the text before can start left of its ink.
+                pieces.append(inks[r][1:] if start < end else " " * (start - end) + inks[r])
+                backs.append(trails[r])
+            else:
+                pieces.append("")
+                backs.append(x + width - end)
+        # The next pair's fit holds only if the text ends in this glyph's own characters.
+        clean = solid and all(inks[r][0] == char for r, char in merged)
+        return kern, amount, merged, tuple(pieces), tuple(backs), clean
+
+    def compose(self, band: str) -> Composition:
+        """
+        Compose the glyph rows of a band.
+
+        Args:
+            band (str): Text of the band.
+
+        Returns:
+            Composition: The rows, their width and the columns of every character.
+        """
+        memo = self._memo
+        found = memo.get(band)
+        if found is not None:
+            return found
+        compiled, pairs, infos = self.compiled, self.pairs, self._glyphs
+        height = compiled.height
+        # Every row is a list of pieces, some empty, that ends with its last non-blank cell; blank cells after it
+        # are only written once a later glyph puts ink further right, so placing a glyph only appends to a row.
+        rows = [[] for _ in range(height)]
+        # Row r is length - backs[r] columns wide so far, glyphs without ink counting as non-blank so nothing moves
+        # into them. ink holds those widths, and is only rebuilt when a glyph is fitted without the pair cache.
+        backs, ink = (0,) * height, None
+        length = 0
+        previous = None  # last glyph, when the cached fit of the next pair applies (see _fit)
+        hard = True  # the last glyph has no ink and must not be smushed into
+        spans = []
+        for code in map(ord, band):
+            start = None
+            for glyph in compiled.glyphs[code] or (-1,):
+                info = infos.get(glyph) or self._glyph(glyph)
+                fit = pairs.get((previous, glyph)) if previous is not None else None
+                if fit is None or fit[0] >= length:
+                    if ink is None:
+                        ink = [length - back for back in backs]
+                    fit = self._fit(rows, ink, length, info, hard)
+                    if previous is not None and fit[0] < length:
+                        pairs[previous, glyph] = fit
+                _, amount, merged, pieces, backs, clean = fit
+                for r, char in merged:
+                    row = rows[r]
+                    i = _last(row)
+                    row[i] = row[i][:-1] + char
+                for row, piece in zip(rows, pieces):
+                    row.append(piece)
+                x = length - amount
+                length, ink = x + info[0], None
+                previous, hard = (glyph if clean else None), info[5]
+                if start is None:
+                    start = x
+            spans.append((max(start, spans[-1][1]) if spans else start, length))
+        if len(memo) >= _MEMO_SIZE:
+            memo.clear()
+        result = memo[band] = Composition(["".join(row) for row in rows], length, spans)
+        return result
@@ -0,0 +1,154 @@
+"""
+Opt-in instrumentation of the render pipeline.
+
+``ASCIIGenerator.enable_profiling()`` attaches a ``Profiler`` that times every stage of each render done by
+``generate``, ``generate_many`` and ``iter_generate`` (in the calling process), counts the characters rendered, the
+characters drawn with the fallback policy and the render cache hits, and passes one ``RenderSample`` per render to
+the registered hooks, e.g. to export them to a metrics system::
+
+    profiler = generator.enable_profiling()
+    profiler.add_hook(lambda sample: histogram.observe(sum(sample.stages.values())))
+    ...
+    print(profiler.report())
+
+The stages are:
+
+* ``validate``: checking the font, color and layout arguments and compiling the font on first use
+* ``cache``: looking up and storing the result in the render cache
+* ``layout``: wrapping and aligning the text into glyph bands
+* ``glyphs``: looking up glyphs and building the glyph rows
+* ``color``: painting gradients
+* ``border``: adding color codes and the border
+
+Without a profiler, rendering only pays for one attribute check.
+"""
+
+from __future__ import annotations
+
+from collections import namedtuple
+import threading
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Callable, Dict
+
+STAGES = ("validate", "cache", "layout", "glyphs", "color", "border")
+
+RenderSample = namedtuple("RenderSample", ["stages", "chars", "fallbacks", "cache_hit"])
+RenderSample.__doc__ = """
+Measurements of one render.
+
+Attributes:
+    stages (Dict[str, float]): Seconds spent in each stage of ``STAGES``; stages that did not run are 0.
+    chars (int): Number of characters of the text.
+    fallbacks (int): Number of characters the font could not draw, drawn according to the fallback policy.
+    cache_hit (Optional[bool]): Whether the result came from the render cache, or None if the cache is disabled.
+"""
+
+
+class Profiler:
+    """
+    Thread-safe aggregate of render samples, with hooks called for every sample.
+
+    Attributes:
+        hooks (List[Callable[[RenderSample], None]]): Functions called with every sample, in registration order.
+    """
+
+    def __init__(self):
+        self.hooks = []
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all recorded samples. Hooks stay registered."""
+        with self._lock:
+            self._seconds = dict.fromkeys(STAGES, 0.0)
+            self._calls = dict.fromkeys(STAGES, 0)
+            self._counters = {"renders": 0, "chars": 0, "fallbacks": 0, "cache_hits": 0, "cache_misses": 0}
+
+    def add_hook(self, hook: Callable[[RenderSample], None]) -> Callable[[RenderSample], None]:
+        """
+        Register a function to call with every render sample.
+
+        Hooks run on the rendering thread, after the render and before its result is returned, so they should be
+        quick. Returns the hook, so this can be used as a decorator.
+
+        Args:
+            hook (Callable[[RenderSample], None]): Function to call.
+
+        Returns:
+            Callable[[RenderSample], None]: ``hook``.
+        """
+        self.hooks.append(hook)
+        return hook
+
+    def remove_hook(self, hook: Callable[[RenderSample], None]) -> None:
+        """
+        Unregister a hook.
+
+        Args:
+            hook (Callable[[RenderSample], None]): A function passed to ``add_hook``.
+
+        Raises:
+            ValueError: If the hook is not registered.
+        """
+        self.hooks.remove(hook)
+
+    def record(self, sample: RenderSample) -> None:
+        """
+        Add a render sample to the totals and pass it to the hooks.
+
+        Args:
+            sample (RenderSample): Measurements of one render.
+        """
+        with self._lock:
+            for stage, seconds in sample.stages.items():
+                if seconds:
+                    self._seconds[stage] += seconds
+                    self._calls[stage] += 1
+            counters = self._counters
+            counters["renders"] += 1
+            counters["chars"] += sample.chars
+            counters["fallbacks"] += sample.fallbacks
+            if sample.cache_hit is not None:
+                counters["cache_hits" if sample.cache_hit else "cache_misses"] += 1
+        for hook in self.hooks:
+            hook(sample)
+
+    def stats(self) -> dict:
+        """
+        Report the totals.
+
+        Returns:
+            dict: ``renders``, ``chars``, ``fallbacks``, ``cache_hits`` and ``cache_misses`` counts, and ``stages``
+            mapping each stage to its ``calls``, ``total_ms`` and ``mean_us``.
+        """
+        with self._lock:
+            stats = dict(self._counters)
+            stats["stages"] = {
+                stage: {
+                    "calls": self._calls[stage],
+                    "total_ms": round(self._seconds[stage] * 1e3, 3),
+                    "mean_us": round(self._seconds[stage] * 1e6 / self._calls[stage], 2) if self._calls[stage] else 0.0,
+                }
+                for stage in STAGES
+            }
+        return stats
+
+    def report(self) -> str:
+        """
+        Format the totals as a table of stages followed by the counters.
+
+        Returns:
+            str: The report, without a trailing newline.
+        """
+        stats = self.stats()
+        stages: Dict[str, dict] = stats.pop("stages")
+        total = sum(stage["total_ms"] for stage in stages.values())
+        lines = [f"{'stage':<10}{'calls':>8}{'total ms':>12}{'mean us':>12}{'share':>8}"]
+        for name, stage in stages.items():
+            share = stage["total_ms"] / total if total else 0.0
+            lines.append(f"{name:<10}{stage['calls']:>8}{stage['total_ms']:>12.3f}{stage['mean_us']:>12.2f}{share:>8.1%}")
+        lines.append(f"{'total':<10}{'':>8}{total:>12.3f}")
+        lines.append("  ".join(f"{name}: {value}" for name, value in stats.items()))
+        return "\n".join(lines)
@@ -0,0 +1,124 @@
+"""
+Precompiled renderers for fixed style configurations.
+
+``ASCIIGenerator.compile()`` checks a font, color, border and the other rendering options once and returns a
+``Renderer`` holding everything derived from them: the compiled glyph tables, the escape codes written around the
+art, the gradient, and the border rows for each width rendered so far. ``Renderer.render`` then only lays out and
+draws the text::
+
+    banner = generator.compile(font="block", color="red", border="double")
+    for text in texts:
+        print(banner.render(text))
+
+Results go through the generator's render cache and profiler like those of ``generate``. A renderer keeps the
+glyphs and colors it was compiled with, even when the font or color is registered again later; compile a new one to
+pick up the change.
+"""
+
+from __future__ import annotations
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Optional, Union
+
+    from .colors import Gradient
+    from .core import ASCIIGenerator, BorderStyle, _CompiledFont
+
+
+class Renderer:
+    """
+    Immutable rendering plan for one combination of style options.
+
+    Attributes:
+        font (str): Font name.
+        color (Optional[str]): Color specification, or None.
+        border (Optional[str | BorderStyle]): Border character, style name or style, or None.
+        width (Optional[int]): Maximum output width in columns, or None.
+        align (str): Alignment of lines and wrapped bands.
+        backend (str): Rendering backend, resolved against the generator's default.
+        layout (str): Glyph layout.
+        line_spacing (int): Blank rows between glyph bands.
+        compiled (_CompiledFont): Compiled glyph tables of the font in the layout.
+    """
+
+    __slots__ = (
+        "font",
+        "color",
+        "border",
+        "width",
+        "align",
+        "backend",
+        "layout",
+        "line_spacing",
+        "compiled",
+        "_generator",
+        "_args",
+    )
+
+    def __init__(
+        self,
+        generator: ASCIIGenerator,
+        font: str,
+        color: Optional[str],
+        border: Optional[Union[str, BorderStyle]],
+        width: Optional[int],
+        align: str,
+        backend: str,
+        layout: str,
+        line_spacing: int,
+        compiled: _CompiledFont,
+        prefix: str,
+        suffix: str,
+        gradient: Optional[Gradient],
+    ):
+        """
+        Use ``ASCIIGenerator.compile()``, which checks the options, rather than creating renderers directly.
+
+        Args:
+            generator (ASCIIGenerator): Generator whose render cache and profiler are used.
+            font, color, border, width, align, backend, layout, line_spacing: Style options (see the attributes).
+            compiled (_CompiledFont): Compiled glyph tables of the font in the layout.
+            prefix (str): Escape code written before the art.
+            suffix (str): Escape code written after the art.
+            gradient (Gradient, optional): Gradient painted over the art, or None.
+        """
+        set_slot = object.__setattr__
+        set_slot(self, "font", font)
+        set_slot(self, "color", color)
+        set_slot(self, "border", border)
+        set_slot(self, "width", width)
+        set_slot(self, "align", align)
+        set_slot(self, "backend", backend)
+        set_slot(self, "layout", layout)
+        set_slot(self, "line_spacing", line_spacing)
+        set_slot(self, "compiled", compiled)
+        set_slot(self, "_generator", generator)
+        # The arguments of ``ASCIIGenerator._render`` after the text; the last one is the memo of border rows.
+        args = (font, color, border, width, align, backend, compiled, prefix, suffix, gradient, line_spacing, {})
+        set_slot(self, "_args", args)
+
+    def render(self, text: str) -> str:
+        """
+        Render a text in this style.
+
+        Args:
+            text (str): The input string to convert into ASCII art.
+
+        Returns:
+            str: Formatted ASCII art string, the same as ``generate`` returns for the same options.
+
+        Raises:
+            ValueError: If the fallback policy is "raise" and the font cannot draw a character of the text.
+        """
+        return self._generator._render(text, *self._args)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        names = ("font", "color", "border", "width", "align", "backend", "layout", "line_spacing")
+        options = ", ".join(f"{name}={getattr(self, name)!r}" for name in names)
+        return f"{type(self).__name__}({options})"
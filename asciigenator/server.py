@@ -0,0 +1,370 @@
+"""
+Long-lived rendering server for the ``asciigen`` command.
+
+``asciigen --serve`` listens on a Unix domain socket with fonts loaded and the render cache enabled. ``asciigen
+--server`` invocations (or all of them, with ``$ASCIIGENATOR_SERVER`` set) forward their options to it instead of
+importing the renderer and loading fonts themselves, and render in-process when no server is running. Clients only
+connect to a socket owned by the current user.
+
+The protocol is one JSON object per connection and line in each direction. A request is one of::
+
+    {"command": "render", "options": {"text": "Hi", "font": "block"}}
+    {"command": "stats"}
+    {"command": "stop"}
+
+Render options are those of ``asciigen``, using the long option names; missing options take their default values.
+A render reply is ``{"code": 0, "stdout": "...", "stderr": ""}``, which makes the server easy to call from any
+language, e.g. ``echo '{"command": "render", "options": {"text": "Hi"}}' | nc -U "$ASCIIGENATOR_SOCKET"``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import stat
+import time
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import List, Optional, Tuple
+
+    from .core import ASCIIGenerator
+
+# Number of recent requests kept for the latency percentiles and the recent request rate.
+_LATENCY_WINDOW = 1024
+# Number of generators kept for requests forwarding font directories the server was not started with.
+_FONT_DIR_GENERATORS = 8
+
+
+def default_socket_path() -> str:
+    """
+    Socket the server listens on when none is given.
+
+    Returns:
+        str: ``$ASCIIGENATOR_SOCKET`` if set, otherwise ``asciigenator.sock`` in ``$XDG_RUNTIME_DIR``, otherwise
+        ``asciigenator.sock`` in a private per-user directory under the temporary directory.
+    """
+    path = os.environ.get("ASCIIGENATOR_SOCKET")
+    if path:
+        return path
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or _fallback_dir()
+    return os.path.join(runtime_dir, "asciigenator.sock")
+
+
+def _fallback_dir() -> str:
+    """Per-user directory holding the default socket when ``$XDG_RUNTIME_DIR`` is not set."""
+    tmp_dir = os.environ.get("TMPDIR") or "/tmp"
+    return os.path.join(tmp_dir, f"asciigenator-{getattr(os, 'getuid', lambda: 0)()}")
+
+
+def _make_private_dir(path: str) -> None:
+    """Create ``path`` with access for the current user only, or check that an existing ``path`` is like that."""
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or stat.S_IMODE(st.st_mode) & 0o077:
+        raise OSError(f"'{path}' must be a directory that only the current user can access.")
+
+
+def _is_own_socket(path: str) -> bool:
+    """Whether ``path`` is a Unix domain socket owned by the current user, and so a server that can be trusted."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(st.st_mode) and st.st_uid == os.getuid()
+
+
+def request(message: dict, path: Optional[str] = None, timeout: float = 30.0) -> Optional[dict]:
+    """
+    Send a request to a running server and return its reply.
+
+    Args:
+        message (dict): Request, see the module documentation.
+        path (str, optional): Server socket. Defaults to None (see ``default_socket_path()``).
+        timeout (float, optional): Seconds to wait for the reply. Defaults to 30.
+
+    Returns:
+        dict: The reply, or None if no server is reachable or the socket is not owned by the current user.
+    """
+    path = path or default_socket_path()
+    if not hasattr(socket, "AF_UNIX") or not _is_own_socket(path):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+            sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as f:
+                line = f.readline()
+    except OSError:
+        return None
+    return json.loads(line) if line else None
+
+
+class RenderServer:
+    """
+    Rendering server bound to a Unix domain socket.
+
+    Requests are handled on their own threads against the global ``ASCIIGenerator``, so every request shares its
+    loaded fonts and render cache. Requests forwarding font directories the server was not started with render with
+    a generator of their own per set of directories, loaded once and kept for later requests, so their fonts never
+    replace or add to those of other clients.
+
+    Attributes:
+        path (str): Socket path.
+        idle_timeout (float): Seconds without requests after which ``serve_forever()`` returns, or 0 to never stop.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        idle_timeout: float = 600.0,
+        cache_size: int = 4096,
+        segment_cache_size: int = 4096,
+    ):
+        """
+        Args:
+            path (str, optional): Socket path. Defaults to None (see ``default_socket_path()``).
+            idle_timeout (float, optional): Seconds without requests before shutting down, or 0 to run until stopped.
+                Defaults to 600.
+            cache_size (int, optional): Number of renders to cache if the global generator has no cache configured.
+                Defaults to 4096.
+            segment_cache_size (int, optional): Number of words per font to keep in the segment cache if the global
+                generator has none configured. Defaults to 4096.
+        """
+        import threading
+        from collections import deque
+
+        from .cache import LRUCache
+
+        self.path = path or default_socket_path()
+        self.idle_timeout = idle_timeout
+        self.cache_size = cache_size
+        self.segment_cache_size = segment_cache_size
+        self._lock = threading.Lock()
+        self._stopping = False
+        self._active = 0
+        self._requests = 0
+        self._errors = 0
+        self._started = time.monotonic()
+        self._last_activity = self._started
+        self._recent = deque(maxlen=_LATENCY_WINDOW)  # (finish time, latency) of recent renders
+        self._font_dirs = frozenset()  # directories loaded into the global generator
+        self._generators = LRUCache(_FONT_DIR_GENERATORS)  # generator by forwarded font directories
+
+    def warm(self, font_dirs: List[str] = ()) -> None:
+        """
+        Load extra font directories, compile every font and enable the render and segment caches.
+
+        Args:
+            font_dirs (List[str], optional): Font directories to register. Defaults to ().
+        """
+        from .core import _get_generator
+
+        generator = _get_generator()
+        for directory in font_dirs:
+            generator.load_font_dir(directory)
+        self._font_dirs = frozenset(font_dirs)
+        for font in generator.list_fonts():
+            generator._compile_font(font)
+        if generator._cache is None:
+            generator.configure_cache(maxsize=self.cache_size)
+        if not generator._segment_cache_size:
+            generator.configure_segment_cache(self.segment_cache_size)
+
+    def handle(self, message) -> dict:
+        """
+        Answer one request.
+
+        Args:
+            message: Decoded request, see the module documentation.
+
+        Returns:
+            dict: The reply.
+        """
+        command = message.get("command") if isinstance(message, dict) else None
+        if command == "stats":
+            return {"code": 0, "stats": self.stats()}
+        if command == "stop":
+            self._stopping = True
+            return {"code": 0}
+        if command != "render" or not isinstance(message.get("options"), dict):
+            return {"code": 2, "stdout": "", "stderr": "Error: Malformed request.\n"}
+        return self._render(message["options"])
+
+    def _render(self, options: dict) -> dict:
+        """Run a forwarded ``asciigen`` command line and record its latency."""
+        import io
+        from .cli import _RENDER_OPTIONS, _build_parser, _execute
+
+        start = time.monotonic()
+        with self._lock:
+            self._active += 1
+            self._last_activity = start
+        stdout, stderr = io.StringIO(), io.StringIO()
+        try:
+            args = _build_parser().parse_args([])
+            for name in _RENDER_OPTIONS:
+                if name in options:
+                    setattr(args, name, options[name])
+            font_dirs, args.font_dir = tuple(args.font_dir), []
+            generator = None if self._font_dirs.issuperset(font_dirs) else self._generator(font_dirs)
+            code = _execute(args, stdout, stderr, cached=True, generator=generator)
+        except Exception as e:  # a bad request must not take the server down
+            stderr.write(f"Error: {e}\n")
+            code = 1
+        finish = time.monotonic()
+        with self._lock:
+            self._active -= 1
+            self._last_activity = finish
+            self._requests += 1
+            self._errors += code != 0
+            self._recent.append((finish, finish - start))
+        return {"code": code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+    def _generator(self, font_dirs: Tuple[str, ...]) -> ASCIIGenerator:
+        """The generator for requests forwarding ``font_dirs``, created and loaded on first use."""
+        generator = self._generators.get(font_dirs)
+        if generator is None:
+            from .core import ASCIIGenerator
+
+            generator = ASCIIGenerator(cache_size=self.cache_size, segment_cache_size=self.segment_cache_size)
+            for directory in font_dirs:
+                generator.load_font_dir(directory)
+            self._generators.put(font_dirs, generator)
+        return generator
+
+    def stats(self) -> dict:
+        """
+        Report request counts, rates and latencies.
+
+        Returns:
+            dict: ``uptime_s``, ``requests``, ``errors``, ``rate_per_s`` (since start), ``recent_rate_per_s``
+            (over the last minute), ``latency_ms`` (``mean``, ``p50``, ``p95`` and ``max`` over the last 1024
+            renders), ``cache`` and ``segment_cache`` (cache statistics) and ``fonts_loaded``.
+        """
+        from .core import _get_generator
+
+        now = time.monotonic()
+        with self._lock:
+            recent = list(self._recent)
+            requests, errors = self._requests, self._errors
+        uptime = now - self._started
+        latencies = sorted(latency * 1000 for _, latency in recent)
+
+        def percentile(q):
+            return round(latencies[min(len(latencies) - 1, int(q * len(latencies)))], 3) if latencies else 0.0
+
+        generator = _get_generator()
+        cache = generator.cache_info()
+        return {
+            "uptime_s": round(uptime, 1),
+            "requests": requests,
+            "errors": errors,
+            "rate_per_s": round(requests / uptime, 2) if uptime else 0.0,
+            "recent_rate_per_s": round(sum(1 for finish, _ in recent if now - finish <= 60) / min(60, uptime), 2),
+            "latency_ms": {
+                "mean": round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+                "p50": percentile(0.5),
+                "p95": percentile(0.95),
+                "max": round(latencies[-1], 3) if latencies else 0.0,
+            },
+            "cache": cache._asdict() if cache is not None else None,
+            "segment_cache": generator.segment_cache_info()._asdict(),
+            "fonts_loaded": sorted(generator.fonts.loaded()),
+        }
+
+    def stop(self) -> None:
+        """Make ``serve_forever()`` return after the requests in progress."""
+        self._stopping = True
+
+    def _is_idle(self) -> bool:
+        """Whether the idle timeout has expired with no request in progress."""
+        with self._lock:
+            idle = not self._active and time.monotonic() - self._last_activity >= self.idle_timeout
+        return bool(self.idle_timeout) and idle
+
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        """
+        Listen on the socket until stopped or idle for ``idle_timeout`` seconds. The socket file is removed on exit.
+
+        The default socket directory under the temporary directory is created accessible to the current user only.
+
+        Args:
+            poll_interval (float, optional): Seconds between checks for the stop request and the idle timeout.
+                Defaults to 0.5.
+
+        Raises:
+            OSError: If Unix domain sockets are not supported, another server is already listening on the socket,
+                the default socket directory is accessible to other users or the socket cannot be created.
+        """
+        import socketserver
+
+        if not hasattr(socketserver, "UnixStreamServer"):
+            raise OSError("Server mode needs Unix domain sockets, which this platform does not support.")
+        if os.path.dirname(self.path) == _fallback_dir():
+            _make_private_dir(_fallback_dir())
+        if os.path.exists(self.path):
+            if request({"command": "stats"}, self.path, timeout=poll_interval) is not None:
+                raise OSError(f"A server is already running on '{self.path}'.")
+            os.remove(self.path)  # left behind by a server that did not shut down cleanly
+
+        owner = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                try:
+                    message = json.loads(self.rfile.readline())
+                except ValueError:
+                    message = None
+                self.wfile.write(json.dumps(owner.handle(message)).encode("utf-8") + b"\n")
+
+        class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+            daemon_threads = True
+
+        umask = os.umask(0o177)  # only the owner may connect
+        try:
+            server = Server(self.path, Handler)
+        finally:
+            os.umask(umask)
+        server.timeout = poll_interval
+        self._last_activity = time.monotonic()
+        try:
+            with server:
+                while not self._stopping and not self._is_idle():
+                    server.handle_request()
+        finally:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+
+def serve(path: Optional[str] = None, idle_timeout: float = 600.0, font_dirs: List[str] = ()) -> None:
+    """
+    Run a warmed-up rendering server in the foreground until it is stopped, idles out or gets SIGTERM.
+
+    Args:
+        path (str, optional): Socket path. Defaults to None (see ``default_socket_path()``).
+        idle_timeout (float, optional): Seconds without requests before shutting down, or 0 to run until stopped.
+            Defaults to 600.
+        font_dirs (List[str], optional): Extra font directories to load up front. Defaults to ().
+
+    Raises:
+        OSError: If the server cannot listen on the socket.
+    """
+    import signal
+
+    server = RenderServer(path, idle_timeout)
+    server.warm(font_dirs)
+    previous = signal.signal(signal.SIGTERM, lambda signum, frame: server.stop())
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        signal.signal(signal.SIGTERM, previous)
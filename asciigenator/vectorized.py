@@ -0,0 +1,79 @@
+"""
+NumPy rendering backend.
+
+A font is stored as one 3-D ``uint32`` code point array (glyph x row x column). A band of text is rendered by
+fancy-indexing that array with the glyph number of every input character and reshaping the result into a 2-D canvas
+in one vectorized step; only the final conversion of each canvas row back to a string is done per row.
+
+Glyph rows of different lengths are padded with NUL, which is dropped again when the rows are turned into strings,
+so the output is identical to the pure-Python path. Fonts whose glyphs themselves contain NUL are not supported.
+
+This module requires NumPy and is only imported when the "numpy" or "auto" backend is used.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import List, Optional
+
+    from .core import _CompiledFont
+
+_CODE_POINT = np.dtype("<u4")
+
+
+def _code_points(text: str) -> np.ndarray:
+    """Encode text as an array of code points."""
+    return np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=_CODE_POINT)
+
+
+class GlyphArray:
+    """
+    A compiled font as a ``(glyphs, height, width)`` array of code points.
+
+    Only characters the font defines are rendered; texts with others are left to the compiled lookup tables, which
+    handle transliteration and the fallback policy.
+
+    Attributes:
+        codes (np.ndarray): Sorted code point of each glyph.
+        glyphs (np.ndarray): Code points of every glyph row, including the letter spacing column, padded with 0.
+        supported (bool): False if the font cannot be rendered by this backend.
+    """
+
+    __slots__ = ("codes", "glyphs", "supported")
+
+    def __init__(self, compiled: _CompiledFont):
+        """
+        Args:
+            compiled (_CompiledFont): Font to convert.
+        """
+        table = compiled.source
+        height = compiled.height
+        self.codes = np.asarray(table.arrays()["codes"]).astype(_CODE_POINT)
+        rows = [table.row(glyph, i) + " " for glyph in range(len(table)) for i in range(height)]
+        width = max(map(len, rows), default=0)
+        self.supported = not any("\0" in row for row in rows)
+        canvas = _code_points("".join(row.ljust(width, "\0") for row in rows))
+        self.glyphs = canvas.reshape(len(table), height, width)
+
+    def rows(self, band: str) -> Optional[List[str]]:
+        """
+        Render the glyph rows of one band.
+
+        Args:
+            band (str): Text of the band, in the case it is drawn in.
+
+        Returns:
+            List[str]: The rows, with trailing whitespace removed, or None if the font does not define every
+            character of the band.
+        """
+        chars = _code_points(band)
+        index = np.searchsorted(self.codes, chars)
+        if index.size and (index.max() >= len(self.codes) or not (self.codes[index] == chars).all()):
+            return None
+        # (chars, rows, columns) -> (rows, chars * columns): each row of the canvas is one output row.
+        _, height, width = self.glyphs.shape
+        canvas = self.glyphs[index].transpose(1, 0, 2).reshape(height, len(chars) * width)
+        return [row[row != 0].tobytes().decode("utf-32-le", "surrogatepass").rstrip() for row in canvas]
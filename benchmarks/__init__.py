@@ -0,0 +1,10 @@
+"""
+Performance benchmarks for asciigenator.
+
+Benchmark modules follow the airspeed velocity (asv) layout: classes with ``params``/``param_names``, an optional
+``setup`` and ``time_*`` methods. They can be run with asv, or without any extra dependency through the bundled
+harness::
+
+    python -m benchmarks run -o results.json
+    python -m benchmarks compare baseline.json results.json --threshold 0.1
+"""
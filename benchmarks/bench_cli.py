@@ -0,0 +1,79 @@
+"""
+Cold-start time of the package and the ``asciigenator`` command, each in a fresh interpreter.
+"""
+
+import os
+import subprocess
+import sys
+
+import asciigenator
+
+
+class _Startup:
+    """Runs commands in a fresh interpreter against the benchmarked copy of the package."""
+
+    number = 1
+    repeat = 10
+
+    def setup(self):
+        # Run the subprocesses against the same copy of the package the benchmarks import.
+        self.env = dict(os.environ)
+        root = os.path.dirname(os.path.dirname(os.path.abspath(asciigenator.__file__)))
+        self.env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, self.env.get("PYTHONPATH")]))
+        self.env.pop("ASCIIGENATOR_SERVER", None)  # only TimeServerStartup forwards to a server
+        self._run("-c", "import asciigenator")  # warm the bytecode cache
+
+    def _run(self, *args):
+        subprocess.run([sys.executable, *args], env=self.env, stdout=subprocess.DEVNULL, check=True)
+
+
+class TimeStartup(_Startup):
+    """Process start-up, measured once per call since every call spawns an interpreter."""
+
+    def time_python(self):
+        self._run("-c", "pass")
+
+    def time_import(self):
+        self._run("-c", "import asciigenator")
+
+    def time_cli_render(self):
+        self._run("-m", "asciigenator.cli", "Hello", "--font", "block", "--border", "single")
+
+    def time_cli_list_fonts(self):
+        self._run("-m", "asciigenator.cli", "--list-fonts")
+
+
+class TimeServerStartup(_Startup):
+    """The CLI commands of ``TimeStartup`` answered by a server started for the benchmark."""
+
+    def setup(self):
+        import tempfile
+        import time
+
+        super().setup()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.socket = os.path.join(self.tmp.name, "bench.sock")
+        self.server = subprocess.Popen(
+            [sys.executable, "-m", "asciigenator.cli", "--serve", "--socket", self.socket, "--idle-timeout", "0"],
+            env=self.env,
+        )
+        deadline = time.monotonic() + 30
+        while not os.path.exists(self.socket):
+            if self.server.poll() is not None or time.monotonic() > deadline:
+                self.server.kill()
+                self.tmp.cleanup()
+                raise RuntimeError("The benchmark server did not start.")
+            time.sleep(0.01)
+
+    def teardown(self):
+        self._run("-m", "asciigenator.cli", "--stop-server", "--socket", self.socket)
+        self.server.wait()
+        self.tmp.cleanup()
+
+    def time_cli_render(self):
+        self._run(
+            "-m", "asciigenator.cli", "Hello", "--font", "block", "--border", "single", "--server", "--socket", self.socket
+        )
+
+    def time_cli_list_fonts(self):
+        self._run("-m", "asciigenator.cli", "--list-fonts", "--server", "--socket", self.socket)
@@ -0,0 +1,168 @@
+"""
+Rendering throughput: fonts, text lengths, colors, borders and batches.
+"""
+
+from asciigenator.core import ASCIIGenerator
+
+TEXTS = {
+    "short": "Hello World",
+    "long": " ".join(["The quick brown fox jumps over the lazy dog"] * 25),
+}
+
+
+class TimeGenerate:
+    """Single renders for every font, on short and long texts."""
+
+    params = (["simple", "block"], ["short", "long"])
+    param_names = ("font", "length")
+
+    def setup(self, font, length):
+        self.gen = ASCIIGenerator()
+        self.text = TEXTS[length]
+        # Load and compile the font up front so only rendering is timed.
+        self.gen.generate(self.text, font=font)
+
+    def time_generate(self, font, length):
+        self.gen.generate(self.text, font=font)
+
+    def time_generate_wrapped(self, font, length):
+        self.gen.generate(self.text, font=font, width=80, align="center")
+
+    def time_iter_lines(self, font, length):
+        for _ in self.gen.iter_lines(self.text, font=font):
+            pass
+
+
+class TimeStyles:
+    """Color and border combinations on a short text."""
+
+    params = ([None, "red"], [None, "*", "single", "double"])
+    param_names = ("color", "border")
+
+    def setup(self, color, border):
+        self.gen = ASCIIGenerator()
+        self.art = self.gen.generate(TEXTS["short"], font="block", color=color)
+        self.gen.generate(TEXTS["short"], font="block", color=color, border=border)
+
+    def time_generate(self, color, border):
+        self.gen.generate(TEXTS["short"], font="block", color=color, border=border)
+
+    def time_add_border(self, color, border):
+        ASCIIGenerator._add_border(self.art, border or "#")
+
+
+class TimeColors:
+    """Solid colors against gradients in every mode, on short and long texts."""
+
+    params = (["red", "#ff8800 on black", "red:blue", "196:21", "rainbow@vertical", "rainbow@glyph"], ["short", "long"])
+    param_names = ("color", "length")
+
+    def setup(self, color, length):
+        self.gen = ASCIIGenerator()
+        self.text = TEXTS[length]
+        # Parses the color specification and computes the gradient's escape sequences up front.
+        self.gen.generate(self.text, font="block", color=color)
+
+    def time_generate(self, color, length):
+        self.gen.generate(self.text, font="block", color=color)
+
+
+class TimeFormats:
+    """Every output format, on short and long texts."""
+
+    params = (["ansi", "html", "svg", "bitmap"], ["short", "long"])
+    param_names = ("format", "length")
+
+    def setup(self, format, length):
+        self.gen = ASCIIGenerator()
+        self.text = TEXTS[length]
+        self.gen.export(self.text, format, font="block", color="rainbow@glyph")
+
+    def time_export(self, format, length):
+        self.gen.export(self.text, format, font="block", color="rainbow@glyph", border="single")
+
+
+class TimeSegmentCache:
+    """Unique texts built from shared words, with and without the segment cache."""
+
+    params = ([None, 1024], ["short", "long"])
+    param_names = ("segment_cache_size", "length")
+
+    def setup(self, segment_cache_size, length):
+        self.gen = ASCIIGenerator(segment_cache_size=segment_cache_size, backend="python")
+        words = ["PROD-", "US-EAST", "US-WEST", "ACME", "GLOBEX", "API", "DB"]
+        count = 3 if length == "short" else 60
+        self.texts = [" ".join(words[(i * 7 + j * 3) % len(words)] + str(i) for j in range(count)) for i in range(100)]
+        self.gen.generate_many(self.texts, font="block")
+
+    def time_generate_many(self, segment_cache_size, length):
+        self.gen.generate_many(self.texts, font="block")
+
+
+class TimeBatch:
+    """Batches of 1000 texts, with and without the render cache."""
+
+    params = ([None, 1024],)
+    param_names = ("cache_size",)
+
+    def setup(self, cache_size):
+        self.gen = ASCIIGenerator(cache_size=cache_size)
+        # A realistic batch repeats labels, which is what the cache is for.
+        self.texts = [f"Item {i % 100}" for i in range(1000)]
+        self.gen.generate_many(self.texts, font="block")
+
+    def time_generate_many(self, cache_size):
+        self.gen.generate_many(self.texts, font="block", border="single")
+
+    def time_iter_generate(self, cache_size):
+        for _ in self.gen.iter_generate(self.texts, font="block"):
+            pass
+
+
+class TimeLayouts:
+    """Full width glyphs against kerning and smushing, on distinct short and long texts."""
+
+    params = (["full", "kerning", "smush"], ["short", "long"])
+    param_names = ("layout", "length")
+
+    def setup(self, layout, length):
+        self.gen = ASCIIGenerator()
+        # More texts than each font memoizes compositions of, so every render composes its text.
+        self.texts = [f"{TEXTS[length]} {i}" for i in range(300)]
+        self.gen.generate_many(self.texts, font="block", layout=layout)
+
+    def time_generate_many(self, layout, length):
+        self.gen.generate_many(self.texts, font="block", layout=layout)
+
+
+class TimeMultiline:
+    """Multi-line texts stacked onto one canvas, with and without a border."""
+
+    params = ([1, 8, 32], [None, "single"])
+    param_names = ("lines", "border")
+
+    def setup(self, lines, border):
+        self.gen = ASCIIGenerator(cache_size=0)
+        self.text = "\n".join(f"Line {i}" for i in range(lines))
+
+    def time_generate(self, lines, border):
+        self.gen.generate(self.text, font="block", border=border, align="center")
+
+
+class TimeRenderer:
+    """A fixed style rendered with generate and with a compiled renderer, with and without the render cache."""
+
+    params = (["generate", "renderer"], [False, True])
+    param_names = ("entry", "cached")
+
+    def setup(self, entry, cached):
+        self.gen = ASCIIGenerator(cache_size=64 if cached else None)
+        style = {"font": "block", "color": "red", "border": "double"}
+        if entry == "renderer":
+            self.render = self.gen.compile(**style).render
+        else:
+            self.render = lambda text: self.gen.generate(text, **style)
+        self.render("Hello")
+
+    def time_render(self, entry, cached):
+        self.render("Hello")
@@ -0,0 +1,281 @@
+"""
+Minimal benchmark runner and comparison tool for the asv-style benchmark modules in this package.
+"""
+
+import argparse
+import importlib
+import itertools
+import json
+import os
+import pkgutil
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from typing import Dict, Iterator, List, Optional, Tuple
+
+RESULTS_VERSION = 1
+DEFAULT_THRESHOLD = 0.10
+
+
+def discover(pattern: Optional[str] = None) -> Iterator[Tuple[str, type, str, tuple]]:
+    """
+    Find every benchmark in the ``bench_*`` modules of this package.
+
+    Args:
+        pattern (str, optional): Regular expression a benchmark name must contain. Defaults to None (all).
+
+    Yields:
+        Tuple[str, type, str, tuple]: Benchmark name, class, method name and parameter values.
+    """
+    package = os.path.dirname(os.path.abspath(__file__))
+    regex = re.compile(pattern) if pattern else None
+    for info in sorted(pkgutil.iter_modules([package]), key=lambda info: info.name):
+        if not info.name.startswith("bench_"):
+            continue
+        module = importlib.import_module(f"{__package__}.{info.name}")
+        for cls_name, cls in sorted(vars(module).items()):
+            if not isinstance(cls, type) or cls.__module__ != module.__name__:
+                continue
+            params = getattr(cls, "params", ())
+            # asv allows a single parameter to be given as a flat list.
+            if params and not isinstance(params[0], (list, tuple)):
+                params = (params,)
+            for method in sorted(name for name in vars(cls) if name.startswith("time_")):
+                for values in itertools.product(*params):
+                    name = f"{info.name}.{cls_name}.{method}"
+                    if values:
+                        name += f"({', '.join(map(repr, values))})"
+                    if regex is None or regex.search(name):
+                        yield name, cls, method, values
+
+
+def measure(cls: type, method: str, values: tuple, min_time: float = 0.2, repeat: int = 5) -> Dict[str, float]:
+    """
+    Time one benchmark.
+
+    The number of calls per sample is picked so a sample takes at least ``min_time`` seconds, unless the class sets
+    ``number``; the class may also override ``repeat``.
+
+    Args:
+        cls (type): Benchmark class.
+        method (str): Name of the ``time_*`` method.
+        values (tuple): Parameter values passed to ``setup`` and the method.
+        min_time (float, optional): Minimum duration of one sample in seconds. Defaults to 0.2.
+        repeat (int, optional): Number of samples. Defaults to 5.
+
+    Returns:
+        Dict[str, float]: Per-call ``min``, ``median``, ``mean`` and ``stdev`` in seconds, with ``number`` and
+        ``repeat``.
+    """
+    instance = cls()
+    if hasattr(instance, "setup"):
+        instance.setup(*values)
+    try:
+        timer = timeit.Timer(lambda: getattr(instance, method)(*values))
+        number = getattr(cls, "number", 0)
+        if not number:
+            number = 1
+            while True:
+                if timer.timeit(number) >= min_time:
+                    break
+                number *= 2 if number < 10 else 10
+        repeat = getattr(cls, "repeat", repeat)
+        samples = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    finally:
+        if hasattr(instance, "teardown"):
+            instance.teardown(*values)
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.mean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    """Return the commit the working tree is on, if it is a git checkout."""
+    try:
+        proc = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return proc.stdout.strip()
+
+
+def run(pattern: Optional[str] = None, min_time: float = 0.2, repeat: int = 5, log=None) -> dict:
+    """
+    Run the benchmarks and collect their results.
+
+    Args:
+        pattern (str, optional): Regular expression selecting benchmarks by name. Defaults to None (all).
+        min_time (float, optional): Minimum duration of one sample in seconds. Defaults to 0.2.
+        repeat (int, optional): Number of samples per benchmark. Defaults to 5.
+        log (file, optional): Stream to report progress on. Defaults to None (silent).
+
+    Returns:
+        dict: Results document, see ``write_results()``.
+    """
+    results = {}
+    for name, cls, method, values in discover(pattern):
+        result = measure(cls, method, values, min_time, repeat)
+        results[name] = result
+        if log is not None:
+            print(f"{name:<70} {_format_time(result['median'])}", file=log)
+    return {
+        "version": RESULTS_VERSION,
+        "timestamp": time.time(),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "benchmarks": results,
+    }
+
+
+def write_results(results: dict, path: str) -> None:
+    """
+    Write a results document as JSON.
+
+    Args:
+        results (dict): Results returned by ``run()``.
+        path (str): Output file, or ``-`` for standard output.
+    """
+    text = json.dumps(results, indent=2, sort_keys=True) + "\n"
+    if path == "-":
+        sys.stdout.write(text)
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def load_results(path: str) -> dict:
+    """
+    Read a results document written by ``write_results()``.
+
+    Args:
+        path (str): JSON file.
+
+    Returns:
+        dict: The results document.
+
+    Raises:
+        ValueError: If the file is not a supported results document.
+    """
+    with open(path, encoding="utf-8") as f:
+        results = json.load(f)
+    if not isinstance(results, dict) or results.get("version") != RESULTS_VERSION:
+        raise ValueError(f"'{path}' is not a benchmark results file (version {RESULTS_VERSION}).")
+    return results
+
+
+def compare(
+    baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD, stat: str = "median"
+) -> List[Tuple[str, float, float, float]]:
+    """
+    Compare two results documents benchmark by benchmark.
+
+    Args:
+        baseline (dict): Reference results.
+        current (dict): New results.
+        threshold (float, optional): Relative slowdown tolerated before a benchmark counts as a regression.
+            Defaults to 0.10 (10%).
+        stat (str, optional): Statistic to compare, "min" or "median". Defaults to "median".
+
+    Returns:
+        List[Tuple[str, float, float, float]]: Name, baseline time, current time and ratio of every regression.
+    """
+    regressions = []
+    for name, result in current["benchmarks"].items():
+        base = baseline["benchmarks"].get(name)
+        if base is None or not base[stat]:
+            continue
+        ratio = result[stat] / base[stat]
+        if ratio > 1 + threshold:
+            regressions.append((name, base[stat], result[stat], ratio))
+    return regressions
+
+
+def _format_time(seconds: float) -> str:
+    """Format a duration with a unit suited to its magnitude."""
+    for unit, scale in (("s", 1), ("ms", 1e3), ("us", 1e6)):
+        if seconds * scale >= 1:
+            return f"{seconds * scale:8.2f} {unit}"
+    return f"{seconds * 1e9:8.2f} ns"
+
+
+def _print_comparison(baseline: dict, current: dict, threshold: float, stat: str) -> None:
+    """Print a side-by-side table of both result sets."""
+    names = sorted(set(baseline["benchmarks"]) | set(current["benchmarks"]))
+    for name in names:
+        base = baseline["benchmarks"].get(name)
+        new = current["benchmarks"].get(name)
+        if base is None or new is None:
+            status = "added" if base is None else "removed"
+            print(f"{name:<70} {status}")
+            continue
+        ratio = new[stat] / base[stat] if base[stat] else 1.0
+        flag = "  REGRESSION" if ratio > 1 + threshold else ""
+        print(f"{name:<70} {_format_time(base[stat])} -> {_format_time(new[stat])}  x{ratio:5.2f}{flag}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point: ``run`` benchmarks or ``compare`` two result files.
+
+    Args:
+        argv (List[str], optional): Arguments. Defaults to None (``sys.argv[1:]``).
+
+    Returns:
+        int: Exit status, 1 if ``compare`` found a regression.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Run and compare asciigenator benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run benchmarks and write the results as JSON")
+    run_parser.add_argument("-b", "--bench", help="Only run benchmarks whose name matches this regular expression")
+    run_parser.add_argument("-o", "--output", default="-", help="Output file (default: standard output)")
+    run_parser.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds per sample (default: 0.2)")
+    run_parser.add_argument("--repeat", type=int, default=5, help="Samples per benchmark (default: 5)")
+    run_parser.add_argument("--quick", action="store_true", help="Short samples, for smoke testing")
+
+    compare_parser = commands.add_parser("compare", help="Compare two result files and fail on regressions")
+    compare_parser.add_argument("baseline", help="Reference results file")
+    compare_parser.add_argument("current", help="New results file")
+    compare_parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Tolerated relative slowdown (default: {DEFAULT_THRESHOLD})",
+    )
+    compare_parser.add_argument("--stat", choices=("min", "median"), default="median", help="Statistic to compare")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        min_time, repeat = (0.01, 2) if args.quick else (args.min_time, args.repeat)
+        results = run(args.bench, min_time, repeat, log=sys.stderr)
+        write_results(results, args.output)
+        return 0
+
+    try:
+        baseline, current = load_results(args.baseline), load_results(args.current)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    _print_comparison(baseline, current, args.threshold, args.stat)
+    regressions = compare(baseline, current, args.threshold, args.stat)
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}.", file=sys.stderr)
+        return 1
+    return 0
@@ -31,3 +31,6 @@ extensions = [
     "sphinx.ext.napoleon",  # support Google/NumPy style docstrings
     "sphinx.ext.viewcode",  # add links to highlighted source code
 ]
+
+# Optional dependencies that are not installed to build the docs
+autodoc_mock_imports = ["numpy"]
@@ -30,12 +30,13 @@ setup(
     description="A Python library for generating ASCII art from text",
     long_description=long_description,
     long_description_content_type="text/markdown",
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     install_requires=[],  # no core requirements
     extras_require={
         "test": test_requires,
         "dev": dev_requires,
         "docs": docs_requires,
+        "numpy": ["numpy"],
         "all": test_requires + dev_requires + docs_requires,
     },
     classifiers=[
@@ -44,7 +45,6 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
@@ -54,7 +54,7 @@ setup(
         "Topic :: Artistic Software",
         "Topic :: Text Processing",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     entry_points={
         "console_scripts": [
             "asciigenator=asciigenator.cli:main",
@@ -1,6 +1,16 @@
 import asciigenator
+import asciigenator.cache
+import asciigenator.colors
+import asciigenator.formats
+import asciigenator.fonts
+import asciigenator.glyphs
+import asciigenator.kerning
+import os
+import re
+import subprocess
 import sys
 import io
+import pytest
 from contextlib import redirect_stdout, redirect_stderr
 from asciigenator import cli
 
@@ -151,6 +161,1204 @@ def test_case_insensitive():
     assert result_lower == result_upper
 
 
+def _reference_generate(text, font="simple", color=None, border=None):
+    """Original per-character implementation of ``generate``, kept as an output oracle."""
+    gen = asciigenator.core.ASCIIGenerator()
+    text = text.upper()
+    font_data = gen.fonts[font]
+    sample_char = next((c for c in text if c in font_data), " ")
+    height = len(font_data.get(sample_char, font_data[" "]))
+    lines = []
+    for i in range(height):
+        line = ""
+        for char in text:
+            char_lines = font_data.get(char, font_data.get(" ", [" " * len(font_data[sample_char][0])]))
+            line += char_lines[i] if i < len(char_lines) else " " * len(char_lines[0])
+            line += " "
+        lines.append(line.rstrip())
+    result = "\n".join(lines)
+    if color:
+        result = f"{gen.colors[color]}{result}{gen.reset}"
+    if border and result.strip():
+        lines = result.split("\n")
+        ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+        inner_width = max(len(ansi_escape.sub("", line)) for line in lines) + 2
+        bordered_lines = [border * (inner_width + 2), border + " " * inner_width + border]
+        for line in lines:
+            right_pad = " " * (inner_width - 1 - len(ansi_escape.sub("", line)))
+            bordered_lines.append(border + " " + line + right_pad + border)
+        bordered_lines += [border + " " * inner_width + border, border * (inner_width + 2)]
+        result = "\n".join(bordered_lines)
+    return result
+
+
+def test_generate_matches_reference_output():
+    """Test that compiled glyph tables produce byte-identical output to the per-character renderer."""
+    texts = ["", " ", "Hello World", "abc xyz", "A1B?", "MW KJ", "  trailing  ", "(a+b) = 42%!"]
+    for font in asciigenator.list_fonts():
+        for color in [None, "red", "bright_cyan"]:
+            for border in [None, "#", "ab"]:
+                for text in texts:
+                    expected = _reference_generate(text, font, color, border)
+                    assert asciigenator.generate(text, font, color, border) == expected
+
+
+def test_unicode_transliteration_and_fallback_policies():
+    """Test NFKD transliteration, the fallback policies and the case policy."""
+    assert asciigenator.generate("Ünïcode ß ﬁ Æ “é”") == asciigenator.generate('Unicode SS FI AE "E"')
+    gen = asciigenator.core.ASCIIGenerator()
+    compiled = gen._compile_font("simple")
+    gen.generate("éé ☃☃")
+    assert set(compiled.glyphs) == {ord(char) for char in "é ☃"}  # resolved once per unique character
+    assert compiled.glyphs[ord("é")] == compiled.glyphs[ord("E")] and compiled.glyphs[ord("☃")] == compiled.glyphs[32]
+    assert gen.generate("A☃B", font="block") == gen.generate("A B", font="block")
+
+    gen.fallback = "?"
+    assert gen.generate("A☃B", font="block") == gen.generate("A?B", font="block")
+    gen.fallback = "raise"
+    assert gen.generate("Ça va?") == gen.generate("CA VA?")
+    for call in (lambda: gen.generate("A☃B"), lambda: list(gen.iter_lines("☃")), lambda: gen.generate_many(["☃"])):
+        try:
+            call()
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert "Character '☃' not available in font" in str(e)
+
+    gen = asciigenator.core.ASCIIGenerator(case="preserve", cache_size=8)
+    gen.fonts["cased"] = {"A": ["A"], "a": ["a"], "B": ["B"], " ": [" "]}
+    assert gen.generate("Aab", font="cased") == "A a B"
+    gen.case = "upper"
+    assert gen.generate("Aab", font="cased") == "A A B"
+    for kwargs in ({"fallback": "??"}, {"case": "lower"}):
+        try:
+            asciigenator.core.ASCIIGenerator(**kwargs)
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert "not available" in str(e)
+
+
+def test_compiled_font_rebuilt_when_font_replaced():
+    """Test that replacing a font dictionary invalidates its compiled tables."""
+    gen = asciigenator.core.ASCIIGenerator()
+    before = gen.generate("A", font="simple")
+    gen.fonts["simple"] = dict(gen.fonts["simple"], A=["AAA"] * 5)
+    after = gen.generate("A", font="simple")
+    assert before != after
+    assert after == "\n".join(["AAA"] * 5)
+
+
+def test_render_cache_disabled_by_default():
+    """Test that the render cache is opt-in."""
+    gen = asciigenator.core.ASCIIGenerator()
+    gen.generate("Hi")
+    gen.generate("Hi")
+    assert gen.cache_info() == (0, 0, None, 0, None, 0)
+
+
+def test_render_cache_hits_and_lru_eviction():
+    """Test cache hit/miss counting and least-recently-used eviction by entry count."""
+    gen = asciigenator.core.ASCIIGenerator(cache_size=2)
+    first = gen.generate("A", color="red")
+    assert gen.generate("A", color="red") is first
+    gen.generate("B")
+    gen.generate("A", color="red")  # refresh "A" so "B" is least recently used
+    gen.generate("C")
+    info = gen.cache_info()
+    assert (info.hits, info.misses, info.currsize, info.maxsize) == (2, 3, 2, 2)
+    gen.generate("B")
+    assert gen.cache_info().misses == 4
+    gen.cache_clear()
+    assert gen.cache_info().currsize == 0
+
+
+def test_render_cache_byte_limit():
+    """Test that the render cache stays within its byte budget."""
+    gen = asciigenator.core.ASCIIGenerator(cache_bytes=1000)
+    for word in ["ONE", "TWO", "THREE", "FOUR", "FIVE"]:
+        gen.generate(word, font="block")
+    info = gen.cache_info()
+    assert 0 < info.currbytes <= 1000
+    assert info.currsize < 5
+
+
+def test_render_cache_rejects_negative_limits():
+    """Test that negative cache limits are rejected when the cache is configured."""
+    for kwargs in ({"cache_size": -1}, {"cache_bytes": -1}, {"cache_size": 10, "cache_bytes": -1}):
+        try:
+            asciigenator.core.ASCIIGenerator(**kwargs)
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert "must not be negative" in str(e)
+    gen = asciigenator.core.ASCIIGenerator(cache_size=4)
+    try:
+        gen.configure_cache(maxsize=-4)
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+
+
+def test_render_cache_invalidated_when_font_replaced():
+    """Test that cached results for a replaced font are dropped."""
+    gen = asciigenator.core.ASCIIGenerator(cache_size=10)
+    gen.generate("A", font="simple")
+    gen.generate("A", font="block")
+    gen.fonts["simple"] = dict(gen.fonts["simple"], A=["AAA"] * 5)
+    assert gen.generate("A", font="simple") == "\n".join(["AAA"] * 5)
+    assert gen.cache_info().currsize == 2
+
+
+def test_render_cache_thread_safety():
+    """Test concurrent use of a shared cached generator."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    gen = asciigenator.core.ASCIIGenerator(cache_size=8)
+    words = [f"W{i % 16}" for i in range(400)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(gen.generate, words))
+    assert results == [_reference_generate(word) for word in words]
+    info = gen.cache_info()
+    assert info.hits + info.misses == 400
+    assert info.currsize <= 8
+
+
+def test_module_level_cache_api():
+    """Test the cache helpers exposed on the package namespace."""
+    asciigenator.configure_cache(maxsize=4)
+    try:
+        asciigenator.generate("Cache")
+        asciigenator.generate("Cache")
+        assert asciigenator.cache_info().hits == 1
+        asciigenator.cache_clear()
+        assert asciigenator.cache_info().currsize == 0
+    finally:
+        asciigenator.configure_cache()
+
+
+def test_generate_many_matches_generate():
+    """Test batch rendering returns the same results as generate, in input order."""
+    texts = ["alpha", "", "Beta 2", "gamma"] * 5
+    expected = [asciigenator.generate(text, "block", "green", "#") for text in texts]
+    assert asciigenator.generate_many(texts, font="block", color="green", border="#") == expected
+
+
+def test_generate_many_validates_before_rendering():
+    """Test that invalid fonts and colors are rejected before any text is consumed."""
+    consumed = []
+
+    def texts():
+        consumed.append(True)
+        yield "A"
+
+    for kwargs in [{"font": "invalid_font"}, {"color": "invalid_color"}]:
+        try:
+            asciigenator.iter_generate(texts(), **kwargs)
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+    assert consumed == []
+
+
+def test_generate_many_with_thread_executor():
+    """Test batch rendering through a caller-supplied executor keeps input order."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    texts = [f"host {i}" for i in range(100)]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = asciigenator.generate_many(texts, color="cyan", executor=pool, chunksize=7)
+    assert results == [asciigenator.generate(text, color="cyan") for text in texts]
+
+
+def test_generate_many_with_process_pool():
+    """Test batch rendering across worker processes."""
+    texts = [f"node {i}" for i in range(50)]
+    results = asciigenator.generate_many(texts, font="block", border="*", workers=2, chunksize=8)
+    assert results == [asciigenator.generate(text, font="block", border="*") for text in texts]
+
+
+def test_generate_many_batch_options_are_keyword_only():
+    """Test that the batch options after ``border`` cannot be passed positionally."""
+    for func in (asciigenator.generate_many, asciigenator.iter_generate):
+        try:
+            func(["A"], "simple", None, None, 2)
+            assert False, "Should have raised TypeError"
+        except TypeError:
+            pass
+
+
+def test_iter_generate_is_lazy():
+    """Test that the iterator variant consumes input incrementally."""
+
+    def texts():
+        for i in range(10**6):
+            yield str(i)
+
+    results = asciigenator.iter_generate(texts())
+    assert next(results) == asciigenator.generate("0")
+    assert next(results) == asciigenator.generate("1")
+
+
+def test_iter_lines_matches_generate():
+    """Test that streamed lines join to exactly the generate output."""
+    for font in asciigenator.list_fonts():
+        for color in [None, "magenta"]:
+            for border in [None, "#"]:
+                for text in ["", "  ", "Stream me", "A"]:
+                    lines = asciigenator.iter_lines(text, font, color, border)
+                    assert "\n".join(lines) == asciigenator.generate(text, font, color, border)
+
+
+def test_iter_lines_validates_eagerly():
+    """Test that iter_lines raises before iteration for unknown fonts."""
+    try:
+        asciigenator.iter_lines("Hello", font="invalid_font")
+        assert False, "Should have raised ValueError"
+    except ValueError as e:
+        assert "Font 'invalid_font' not available" in str(e)
+
+
+def test_render_to_text_and_binary_streams():
+    """Test writing rendered output directly to text and binary file objects."""
+    expected = asciigenator.generate("Out", font="block", color="red", border="=")
+
+    text_stream = io.StringIO()
+    asciigenator.render_to(text_stream, "Out", font="block", color="red", border="=", end="\n")
+    assert text_stream.getvalue() == expected + "\n"
+
+    binary_stream = io.BytesIO()
+    asciigenator.render_to(binary_stream, "Out", font="block", color="red", border="=")
+    assert binary_stream.getvalue() == expected.encode("utf-8")
+
+    binary_stream = io.BytesIO()
+    asciigenator.render_to(binary_stream, "Out", "block", None, None, "", "utf-16-le")
+    assert binary_stream.getvalue().decode("utf-16-le") == asciigenator.generate("Out", font="block")
+
+
+def test_width_wraps_words_onto_bands():
+    """Test that text wider than the requested width is wrapped at word boundaries."""
+    result = asciigenator.generate("one two three", font="simple", width=31)
+    assert max(len(line) for line in result.split("\n")) <= 31
+    bands = result.split("\n\n")
+    assert bands == [asciigenator.generate("one two"), asciigenator.generate("three")]
+
+
+def test_width_breaks_words_longer_than_a_line():
+    """Test that a single word wider than the width is broken between glyphs."""
+    result = asciigenator.generate("abcdefgh", font="block", width=20)
+    assert all(len(line) <= 20 for line in result.split("\n"))
+    assert result.split("\n\n") == [asciigenator.generate(part, font="block") for part in ["ABC", "DEF", "GH"]]
+
+
+def test_width_without_wrapping_is_unchanged():
+    """Test that a width wide enough for the text leaves output untouched."""
+    assert asciigenator.generate("Hello", width=200, align="center") == asciigenator.generate("Hello")
+
+
+def test_width_alignment_and_border():
+    """Test centered and right-aligned bands fit inside a border of the requested width."""
+    for align in ["center", "right"]:
+        result = asciigenator.generate("a bb ccc", font="block", border="#", width=30, align=align)
+        lines = result.split("\n")
+        assert all(len(line) <= 30 for line in lines)
+        assert all(line[0] == "#" and line[-1] == "#" for line in lines)
+        assert "\n".join(asciigenator.iter_lines("a bb ccc", "block", None, "#", 30, align)) == result
+    right = asciigenator.generate("a bb", font="simple", width=8, align="right").split("\n")
+    assert right[0] == "     *"
+
+
+def test_invalid_alignment_and_width():
+    """Test error handling for invalid layout options."""
+    for kwargs, message in [({"align": "justify"}, "Alignment 'justify' not available"), ({"width": 0}, "Width")]:
+        try:
+            asciigenator.generate("Hello", **kwargs)
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert message in str(e)
+
+
+def test_named_border_styles():
+    """Test box-drawing border styles."""
+    assert "double" in asciigenator.list_borders()
+    lines = asciigenator.generate("Hi", color="red", border="double").split("\n")
+    assert lines[0] == "╔" + "═" * (len(lines[0]) - 2) + "╗"
+    assert lines[-1] == "╚" + "═" * (len(lines[0]) - 2) + "╝"
+    assert all(line.startswith("║") and line.endswith("║") for line in lines[1:-1])
+    assert len({len(asciigenator.core._strip_ansi(line)) for line in lines}) == 1
+
+
+def test_custom_border_style():
+    """Test passing a BorderStyle with distinct corners, edges and sides."""
+    style = asciigenator.core.BorderStyle("<", "^", ">", "[", "]", "{", "v", "}")
+    lines = asciigenator.generate("I", border=style).split("\n")
+    assert lines[0] == "<^^^^^>"
+    assert lines[1] == "[     ]"
+    assert lines[2] == "[ *** ]"
+    assert lines[-1] == "{vvvvv}"
+
+
+def test_add_border_known_widths():
+    """Test that the border stage accepts precomputed widths and matches the measured result."""
+    art = asciigenator.generate("Hey", color="green")
+    widths = [len(line) for line in asciigenator.generate("Hey").split("\n")]
+    add_border = asciigenator.core.ASCIIGenerator._add_border
+    assert add_border(art, "#", widths=widths) == add_border(art, "#")
+    assert add_border(art, "#") == asciigenator.generate("Hey", color="green", border="#")
+
+
+def test_fonts_load_lazily():
+    """Test that fonts are only loaded when they are first rendered."""
+    gen = asciigenator.core.ASCIIGenerator()
+    assert gen.list_fonts() == ["simple", "block"]
+    assert "block" in gen.fonts
+    assert not gen.fonts.is_loaded("block")
+    gen.generate("Lazy", font="simple")
+    assert gen.fonts.is_loaded("simple")
+    assert not gen.fonts.is_loaded("block")
+
+
+def test_font_registry_register_loader():
+    """Test registering a font by name with a loader."""
+    calls = []
+
+    def load():
+        calls.append(True)
+        return {"A": ["/\\"], " ": ["  "]}
+
+    gen = asciigenator.core.ASCIIGenerator()
+    gen.fonts.register("tiny", load)
+    assert "tiny" in gen.list_fonts()
+    assert calls == []
+    assert gen.generate("AA", font="tiny") == "/\\ /\\"
+    gen.generate("A", font="tiny")
+    assert calls == [True]
+
+
+# Upper bound for ``import asciigenator`` in microseconds, as reported by ``python -X importtime``. Importing the
+# package typically takes a few milliseconds; the bound leaves room for slow CI machines.
+IMPORT_TIME_BUDGET_US = 20000
+
+
+def _run_python(*args):
+    """Run a Python subprocess with bytecode caching enabled, returning the completed process."""
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return subprocess.run([sys.executable, *args], env=env, capture_output=True, text=True, check=True)
+
+
+def test_import_time():
+    """Test that importing the package stays cheap and does no font or generator work."""
+    code = (
+        "import sys, asciigenator; "
+        "print(sorted(m for m in ('typing', 're', 'threading', 'asciigenator.fonts', 'asciigenator.cache') "
+        "if m in sys.modules)); "
+        "print('_generator' in vars(asciigenator.core))"
+    )
+    _run_python("-c", code)  # warm the bytecode cache so compilation is not measured
+    proc = _run_python("-X", "importtime", "-c", code)
+    assert proc.stdout.split("\n")[:2] == ["[]", "False"]
+    cumulative = {}
+    for line in proc.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, total, name = line.split("|")
+            if total.strip().isdigit():
+                cumulative[name.strip()] = int(total)
+    assert cumulative["asciigenator"] < IMPORT_TIME_BUDGET_US
+
+
+def test_benchmark_run_and_compare(tmp_path):
+    """Test that the benchmark harness writes JSON results and gates on the regression threshold."""
+    import json
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    baseline = tmp_path / "baseline.json"
+    current = tmp_path / "current.json"
+    subprocess.run(
+        [sys.executable, "-m", "benchmarks", "run", "--quick", "-b", r"TimeGenerate\.time_generate\(", "-o", str(baseline)],
+        cwd=root,
+        capture_output=True,
+        check=True,
+    )
+    results = json.loads(baseline.read_text())
+    assert sorted(results["benchmarks"]) == [
+        f"bench_generate.TimeGenerate.time_generate({font!r}, {length!r})"
+        for font in ("block", "simple")
+        for length in ("long", "short")
+    ]
+    for name, result in results["benchmarks"].items():
+        result["median"] *= 1.5 if "short" in name else 1.05
+    current.write_text(json.dumps(results))
+
+    def compare(*extra):
+        args = [sys.executable, "-m", "benchmarks", "compare", str(baseline), str(current), *extra]
+        return subprocess.run(args, cwd=root, capture_output=True, text=True)
+
+    proc = compare()
+    assert proc.returncode == 1
+    assert proc.stdout.count("REGRESSION") == 2
+    assert compare("--threshold", "0.6").returncode == 0
+
+
+def test_cli_list_colors_does_not_load_fonts():
+    """Test that CLI actions which do not render skip loading fonts."""
+    code = (
+        "import sys; from asciigenator import cli; sys.argv = ['asciigen', '--list-colors']; cli.main(); "
+        "print('asciigenator.fonts' in sys.modules)"
+    )
+    assert _run_python("-c", code).stdout.split("\n")[-2] == "False"
+
+
+def _write_figlet_font(path):
+    """Write a two-row FIGlet font defining every required character as a blank, plus 'A' and a code-tagged glyph."""
+    lines = ["flf2a$ 2 1 4 0 1", "test font"]
+    for code in list(range(32, 127)) + [196, 214, 220, 228, 246, 252, 223]:
+        rows = ["/\\@", "||@@"] if chr(code) == "A" else ["$$@", "$$@@"]
+        lines += rows
+    lines += ["0x263A  SMILE", ":)@", "()@@"]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_parse_figlet_font(tmp_path):
+    """Test FIGlet parsing: endmarks, hardblanks and code-tagged characters."""
+    from asciigenator import fontfile
+
+    path = tmp_path / "mini.flf"
+    _write_figlet_font(path)
+    glyphs = fontfile.parse_flf(path.read_text(encoding="utf-8"))
+    assert glyphs["A"] == ["/\\", "||"]
+    assert glyphs[" "] == ["  ", "  "]
+    assert glyphs["\u263a"] == [":)", "()"]
+    try:
+        fontfile.parse_flf("not a font")
+        assert False, "Should have raised ValueError"
+    except ValueError as e:
+        assert "FIGlet" in str(e)
+
+
+def test_load_font_dir_registers_fonts(tmp_path, monkeypatch):
+    """Test that FIGlet, JSON and TOML fonts plug into generate and list_fonts."""
+    monkeypatch.setenv("ASCIIGENATOR_CACHE_DIR", str(tmp_path / "cache"))
+    fonts = tmp_path / "fonts"
+    fonts.mkdir()
+    _write_figlet_font(fonts / "mini.flf")
+    (fonts / "dots.json").write_text('{"glyphs": {"A": [".", ":"], " ": [" ", " "]}}', encoding="utf-8")
+    (fonts / "hash.toml").write_text('[glyphs]\nA = ["#", "#"]\n" " = [" ", " "]\n', encoding="utf-8")
+    (fonts / "notes.txt").write_text("ignored", encoding="utf-8")
+
+    gen = asciigenator.core.ASCIIGenerator()
+    assert gen.load_font_dir(str(fonts)) == ["dots", "hash", "mini"]
+    assert {"dots", "hash", "mini"} <= set(gen.list_fonts())
+    assert not gen.fonts.is_loaded("mini")
+    assert gen.generate("aa", font="mini") == "/\\ /\\\n|| ||"
+    assert gen.generate("a a", font="dots") == ".   .\n:   :"
+    assert gen.generate("A", font="hash", border="+").split("\n")[2] == "+ # +"
+
+
+def test_font_file_binary_cache(tmp_path):
+    """Test that parsed fonts are reused from the binary cache and refreshed when the file changes."""
+    from asciigenator import fontfile
+
+    cache = tmp_path / "cache"
+    path = tmp_path / "font.json"
+    path.write_text('{"A": ["a"]}', encoding="utf-8")
+    assert fontfile.load_font_file(str(path), cache_dir=str(cache)) == {"A": ["a"]}
+    assert len(list(cache.iterdir())) == 1
+
+    # A cache hit must not parse the source again.
+    original = fontfile._PARSERS[".json"]
+    fontfile._PARSERS[".json"] = None
+    try:
+        assert fontfile.load_font_file(str(path), cache_dir=str(cache)) == {"A": ["a"]}
+        os.utime(path, ns=(0, 0))
+        assert fontfile.load_font_file(str(path), cache_dir=str(cache)) == {"A": ["a"]}
+    finally:
+        fontfile._PARSERS[".json"] = original
+
+    path.write_text('{"A": ["b", "é"]}', encoding="utf-8")
+    assert fontfile.load_font_file(str(path), cache_dir=str(cache)) == {"A": ["b", "é"]}
+
+
+def test_glyph_table_read_only_view():
+    """Test that fonts are packed into read-only glyph tables that still behave like dictionaries."""
+    gen = asciigenator.core.ASCIIGenerator()
+    table = gen.fonts["block"]
+    assert isinstance(table, asciigenator.glyphs.GlyphTable)
+    assert table["K"] == ["█   █", "█  █ ", "███  ", "█  █ ", "█   █"]
+    assert "A" in table and "a" not in table
+    assert len(table) == 63
+    assert dict(table) == asciigenator.fonts.BLOCK
+    table["A"].append("mutating a copy")
+    assert len(table["A"]) == 5
+    try:
+        table["A"] = ["x"]
+        assert False, "Should have raised TypeError"
+    except TypeError:
+        pass
+
+
+def test_glyph_table_large_font_is_compact():
+    """Test packed storage of a font covering thousands of code points."""
+    glyphs = {chr(code): [chr(code) * 2, chr(code) * 2] for code in range(0x4E00, 0x4E00 + 5000)}
+    table = asciigenator.glyphs.GlyphTable.from_glyphs(glyphs)
+    dict_bytes = sum(sys.getsizeof(rows) + sum(sys.getsizeof(row) for row in rows) for rows in glyphs.values())
+    assert table.nbytes * 4 < dict_bytes
+    assert table["\u4e01"] == ["\u4e01\u4e01"] * 2
+    gen = asciigenator.core.ASCIIGenerator()
+    gen.fonts["cjk"] = glyphs
+    assert gen.generate("\u4e00\u4e02", font="cjk") == "\u4e00\u4e00 \u4e02\u4e02\n\u4e00\u4e00 \u4e02\u4e02"
+
+
+def test_fonts_are_normalized_and_validated():
+    """Test that glyphs are padded into rectangles of the font height and malformed glyphs are reported."""
+    gen = asciigenator.core.ASCIIGenerator()
+    assert [gen.validate_font(font) for font in gen.list_fonts()] == [[], []]
+    assert {len(row) for rows in gen.fonts["block"].values() for row in rows} == {5}
+
+    gen.fonts["ragged"] = {"A": ["/\\", "| |"], "B": ["b"], "CD": ["x"], "E": [], " ": ["  ", "  "]}
+    table = gen.fonts["ragged"]
+    assert table["A"] == ["/\\ ", "| |"] and table["B"] == ["b", " "]
+    assert list(table) == [" ", "A", "B"]
+    issues = gen.validate_font("ragged")
+    assert [issue.char for issue in issues] == ["CD", "E", "A", "B"]
+    assert asciigenator.glyphs.validate_glyphs({"A": ["a", "aa"]}) == [
+        asciigenator.glyphs.GlyphIssue("A", "Rows have different widths; padded to 2 columns.")
+    ]
+    assert gen.generate("BA", font="ragged") == "b /\\\n  | |"
+    try:
+        gen.validate_font("missing")
+        assert False, "Should have raised ValueError"
+    except ValueError as e:
+        assert "Font 'missing' not available" in str(e)
+
+
+def test_font_file_malformed_glyphs_are_reported(tmp_path, monkeypatch):
+    """Test that malformed glyphs of a JSON font are skipped and reported instead of rejecting the font."""
+    monkeypatch.setenv("ASCIIGENATOR_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "mixed.json"
+    path.write_text('{"A": ["a", "a"], "B": 5, "C": [], "D": ["d", 1]}', encoding="utf-8")
+    gen = asciigenator.core.ASCIIGenerator()
+    gen.register_font_file(str(path))
+    assert gen.generate("A", font="mixed") == "a\na"
+    assert [issue.char for issue in gen.validate_font("mixed")] == ["B", "C", "D"]
+
+
+def test_font_memory_reports_loaded_fonts():
+    """Test the per-font memory introspection API."""
+    gen = asciigenator.core.ASCIIGenerator()
+    assert gen.font_memory() == {}
+    gen.generate("Mem", font="block")
+    memory = gen.font_memory()
+    assert list(memory) == ["block"]
+    assert memory["block"] == gen.fonts["block"].nbytes > 0
+
+
+def test_aio_generate_inline_and_offloaded():
+    """Test that the async API matches the sync one whether it renders inline or in the executor."""
+    import asyncio
+    import threading
+    import asciigenator.aio
+
+    gen = asciigenator.core.ASCIIGenerator(cache_size=16)
+    threads = []
+    original = gen.generate
+
+    def tracking_generate(*args):
+        threads.append(threading.current_thread())
+        return original(*args)
+
+    gen.generate = tracking_generate
+    agen = asciigenator.aio.AsyncASCIIGenerator(gen, threshold=5)
+    try:
+        short = asyncio.run(agen.generate("Hi", font="block", border="single"))
+        long = asyncio.run(agen.generate("Hello World", font="block", border="single"))
+    finally:
+        agen.close()
+    assert short == original("Hi", font="block", border="single")
+    assert long == original("Hello World", font="block", border="single")
+    assert threads[0] is threading.main_thread()
+    assert threads[1] is not threading.main_thread()
+    # Both paths go through the same generator, so they share its render cache.
+    assert gen.cache_info().currsize == 2
+
+
+def test_aio_generate_many_chunks_in_order():
+    """Test that offloaded batches are split into chunks and reassembled in input order."""
+    import asyncio
+    import asciigenator.aio
+
+    texts = [f"Line {i}" for i in range(50)]
+    agen = asciigenator.aio.AsyncASCIIGenerator(threshold=0, max_concurrency=2)
+    try:
+        results = asyncio.run(agen.generate_many(texts, font="block", chunksize=7))
+    finally:
+        agen.close()
+    assert agen.generator is asciigenator.core._generator
+    assert results == asciigenator.generate_many(texts, font="block")
+    assert asyncio.run(asciigenator.aio.generate("Hi")) == asciigenator.generate("Hi")
+
+
+def test_aio_generate_many_options_are_keyword_only():
+    """Test that the async batch options after ``border`` cannot be passed positionally."""
+    import asciigenator.aio
+
+    for func in (asciigenator.aio.generate_many, asciigenator.aio.AsyncASCIIGenerator().generate_many):
+        try:
+            func(["A"], "simple", None, None, 7)
+            assert False, "Should have raised TypeError"
+        except TypeError:
+            pass
+
+
+def test_aio_forwards_layout_and_backend():
+    """Test that the async API renders with the requested layout and backend, inline and offloaded."""
+    import asyncio
+    import asciigenator.aio
+
+    gen = asciigenator.core.ASCIIGenerator()
+    texts = ["Hello", "World"]
+    for threshold in (1000, 0):
+        agen = asciigenator.aio.AsyncASCIIGenerator(gen, threshold=threshold)
+        try:
+            for layout in ("kerning", "smush"):
+                art = asyncio.run(agen.generate("Hello", font="block", backend="python", layout=layout))
+                many = asyncio.run(agen.generate_many(texts, font="block", backend="python", layout=layout))
+                assert art == gen.generate("Hello", font="block", layout=layout)
+                assert art != gen.generate("Hello", font="block")
+                assert many == [gen.generate(text, font="block", layout=layout) for text in texts]
+            try:
+                asyncio.run(agen.generate("Hello", backend="nope"))
+                assert False, "Should have raised ValueError"
+            except ValueError:
+                pass
+        finally:
+            agen.close()
+    art = asyncio.run(asciigenator.aio.generate("Hi", font="block", layout="smush"))
+    assert art == asciigenator.generate("Hi", font="block", layout="smush")
+
+
+def test_aio_forwards_line_spacing():
+    """Test that the async API spaces the lines of multi-line text as requested, inline and offloaded."""
+    import asyncio
+    import asciigenator.aio
+
+    gen = asciigenator.core.ASCIIGenerator()
+    texts = ["A\nB", "Hi\nYo"]
+    for threshold in (1000, 0):
+        agen = asciigenator.aio.AsyncASCIIGenerator(gen, threshold=threshold)
+        try:
+            for spacing in (0, 3):
+                art = asyncio.run(agen.generate("A\nB", font="block", line_spacing=spacing))
+                many = asyncio.run(agen.generate_many(texts, font="block", line_spacing=spacing))
+                assert art == gen.generate("A\nB", font="block", line_spacing=spacing)
+                assert many == [gen.generate(text, font="block", line_spacing=spacing) for text in texts]
+            try:
+                asyncio.run(agen.generate_many(texts, line_spacing=-1))
+                assert False, "Should have raised ValueError"
+            except ValueError:
+                pass
+        finally:
+            agen.close()
+    art = asyncio.run(asciigenator.aio.generate_many(texts, line_spacing=0))
+    assert art == asciigenator.generate_many(texts, line_spacing=0)
+    assert art != asciigenator.generate_many(texts)
+
+
+def test_aio_invalid_arguments():
+    """Test that the async API validates before offloading and rejects bad settings."""
+    import asyncio
+    import asciigenator.aio
+
+    agen = asciigenator.aio.AsyncASCIIGenerator(threshold=0)
+    for coro in (agen.generate("Hello", font="nope"), agen.generate_many(["Hello"], color="nope")):
+        try:
+            asyncio.run(coro)
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+    assert agen._executor is None
+    for kwargs in ({"threshold": -1}, {"max_concurrency": 0}):
+        try:
+            asciigenator.aio.AsyncASCIIGenerator(**kwargs)
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+
+def test_aio_cancellation_skips_pending_chunks():
+    """Test that cancelling a batch cancels chunks that have not started rendering."""
+    import asyncio
+    import threading
+    import asciigenator.aio
+    from concurrent.futures import ThreadPoolExecutor
+
+    gen = asciigenator.core.ASCIIGenerator()
+    release = threading.Event()
+    calls = []
+    original = gen.generate_many
+
+    def slow_generate_many(chunk, **kwargs):
+        calls.append(chunk)
+        release.wait(5)
+        return original(chunk, **kwargs)
+
+    gen.generate_many = slow_generate_many
+    executor = ThreadPoolExecutor(max_workers=1)
+    agen = asciigenator.aio.AsyncASCIIGenerator(gen, threshold=0, max_concurrency=1, executor=executor)
+
+    async def main():
+        task = asyncio.ensure_future(agen.generate_many(["A", "B", "C", "D"], chunksize=1))
+        while not calls:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        try:
+            await task
+            assert False, "Should have been cancelled"
+        except asyncio.CancelledError:
+            pass
+        release.set()
+
+    try:
+        asyncio.run(main())
+    finally:
+        executor.shutdown(wait=True)
+    assert calls == [["A"]]
+
+
+def test_numpy_backend_matches_python():
+    """Test that the vectorized backend produces exactly the pure-Python output."""
+    pytest.importorskip("numpy")
+    gen = asciigenator.core.ASCIIGenerator(backend="numpy")
+    gen.fonts["tiny"] = {"A": ["/\\", "\\/"], "B": ["b"], " ": ["  ", "  "]}
+    texts = ["", "Hello World", "ab?a\u00e9b", "The quick brown fox " * 40]
+    for font in ("simple", "block", "tiny"):
+        for text in texts:
+            for kwargs in ({}, {"color": "red", "border": "single"}, {"width": 60, "align": "right"}):
+                expected = gen.generate(text, font=font, backend="python", **kwargs)
+                assert gen.generate(text, font=font, **kwargs) == expected
+                assert "\n".join(gen.iter_lines(text, font=font, **kwargs)) == expected
+    assert gen._compile_font("tiny").array is not None
+    assert gen.generate_many(texts, font="block", workers=2) == [
+        gen.generate(text, font="block", backend="python") for text in texts
+    ]
+
+
+def test_backend_selection_and_fallback(monkeypatch):
+    """Test backend validation and that "auto" falls back to pure Python without NumPy."""
+    monkeypatch.setattr(asciigenator.core, "_HAS_NUMPY", False, raising=False)
+    gen = asciigenator.core.ASCIIGenerator()
+    assert gen.backend == "auto"
+    long_text = "Hello World " * 50
+    assert gen.generate(long_text) == gen.generate(long_text, backend="python")
+    assert gen._compile_font("simple").array is None
+    for call in (
+        lambda: gen.generate("Hi", backend="numpy"),
+        lambda: gen.generate("Hi", backend="fortran"),
+        lambda: asciigenator.core.ASCIIGenerator(backend="numpy"),
+    ):
+        try:
+            call()
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert "not available" in str(e)
+
+
+def _paint(screen, data):
+    """Apply text with the cursor and color sequences BannerRenderer emits to a dict of (row, col) -> (char, sgr)."""
+    row = col = 0
+    sgr = ""
+    for match in re.finditer(r"\x1b\[(\d*)([ABCKm])|([\r\n])|(.)", data):
+        count, op, control, char = match.groups()
+        n = int(count or 1)
+        if op == "A":
+            row -= n
+        elif op == "B":
+            row += n
+        elif op == "C":
+            col += n
+        elif op == "K":
+            for cell in [cell for cell in screen if cell[0] == row and cell[1] >= col]:
+                del screen[cell]
+        elif op == "m":
+            sgr = "" if count in ("", "0") else count
+        elif control:
+            row, col = (row + 1, 0) if control == "\n" else (row, 0)
+        else:
+            screen[row, col] = (char, sgr)
+            col += 1
+    screen = {cell: value for cell, value in screen.items() if value != (" ", "")}
+    return screen, (row, col)
+
+
+def test_banner_renderer_frames_match_generate():
+    """Test that live banner frames are exactly what generate returns."""
+    from asciigenator.banner import BannerRenderer
+
+    gen = asciigenator.core.ASCIIGenerator()
+    banner = BannerRenderer("block", "red", "double", generator=gen)
+    for text in ("Score A", "Score B", "score b", "", "Longer Score AB", "Hi"):
+        assert banner.render(text) == gen.generate(text, font="block", color="red", border="double")
+        assert banner.frame == banner.render(text)
+        assert banner.text == text
+    try:
+        BannerRenderer("nope")
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+
+
+def test_banner_renderer_multiline_matches_generate():
+    """Test that multi-line banners are stacked and diffed band by band like generate stacks them."""
+    from asciigenator.banner import BannerRenderer
+
+    texts = ("A\nB", "A\nC", "AB\nC", "Top\n\nBottom", "Top\nBottom", "One", "", "X\n")
+    for color, border in ((None, None), ("red", "double")):
+        renderer = BannerRenderer("block", color, border)
+        live = BannerRenderer("block", color, border)
+        screen = {}
+        for text in texts:
+            expected = asciigenator.generate(text, font="block", color=color, border=border)
+            assert renderer.render(text) == expected
+            screen, cursor = _paint(screen, live.update(text))
+            assert cursor == (0, 0)
+            assert screen == _paint({}, expected)[0]
+
+
+def test_banner_renderer_updates_only_changed_cells():
+    """Test that ANSI diffs repaint the terminal into the new frame and are much smaller than full frames."""
+    from asciigenator.banner import BannerRenderer
+
+    for color, border in ((None, None), ("green", "single"), ("red", "#")):
+        banner = BannerRenderer("simple", color, border)
+        screen = {}
+        for text in ("Tick A", "Tick B", "Tick BB", "Tock", "", "Tick AB", "Tick AC", "Tick AC"):
+            update = banner.update(text)
+            screen, cursor = _paint(screen, update)
+            assert cursor == (0, 0)
+            expected, _ = _paint({}, asciigenator.generate(text, font="simple", color=color, border=border))
+            assert screen == expected
+        assert update == ""
+        assert 0 < len(banner.update("Tick AD")) < len(banner.frame) / 2
+        assert banner.finish() == "\r" + "\n" * len(banner.frame.split("\n"))
+        assert banner.update("Tick AD").count("\n") == len(banner.frame.split("\n")) - 1
+
+
+def test_extended_color_specifications():
+    """Test 24-bit, 256-color and background colors, and rejection of invalid specifications."""
+    plain = asciigenator.generate("Hi", border="single")
+    for color, prefix in [
+        ("#ff8800", "\033[38;2;255;136;0m"),
+        ("#f80", "\033[38;2;255;136;0m"),
+        ("208", "\033[38;5;208m"),
+        ("white on blue", "\033[37m\033[44m"),
+        ("on 236", "\033[48;5;236m"),
+    ]:
+        art = asciigenator.generate("Hi", color=color, border="single")
+        assert prefix + "*" in art and art.count("\033[0m") == 1
+        assert asciigenator.core._strip_ansi(art) == plain
+    for color in ["red:nope", "red@glyph", "red:blue@diagonal", "#12", "256", "on", "red on #xyz"]:
+        try:
+            asciigenator.generate("Hi", color=color)
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert f"Color '{color}' not available" in str(e)
+
+
+def test_gradient_colors():
+    """Test gradient modes: same art once colors are stripped, merged runs and one color reset per row."""
+    gen = asciigenator.core.ASCIIGenerator()
+    text = "Hello World"
+    for mode in ["", "@vertical", "@glyph"]:
+        for spec in ["red:blue", "rainbow", "196:21 on black"]:
+            color = spec.replace(" on", mode + " on") if " on" in spec else spec + mode
+            for kwargs in ({}, {"border": "double"}, {"width": 30, "align": "center"}):
+                art = gen.generate(text, font="block", color=color, **kwargs)
+                assert asciigenator.core._strip_ansi(art) == gen.generate(text, font="block", **kwargs)
+                assert "\n".join(gen.iter_lines(text, font="block", color=color, **kwargs)) == art
+                assert art.count("\033[39m") == sum(1 for line in art.split("\n") if "\033[38;" in line)
+    vertical = gen.generate("AB", color="red:blue@vertical").split("\n")
+    assert len({line[: line.index("m") + 1] for line in vertical}) == 5
+    glyph = gen.generate("ABC", color="rainbow@glyph")
+    assert all(line.count("\033[38;2;") == 3 for line in glyph.split("\n"))
+    assert "\033[38;5;" in gen.generate("A", color="196:21") and "\033[38;2;" in gen.generate("A", color="red:21")
+    gradient = asciigenator.colors.Gradient([(0, 0, 0), (1, 1, 1)])
+    assert len(gradient.column_runs(10)) == 2 and gradient.escapes(10)[0] is gradient.escapes(10)[4]
+    texts = ["Gradient", "Batch", ""] * 3
+    assert gen.generate_many(texts, color="rainbow", workers=2) == [gen.generate(t, color="rainbow") for t in texts]
+
+
+def test_color_enabled_detection():
+    """Test NO_COLOR, TERM=dumb and terminal detection."""
+
+    class Terminal(io.StringIO):
+        def isatty(self):
+            return True
+
+    assert asciigenator.colors.color_enabled(Terminal(), {})
+    assert not asciigenator.colors.color_enabled(io.StringIO(), {})
+    assert not asciigenator.colors.color_enabled(Terminal(), {"NO_COLOR": "1"})
+    assert asciigenator.colors.color_enabled(Terminal(), {"NO_COLOR": ""})
+    assert not asciigenator.colors.color_enabled(Terminal(), {"TERM": "dumb"})
+
+
+def test_export_formats():
+    """Test text, ANSI, HTML, SVG and bitmap output, streamed chunk by chunk."""
+    gen = asciigenator.core.ASCIIGenerator()
+    for kwargs in ({}, {"border": "double"}, {"color": "red", "border": "#"}, {"width": 30, "align": "right"}):
+        art = gen.generate("Hello World", **kwargs)
+        assert gen.export("Hello World", "ansi", **kwargs) == art
+        assert gen.export("Hello World", "text", **kwargs) == asciigenator.core._strip_ansi(art)
+        for format in ["html", "svg"]:
+            chunks = list(gen.iter_export("Hello World", format, **kwargs))
+            assert "".join(chunks) == gen.export("Hello World", format, **kwargs) and len(chunks) >= 5
+        bitmap = gen.export("Hello World", "bitmap", **kwargs)
+        lines = asciigenator.core._strip_ansi(art).split("\n")
+        assert (bitmap.width, bitmap.height) == (max(map(len, lines)), len(lines))
+        ink = b"".join(bytes(0 if c == " " else 255 for c in line.ljust(bitmap.width)) for line in lines)
+        assert bytes(255 if cell else 0 for cell in bitmap.data) == ink
+
+    html = gen.export("<&>", "html", color="red:blue@glyph on white", border="rounded")
+    assert html.startswith('<pre class="asciigenator" style="') and html.endswith("</pre>")
+    assert "background-color:#e5e5e5" in html and "border-radius" in html and "╭" not in html
+    assert '<span style="color:#cd0000">' in html and '<span style="color:#0000ee">' in html
+    assert html.count("<span") == 5 * 3
+    assert "&lt;&lt;&lt;" in gen.export("Hi", "html", border="<") and "*" in gen.export("Hi", "html", border="*")
+
+    svg = gen.export("Hi", "svg", font="block", color="#ff8800", border="single")
+    assert svg.startswith("<svg") and svg.endswith("</svg>") and 'width="150" height="180"' in svg
+    assert svg.count('fill="none" stroke=') == 1 and 'fill="#ff8800"' in svg and "<text" not in svg
+    assert "<text" in gen.export("Hi", "svg") and 'textLength="10"' in gen.export("I", "svg")
+
+    colored = gen.export("A", "bitmap", color="#808080")
+    assert set(colored.data) == {0, 128}
+    assert gen.export("", "bitmap") == asciigenator.formats.Bitmap(0, 5, bytearray())
+    assert list(asciigenator.iter_export("Hi", "bitmap"))[0] == bytes([255, 0, 255, 0, 255, 255, 255])
+    try:
+        gen.export("Hi", "png")
+        assert False, "Should have raised ValueError"
+    except ValueError as e:
+        assert "Format 'png' not available" in str(e)
+
+
+def test_profiling():
+    """Test stage timings, counters and hooks, and that profiling does not change the output."""
+    gen = asciigenator.core.ASCIIGenerator(cache_size=8)
+    assert gen.profiler is None
+    profiler = gen.enable_profiling()
+    samples = []
+    hook = samples.append
+    assert profiler.add_hook(hook) is hook
+    art = gen.generate("Héllo ☃", color="red:blue", border="single")
+    assert gen.generate("Héllo ☃", color="red:blue", border="single") == art
+    assert gen.generate_many(["A", "B"]) == [gen.generate("A"), gen.generate("B")]
+    assert len(samples) == 6 and samples[0].chars == 7 and samples[0].fallbacks == 1
+    assert [sample.cache_hit for sample in samples] == [False, True, False, False, True, True]
+    assert all(samples[0].stages[stage] > 0 for stage in ["validate", "cache", "layout", "glyphs", "color", "border"])
+    assert samples[1].stages["glyphs"] == 0 and samples[2].stages["validate"] == 0 and samples[4].stages["color"] == 0
+    stats = profiler.stats()
+    counts = {name: stats[name] for name in ["renders", "chars", "fallbacks", "cache_hits", "cache_misses"]}
+    assert counts == {"renders": 6, "chars": 18, "fallbacks": 1, "cache_hits": 3, "cache_misses": 3}
+    assert stats["stages"]["glyphs"]["calls"] == 3 and stats["stages"]["validate"]["calls"] == 4
+    report = profiler.report()
+    assert report.startswith("stage") and "glyphs" in report and "fallbacks: 1" in report
+    profiler.remove_hook(hook)
+    profiler.reset()
+    assert profiler.stats()["renders"] == 0
+    assert gen.disable_profiling() is profiler and gen.profiler is None
+    gen.generate("Untimed")
+    assert profiler.stats()["renders"] == 0 and len(samples) == 6
+
+
+def test_segment_cache():
+    """Test that the segment cache reuses words across texts, stays bounded and never changes the output."""
+    plain = asciigenator.core.ASCIIGenerator()
+    gen = asciigenator.core.ASCIIGenerator(segment_cache_size=6)
+    texts = ["PROD-US-EAST ACME", "PROD-US-WEST ACME", "Héllo  wörld ☃ again", "  spaced   out  ", "ACME-ACME", "", "Hi"]
+    for text in texts:
+        for kwargs in ({}, {"font": "block", "border": "double"}, {"width": 40, "align": "center"}):
+            assert gen.generate(text, **kwargs) == plain.generate(text, **kwargs)
+    info = gen.segment_cache_info()
+    assert info.hits > 0 and info.maxsize == 6 and info.currsize <= 2 * 6
+    assert plain.segment_cache_info() == asciigenator.cache.CacheInfo(0, 0, None, 0, None, 0)
+
+    gen.configure_segment_cache(64)
+    compiled = gen._compile_font("simple")
+    assert compiled.segments is not None and len(compiled.segments) == 0
+    gen.generate("PROD-US-EAST ACME")
+    assert {"PROD", "-", "US", "EAST", " ", "ACME"} <= set(compiled.segments._data)
+    gen.fonts["simple"] = dict(gen.fonts["simple"], A=["#"] * 5)
+    assert gen._compile_font("simple").segments is not compiled.segments
+    assert gen.generate("ACME").startswith("# ")
+    gen.fonts["simple"] = plain.fonts["simple"]
+    assert gen.generate_many(texts * 2, workers=2) == [plain.generate(text) for text in texts * 2]
+    gen.configure_segment_cache(None)
+    assert gen._compile_font("simple").segments is None and gen.segment_cache_info().maxsize is None
+
+    clock = asciigenator.cache.ClockCache(2)
+    clock.put("a", 1)
+    clock.put("b", 2)
+    assert clock.get("a") == 1 and clock.get("c") is None
+    clock.put("c", 3)  # "a" was looked up, so "b" is evicted
+    assert list(clock._data) == ["a", "c"] and clock.info() == asciigenator.cache.CacheInfo(1, 1, 2, 2, None, 0)
+
+
+def test_segment_cache_rejects_invalid_sizes():
+    """Test that invalid segment cache sizes are rejected when the cache is configured."""
+    calls = [
+        lambda: asciigenator.core.ASCIIGenerator(segment_cache_size=-1),
+        lambda: asciigenator.core.ASCIIGenerator().configure_segment_cache(-8),
+        lambda: asciigenator.configure_segment_cache(-8),
+        lambda: asciigenator.cache.ClockCache(0),
+    ]
+    for call in calls:
+        try:
+            call()
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert "Cache size must" in str(e)
+    assert asciigenator.segment_cache_info().maxsize is None
+
+
+def test_kerning_and_smushing():
+    """Test the kerning and smush layouts, their edge profiles and their pair cache."""
+    table = asciigenator.core._get_generator().fonts["simple"]
+    assert table.edges(table.index("I")) == ((0, 1, 1, 1, 0), (0, 1, 1, 1, 0))
+    assert table.edges(table.index(" ")) == ((3,) * 5, (3,) * 5)
+    assert asciigenator.generate("HI") == "* * ***\n* *  *\n***  *\n* *  *\n* * ***"
+    assert asciigenator.generate("HI", layout="kerning") == "* ****\n* * *\n*** *\n* * *\n* ****"
+    assert asciigenator.generate("HI", layout="smush") == "* ***\n* **\n****\n* **\n* ***"
+    # Spaces keep their full width.
+    assert asciigenator.generate("I I", layout="kerning").split("\n")[0] == "***   ***"
+
+    smush = asciigenator.kerning.smush
+    rules = [smush("*", "*"), smush("_", "|"), smush("/", "("), smush("[", "]"), smush("/", "\\")]
+    assert rules == ["*", "|", "(", "|", "|"]
+    assert smush("\\", "/") == "Y" and smush(">", "<") == "X" and smush("*", "#") is None
+
+    gen = asciigenator.core.ASCIIGenerator(cache_size=16)
+    gen.fonts["edges"] = {"A": ["/\\", "\\_"], "B": ["_|", "  "], " ": ["  ", "  "]}
+    assert gen.generate("AB", "edges", layout="kerning") == "/\\_|\n\\_"
+    assert gen.generate("AB", "edges", layout="smush") == "/\\|\n\\_"
+    composer = gen._compile_font("edges", "smush").composer
+    assert gen._compile_font("edges", "smush") is gen._compile_font("edges").with_layout("smush")
+    # Glyphs are " ", "A" and "B": kerned by 0 columns, overlapping by 1, and "_" gives way to "\\".
+    assert list(composer.pairs) == [(1, 2)] and composer.pairs[1, 2][:3] == (0, 1, ((0, "\\"),))
+    texts = ["HELLO WORLD", "Héllo, wörld!", "", "A  B"]
+    for text in texts:
+        full = gen.generate(text, width=20, align="center")
+        kerned = gen.generate(text, width=20, align="center", layout="kerning")
+        assert max(map(len, kerned.split("\n"))) <= max(map(len, full.split("\n")))
+    assert gen.generate("HI", color="red:blue@glyph", layout="smush").count("\033[38;2;0;0;238m*") == 5
+    assert gen.cache_info().currsize == 11  # layouts are cached separately
+    assert gen.generate_many(texts, layout="smush", workers=2) == [gen.generate(t, layout="smush") for t in texts]
+    assert gen.export("HI", "text", layout="kerning") == gen.generate("HI", layout="kerning")
+    with pytest.raises(ValueError, match="Layout 'tight' not available."):
+        gen.generate("HI", layout="tight")
+
+
+def test_multiline_text():
+    """Test that every line of a text is drawn as its own band, with configurable spacing and alignment."""
+    hi, a = asciigenator.generate("HI").split("\n"), asciigenator.generate("A").split("\n")
+    assert asciigenator.generate("HI\nA") == "\n".join(hi + [""] + a)
+    assert asciigenator.generate("HI\nA", line_spacing=0) == "\n".join(hi + a)
+    assert asciigenator.generate("HI\nA", line_spacing=3) == "\n".join(hi + [""] * 3 + a)
+    # Alignment applies to the lines of the text without wrapping.
+    right = asciigenator.generate("HI\nA", align="right").split("\n")
+    assert right[6:] == [" " * 4 + row if row else row for row in a]
+    centered = asciigenator.generate("HI\nA", align="center").split("\n")
+    assert centered[6:] == [" " * 2 + row if row else row for row in a]
+    # One border around the whole block.
+    bordered = asciigenator.generate("HI\nA", border="single").split("\n")
+    assert len(bordered) == 2 + 2 + 11 and len(set(map(len, bordered))) == 1
+    assert bordered[1 + 1 + 5] == "│" + " " * 9 + "│"
+    # Each line is wrapped on its own, and wrapped bands use the same spacing.
+    wrapped = asciigenator.generate("AB CD\nE", width=12, line_spacing=2)
+    assert wrapped == "\n\n\n".join(asciigenator.generate(t) for t in ["AB", "CD", "E"])
+    assert asciigenator.generate("HI\n\nA").split("\n")[5:8] == [""] * 3
+    assert asciigenator.generate("HI\nA", color="red:blue@glyph").count("\033[38;2;") == 15
+
+    gen = asciigenator.core.ASCIIGenerator()
+    text, options = "HI\nA", {"border": "double", "align": "center", "line_spacing": 2}
+    art = gen.generate(text, color="red", **options)
+    assert "\n".join(gen.iter_lines(text, color="red", **options)) == art
+    assert gen.export(text, "text", **options) == asciigenator.generate(text, **options)
+    assert gen.generate(text, layout="smush", line_spacing=0).count("\n") == 9
+    with pytest.raises(ValueError, match="Line spacing must not be negative, got -1."):
+        gen.generate(text, line_spacing=-1)
+
+
+def test_registry_changes_while_rendering():
+    """Test registering fonts and colors: copy-on-write snapshots, precise invalidation and concurrent renders."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    gen = asciigenator.core.ASCIIGenerator(cache_size=64)
+    gen.generate("AB")
+    simple = gen._compile_font("simple")
+    loaders, tables = snapshot = gen.fonts._snapshot
+    gen.register_font("tiny", {"A": ["a"], " ": [" "]})
+    assert gen.fonts._snapshot is not snapshot and "tiny" not in loaders and "tiny" not in tables
+    assert gen.generate("AA", font="tiny") == "a a"
+    gen.register_font("tiny", {"A": ["A"], " ": [" "]})
+    assert gen.generate("AA", font="tiny") == "A A"
+    # Only the replaced font is dropped.
+    assert gen._compile_font("simple") is simple and gen.cache_info().currsize == 2
+    gen.register_font("lazy", lambda: {"A": ["l"]})
+    assert not gen.fonts.is_loaded("lazy") and gen.generate("A", font="lazy") == "l"
+    gen.unregister_font("tiny")
+    assert "tiny" not in gen.list_fonts() and gen.cache_info().currsize == 2
+    for call in (lambda: gen.generate("A", font="tiny"), lambda: gen.unregister_font("tiny")):
+        with pytest.raises(ValueError, match="Font 'tiny' not available."):
+            call()
+
+    gen.register_color("orange", "\033[33m")
+    gen.generate("A", color="white on orange")
+    gen.generate("A", color="red:blue")
+    assert gen.generate("A", color="orange").startswith("\033[33m")
+    gen.register_color("orange", "\033[93m")
+    assert [spec for spec, _ in gen._palettes.items()] == ["red:blue"]
+    assert gen.generate("A", color="orange").startswith("\033[93m")
+    assert gen.generate("A", color="white on orange").startswith("\033[37m\033[103m")
+    for name in ("", "on", "rainbow", "#fff", "208", "dark red", "a:b", "x@glyph"):
+        with pytest.raises(ValueError, match="not valid"):
+            gen.register_color(name, "\033[31m")
+
+    # Every concurrent render sees one complete version of the font, and later renders the registered one.
+    versions = [{"A": [c * 3, c * 3], " ": ["   ", "   "]} for c in "xy"]
+    expected = {"xxx xxx\nxxx xxx", "xxxxxx\nxxxxxx", "yyy yyy\nyyy yyy", "yyyyyy\nyyyyyy"}
+
+    def render(i):
+        if i % 10 == 0:
+            gen.register_font("swap", versions[i // 10 % 2])
+        return gen.generate("AA", font="swap", layout=("full", "kerning")[i % 2])
+
+    gen.register_font("swap", versions[0])
+    with ThreadPoolExecutor(8) as pool:
+        assert set(pool.map(render, range(400))) <= expected
+    assert gen.generate("AA", font="swap")[0] == gen.fonts["swap"]["A"][0][0]
+
+
+def test_compiled_renderer():
+    """Test renderers compiled for a fixed style."""
+    gen = asciigenator.core.ASCIIGenerator(cache_size=16)
+    style = {"font": "block", "color": "red", "border": "double", "width": 40, "align": "center", "line_spacing": 2}
+    renderer = gen.compile(**style)
+    for text in ["Hi", "HELLO WORLD", "A\nBC", ""]:
+        assert renderer.render(text) == gen.generate(text, **style)
+    assert renderer.backend == "auto" and repr(renderer).startswith("Renderer(font='block', color='red'")
+    assert renderer.compiled is gen._compile_font("block", "full")
+    assert sorted(renderer._args[-1]) == [2, 13, 31]  # border rows kept per inner width
+    with pytest.raises(AttributeError, match="immutable"):
+        renderer.font = "simple"
+    with pytest.raises(ValueError, match="Font 'missing' not available."):
+        gen.compile(font="missing")
+
+    # A renderer keeps the glyphs and colors it was compiled with.
+    gen.register_font("tiny", {"A": ["a"]})
+    gen.register_color("orange", "\033[33m")
+    tiny = gen.compile(font="tiny", color="orange")
+    gen.register_font("tiny", {"A": ["b"]})
+    gen.register_color("orange", "\033[93m")
+    assert tiny.render("A") == "\033[33ma\033[0m"
+    assert gen.compile(font="tiny", color="orange").render("A") == "\033[93mb\033[0m"
+
+
 # ============================================================================
 # CLI Helper Function - Direct CLI testing without subprocess
 # ============================================================================
@@ -277,6 +1485,230 @@ def test_generate_with_all_options_cli():
     assert "*" in out  # Border and/or font character
 
 
+def test_width_and_align_cli():
+    """Test wrapping options via CLI."""
+    out, err, code = call_cli_function(["Hello world", "--width", "20", "--align", "center"])
+    assert code == 0
+    assert out == asciigenator.generate("Hello world", width=20, align="center") + "\n"
+
+
+def test_list_borders_cli():
+    """Test listing border styles via CLI."""
+    out, err, code = call_cli_function(["--list-borders"])
+    assert code == 0
+    assert "rounded" in out
+
+
+def test_font_dir_cli(tmp_path, monkeypatch):
+    """Test using fonts from a directory via CLI."""
+    monkeypatch.setenv("ASCIIGENATOR_CACHE_DIR", str(tmp_path / "cache"))
+    (tmp_path / "dots.json").write_text('{"A": [".", ":"], " ": [" ", " "]}', encoding="utf-8")
+    try:
+        out, err, code = call_cli_function(["--font-dir", str(tmp_path), "--list-fonts"])
+        assert code == 0
+        assert "dots" in out
+        out, err, code = call_cli_function(["A", "--font-dir", str(tmp_path), "--font", "dots"])
+        assert code == 0
+        assert out == ".\n:\n"
+    finally:
+        del asciigenator.core._generator.fonts["dots"]
+
+
+def test_font_dir_cli_without_toml_parser(tmp_path, monkeypatch):
+    """Test that a TOML font without an available TOML parser is reported as a clean error."""
+    monkeypatch.setenv("ASCIIGENATOR_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setitem(sys.modules, "tomllib", None)
+    monkeypatch.setitem(sys.modules, "tomli", None)
+    (tmp_path / "hash.toml").write_text('A = ["#"]\n', encoding="utf-8")
+    try:
+        out, err, code = call_cli_function(["A", "--font-dir", str(tmp_path), "--font", "hash"])
+        assert code == 1
+        assert "Error: Reading TOML fonts requires" in err
+    finally:
+        del asciigenator.core._generator.fonts["hash"]
+
+
+def test_stdin_batch_cli(monkeypatch):
+    """Test rendering one banner per standard input line with a custom separator."""
+    monkeypatch.setattr(sys, "stdin", io.StringIO("Hi\nThere\r\n\nYo\n"))
+    out, err, code = call_cli_function(["--stdin", "-f", "block", "-b", "*", "--separator", "~\\n"])
+    assert code == 0
+    arts = [asciigenator.generate(text, font="block", border="*") for text in ("Hi", "There", "", "Yo")]
+    assert out == "~\n".join(art + "\n" for art in arts)
+
+
+def test_input_file_batch_cli(tmp_path, monkeypatch):
+    """Test rendering a file in parallel and in small write chunks, keeping input order."""
+    labels = [f"Label {i}" for i in range(40)]
+    source = tmp_path / "labels.txt"
+    source.write_text("\n".join(labels) + "\n")
+    target = tmp_path / "out.txt"
+    monkeypatch.setattr(cli, "_WRITE_CHUNK", 100)
+    out, err, code = call_cli_function(["--input", str(source), "-o", str(target), "--jobs", "2", "-c", "red"])
+    assert (out, code) == ("", 0)
+    expected = "\n".join(art + "\n" for art in asciigenator.generate_many(labels, color="red"))
+    assert target.read_text() == expected
+    out, err, code = call_cli_function(["--input", str(tmp_path / "missing.txt")])
+    assert code == 1
+    assert "Error:" in err
+    out, err, code = call_cli_function(["--input", str(source), "--jobs", "0"])
+    assert code == 1
+    assert "jobs must be positive" in err
+
+
+def _start_server(path, idle_timeout=0):
+    """Start a RenderServer on ``path`` in a background thread, returning the server and its thread."""
+    import threading
+    import time
+    from asciigenator import server
+
+    render_server = server.RenderServer(str(path), idle_timeout)
+    thread = threading.Thread(target=render_server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    while not os.path.exists(path):
+        time.sleep(0.01)
+    return render_server, thread
+
+
+def test_server_forwarding_cli(tmp_path, monkeypatch):
+    """Test that the CLI forwards to a running server only when asked to and gets the same output as rendering itself."""
+    path = tmp_path / "s.sock"
+    render_server, thread = _start_server(path)
+    try:
+        forwarded = call_cli_function(["Hi", "-f", "block", "-b", "single", "--server", "--socket", str(path)])
+        local = call_cli_function(["Hi", "-f", "block", "-b", "single", "--socket", str(path)])
+        assert forwarded == local
+        monkeypatch.setenv("ASCIIGENATOR_SERVER", "1")
+        out, err, code = call_cli_function(["Hi", "-f", "nope", "--socket", str(path)])
+        assert code == 1
+        assert "Font 'nope' not available" in err
+        out, err, code = call_cli_function(["--server-stats", "--socket", str(path)])
+        assert code == 0
+        assert "requests: 2" in out and "errors: 1" in out and "p95:" in out
+        out, err, code = call_cli_function(["--stop-server", "--socket", str(path)])
+        assert code == 0
+        thread.join(5)
+        assert not thread.is_alive()
+        assert not path.exists()
+    finally:
+        render_server.stop()
+
+
+def test_server_fallback_and_idle_shutdown(tmp_path):
+    """Test in-process fallback without a server and that an idle server shuts itself down."""
+    from asciigenator import server
+
+    path = tmp_path / "s.sock"
+    out, err, code = call_cli_function(["Hi", "--server", "--socket", str(path)])
+    assert code == 0
+    assert out == asciigenator.generate("Hi") + "\n"
+    out, err, code = call_cli_function(["--server-stats", "--socket", str(path)])
+    assert code == 1
+    assert "No server running" in err
+    render_server, thread = _start_server(path, idle_timeout=0.2)
+    assert server.request({"command": "bogus"}, str(path))["code"] == 2
+    thread.join(5)
+    assert not thread.is_alive()
+    assert not path.exists()
+
+
+def test_server_socket_checks(tmp_path, monkeypatch):
+    """Test that clients only talk to sockets and that the fallback socket directory is private to the user."""
+    from asciigenator import server
+
+    path = tmp_path / "s.sock"
+    path.write_text("", encoding="utf-8")
+    assert server.request({"command": "stats"}, str(path)) is None
+
+    monkeypatch.delenv("ASCIIGENATOR_SOCKET", raising=False)
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setenv("TMPDIR", str(tmp_path))
+    directory = os.path.dirname(server.default_socket_path())
+    assert os.path.dirname(directory) == str(tmp_path)
+    render_server = server.RenderServer(idle_timeout=0.01)
+    render_server.serve_forever(0.01)
+    assert os.stat(directory).st_mode & 0o777 == 0o700
+    os.chmod(directory, 0o755)
+    try:
+        render_server.serve_forever(0.01)
+        assert False, "Should have raised OSError"
+    except OSError as e:
+        assert "only the current user" in str(e)
+
+
+def test_server_font_dirs(tmp_path, monkeypatch):
+    """Test that forwarded font directories are loaded once and stay private to the requests forwarding them."""
+    from asciigenator import server
+
+    monkeypatch.setenv("ASCIIGENATOR_CACHE_DIR", str(tmp_path / "cache"))
+    (tmp_path / "dots.json").write_text('{"A": [".", ":"], " ": [" ", " "]}', encoding="utf-8")
+    render_server = server.RenderServer(str(tmp_path / "s.sock"))
+    options = {"text": "A", "font": "dots", "font_dir": [str(tmp_path)]}
+    for _ in range(2):
+        reply = render_server.handle({"command": "render", "options": options})
+        assert reply == {"code": 0, "stdout": ".\n:\n", "stderr": ""}
+    generator = render_server._generator((str(tmp_path),))
+    assert len(render_server._generators) == 1 and generator.fonts.is_loaded("dots")
+    assert "dots" not in asciigenator.list_fonts()
+    reply = render_server.handle({"command": "render", "options": {"list_fonts": True}})
+    assert reply["code"] == 0 and "dots" not in reply["stdout"]
+    reply = render_server.handle({"command": "render", "options": {"text": "A", "font_dir": [str(tmp_path / "nope")]}})
+    assert reply["code"] == 1 and reply["stderr"].startswith("Error:")
+
+
+def test_color_mode_cli(monkeypatch):
+    """Test --color-mode and gradient colors via CLI."""
+    out, err, code = call_cli_function(["Hi", "-c", "red:blue@glyph"])
+    assert code == 0 and out.count("\033[39m") == 5
+    out, err, code = call_cli_function(["Hi", "-c", "red", "--color-mode", "never"])
+    assert code == 0 and "\033[" not in out
+    out, err, code = call_cli_function(["Hi", "-c", "red", "--color-mode", "auto"])
+    assert code == 0 and out == asciigenator.generate("Hi") + "\n"
+    out, err, code = call_cli_function(["Hi", "-c", "nope", "--color-mode", "never"])
+    assert code == 1 and "Color 'nope' not available" in err
+
+
+def test_format_cli():
+    """Test --format via CLI, which keeps colors in HTML even when escape codes are turned off."""
+    out, err, code = call_cli_function(["Hi", "--format", "html", "-c", "red", "--color-mode", "never"])
+    assert code == 0 and out == asciigenator.export("Hi", "html", color="red") + "\n"
+    out, err, code = call_cli_function(["Hi", "--format", "text", "-c", "red", "-b", "double"])
+    assert code == 0 and out == asciigenator.export("Hi", "text", border="double") + "\n"
+    out, err, code = call_cli_function(["Hi", "--format", "svg"])
+    assert code == 0 and out.startswith("<svg")
+
+
+def test_profile_cli():
+    """Test --profile prints a stage breakdown to stderr."""
+    out, err, code = call_cli_function(["Hi", "--profile", "-b", "#"])
+    assert code == 0 and out == asciigenator.generate("Hi", border="#") + "\n"
+    assert err.startswith("stage") and "validate" in err and "renders: 1" in err
+    # The module-level functions the CLI renders with are timed too.
+    profiler = asciigenator.core._get_generator().profiler
+    calls = profiler.stats()["stages"]["validate"]["calls"]
+    assert calls > 0
+    asciigenator.generate("Hi", font="block")
+    assert profiler.stats()["stages"]["validate"]["calls"] > calls
+    asciigenator.core._get_generator().disable_profiling()
+
+
+def test_layout_cli():
+    """Test --layout via CLI."""
+    out, err, code = call_cli_function(["Hi", "--layout", "smush", "-b", "single"])
+    assert code == 0 and out == asciigenator.generate("Hi", border="single", layout="smush") + "\n"
+    out, err, code = call_cli_function(["Hi", "--layout", "kerning", "--format", "text"])
+    assert code == 0 and out == asciigenator.generate("Hi", layout="kerning") + "\n"
+
+
+def test_line_spacing_cli():
+    """Test multi-line text and --line-spacing via CLI."""
+    out, err, code = call_cli_function(["HI\nA", "--line-spacing", "2", "-a", "right", "-b", "single"])
+    expected = asciigenator.generate("HI\nA", border="single", align="right", line_spacing=2)
+    assert code == 0 and out == expected + "\n"
+    out, err, code = call_cli_function(["HI\nA", "--line-spacing", "-1"])
+    assert code == 1 and "Line spacing must not be negative" in err
+
+
 def test_no_arguments_shows_help():
     """Test that running CLI with no arguments shows help."""
     out, err, code = call_cli_function([])